@@ -1,26 +1,32 @@
 
 
 import bpy
-from pathlib import Path
+import json
 from dataclasses import dataclass
 from typing import Callable
 
+from . import execution_plan
+from . import link_table
+from . import meta_rig_cache
+from . import module_results
+from . import performance_mode
+from . import planner
+from . import profiler
 from . import rigify
-from .operations import ABOperationStack, PoseOperations, PoseOperationsStack, WidgetOperation
+from . import skeleton_index
+from . import skin_weights
+from . import widgets
+from .operations import ABOperationStack, DirectLinkOperation, LinkMode, PoseOperations, PoseOperationsStack, WidgetOperation
 from .shared import RigModule
 from .. import utils
 
-_ASSET_DIR = Path(__file__).resolve().parents[1] / "assets" / "blend"
-_WGTS_FILE = _ASSET_DIR / "wgts.blend"
-_WGTS_PREFIX = "AB_WGT_"
-_WGTS_COLLECTION_NAME = "WGTS"
-
 @dataclass
 class RigGenerationState:
     armature: bpy.types.Object
     meta_rig: bpy.types.Object
     visible_collections: list[bpy.types.BoneCollection]
     operation_stack: ABOperationStack
+    profile: profiler.GenerationProfiler | None = None
 
 _DEFAULT_OPERATIONS = [
     WidgetOperation(bone_name="root", scale_factor=0.2)
@@ -33,9 +39,20 @@ class AetherRigGenerator:
     modules: 'list[list[RigModule]]'
     color_sets: 'dict[str, rigify.ColorSet]'
 
-    def __init__(self, name: str, color_sets: 'list[dict[str, rigify.ColorSet]] | None' = None, modules: 'list[list[RigModule]] | None' = None):
+    def __init__(
+        self,
+        name: str,
+        color_sets: 'list[dict[str, rigify.ColorSet]] | None' = None,
+        modules: 'list[list[RigModule]] | None' = None,
+        module_key: 'Callable[[RigModule], str] | None' = None,
+        cache: 'meta_rig_cache.MetaRigCache | None' = None,
+        link_mode: LinkMode = "LINK",
+    ):
         self.name = name
         self.color_sets = color_sets
+        self.module_key = module_key
+        self.cache = cache
+        self.link_mode = link_mode
         self._active_ui_flags: set[str] = set()
 
         self.set_modules(modules or [])
@@ -44,6 +61,40 @@ class AetherRigGenerator:
         """Store the already-resolved module priority groups."""
         self.modules = [list(group) for group in modules if group]
 
+    def get_module_label(self, module: RigModule) -> str:
+        """Return the registry key of a module, falling back to its display name."""
+        key = self.module_key(module) if self.module_key else ""
+        return key or module.name
+
+    def compile(self) -> execution_plan.CompiledTemplate:
+        """Return the cached flat execution plan of the module priority groups."""
+        return execution_plan.compile_template(self.modules, module_key=self.get_module_label)
+
+    def get_cache_key(self, source_key: str) -> str:
+        """Return the meta rig cache key of this generator applied to an armature with the given source key."""
+        module_keys = [list(group) for group in self.compile().keys]
+        return meta_rig_cache.compute_key(source_key, self.name, module_keys, self.color_sets, self.link_mode)
+
+    def plan(self, armature: bpy.types.Object) -> planner.GenerationPlan:
+        """Dry-run the module selection against the armature's original bones without modifying the scene."""
+        original_collection = armature.data.collections.get("Original")
+        if original_collection:
+            bone_names = {bone.name for bone in original_collection.bones}
+        else:
+            bone_names = set(armature.data.bones.keys())
+
+        with utils.scene_index.scope():
+            generation_data = self._build_generation_data(armature, warn=False) or {}
+        data_keys = {key for key, value in generation_data.items() if value is not None}
+
+        return planner.plan_generation(
+            self.modules,
+            bone_names,
+            data_keys,
+            template=self.name,
+            module_key=self.get_module_label,
+        )
+
     # ------------------------------
     # Meta rig generation pipeline
     # ------------------------------
@@ -53,41 +104,99 @@ class AetherRigGenerator:
         cleanup_existing: Callable[[], object] | None = None,
     ) -> RigGenerationState | None:
         """Build and configure a meta rig for this generator."""
-        if not self._prepare_source_armature(armature, cleanup_existing):
-            return None
-
-        meta_rig = self._create_meta_rig(armature)
-
-        generation_data = self._build_generation_data(armature)
-
-        pose_ops_stack, operation_stack = self._build_operation_stacks(meta_rig, generation_data)
-
-        self._configure_meta_rig(armature, meta_rig)
-
-        
-        ui_collections = self._run_generator_modules(
-            meta_rig,
-            generation_data,
-            pose_ops_stack,
-            operation_stack,
-        )
+        profile = profiler.GenerationProfiler(template=self.name, armature=armature.name)
+        profile.start()
+        try:
+            return self._generate_meta_rig(armature, cleanup_existing, profile)
+        finally:
+            profile.stop()
+
+    def _generate_meta_rig(
+        self,
+        armature: bpy.types.Object,
+        cleanup_existing: Callable[[], object] | None,
+        profile: profiler.GenerationProfiler,
+    ) -> RigGenerationState | None:
+        with profiler.measure("stages", "plan"):
+            plan = self.plan(armature)
+        print(f"[AetherBlend] {plan.summary()}")
+        if not plan.generates_bones:
+            if plan.certain:
+                print(f"[AetherBlend] No generator module of '{self.name}' fits armature '{armature.name}'. Skipping generation.")
+                return None
+            print(f"[AetherBlend] Plan of '{self.name}' is unsure about {', '.join(plan.unsure)}; running the modules.")
+
+        with profiler.measure("stages", "prepare_source_armature"):
+            if not self._prepare_source_armature(armature, cleanup_existing):
+                return None
+
+        with profiler.measure("stages", "hash_source_armature"):
+            source_key = meta_rig_cache.source_key(armature)
+
+        cache_key = None
+        if self.cache:
+            with profiler.measure("stages", "meta_rig_cache_lookup"):
+                cache_key = self.get_cache_key(source_key)
+                cached = self.cache.load(cache_key)
+            if cached:
+                profile.count("cache_hits")
+                with profiler.measure("stages", "restore_cached_meta_rig"):
+                    return self._restore_cached_meta_rig(armature, cached, profile)
+            profile.count("cache_misses")
+
+        with profiler.measure("stages", "create_meta_rig"):
+            meta_rig = self._create_meta_rig(armature)
+
+        # One scan of the file answers every armature/mesh/material lookup until the modules have run.
+        with utils.scene_index.scope():
+            with profiler.measure("stages", "build_generation_data"):
+                generation_data = self._build_generation_data(armature)
+
+            pose_ops_stack, operation_stack = self._build_operation_stacks(meta_rig, generation_data)
+
+            with profiler.measure("stages", "configure_meta_rig"):
+                self._configure_meta_rig(armature, meta_rig)
+
+            with profiler.measure("stages", "run_generator_modules"):
+                previous_results = module_results.ModuleResults.from_json(armature.aether_rig.module_results)
+                ui_collections, results = self._run_generator_modules(
+                    meta_rig,
+                    generation_data,
+                    pose_ops_stack,
+                    operation_stack,
+                    self._module_results_fingerprint(armature, source_key, generation_data),
+                    previous_results,
+                )
+        armature.aether_rig.module_results = results.to_json()
         self._sync_ui_flags_property(armature)
 
-        bones_to_delete = self._collect_original_bone_updates(meta_rig, pose_ops_stack)
-        self._remove_edit_bones(meta_rig, bones_to_delete)
-        deleted_bones = set(bones_to_delete)
-        pose_ops_stack.remove_bones(deleted_bones)
-        operation_stack.remove_bones(deleted_bones)
-
-        visible_collections = self._create_ui_collections(meta_rig, ui_collections)
-        self._apply_meta_rig_operations(meta_rig, pose_ops_stack, operation_stack)
-        self._finalize_meta_rig(armature, meta_rig)
+        with profiler.measure("stages", "remove_unlinked_bones"):
+            bones_to_delete = self._collect_original_bone_updates(meta_rig, pose_ops_stack, operation_stack)
+            self._remove_edit_bones(meta_rig, bones_to_delete)
+            deleted_bones = set(bones_to_delete)
+            pose_ops_stack.remove_bones(deleted_bones)
+            operation_stack.remove_bones(deleted_bones)
+
+        with profiler.measure("stages", "create_ui_collections"):
+            visible_collections = self._create_ui_collections(meta_rig, ui_collections)
+        with profiler.measure("stages", "apply_meta_rig_operations"):
+            self._apply_meta_rig_operations(meta_rig, pose_ops_stack, operation_stack)
+        with profiler.measure("stages", "finalize_meta_rig"):
+            self._finalize_meta_rig(armature, meta_rig)
+
+        if cache_key:
+            with profiler.measure("stages", "meta_rig_cache_store"):
+                self.cache.store(
+                    cache_key, self.name, meta_rig, operation_stack, self._active_ui_flags, visible_collections,
+                    armature.aether_rig.module_results,
+                )
 
         return RigGenerationState(
             armature=armature,
             meta_rig=meta_rig,
             visible_collections=visible_collections,
             operation_stack=operation_stack,
+            profile=profile,
         )
 
     # ------------------------------
@@ -95,24 +204,56 @@ class AetherRigGenerator:
     # ------------------------------
     def generate_rigify_rig(self, state: RigGenerationState) -> bool:
         """Run rigify generation and apply post-generation setup."""
+        profile = state.profile or profiler.GenerationProfiler(template=self.name, armature=state.armature.name)
+        state.profile = profile
+        profile.start()
+        try:
+            return self._generate_rigify_rig(state)
+        finally:
+            profile.stop()
+
+    def _generate_rigify_rig(self, state: RigGenerationState) -> bool:
         armature = state.armature
         meta_rig = state.meta_rig
 
         if not meta_rig:
             return False
 
-        if not self._run_rigify_generation(meta_rig):
-            return False
+        # Direct links reparent original bones, so their game parents are taken before Rigify runs.
+        direct_targets = self._direct_links(state.operation_stack)
+        game_parents = {bone.name: bone.parent.name for bone in armature.data.bones if bone.parent}
+        profiler.count("direct_links", len(direct_targets))
+
+        with profiler.measure("stages", "rigify_generate"):
+            if not self._run_rigify_generation(meta_rig):
+                return False
 
         utils.object.select_only(armature)
         self._set_all_collections_visibility(armature, visible=True)
-        self._append_widgets(armature)
-        self._apply_post_generation_operations(armature, state.operation_stack)
-        self._update_deform_bones(armature)
+        with profiler.measure("stages", "append_widgets"):
+            self._append_widgets(armature, state.operation_stack)
+        with profiler.measure("stages", "apply_post_generation_operations"):
+            self._apply_post_generation_operations(armature, state.operation_stack)
+        with profiler.measure("stages", "link_table"):
+            links = link_table.collect(armature, direct_targets, game_parents)
+            link_table.store(armature, links)
+            profiler.count("transform_links", len(links))
+        with profiler.measure("stages", "update_deform_bones"):
+            self._update_deform_bones(armature)
+        with profiler.measure("stages", "feature_bones"):
+            self._store_feature_bones(armature)
         self._hide_generated_collections(armature, state.visible_collections)
-        self._finalize_generated_rig(armature, meta_rig)
+        with profiler.measure("stages", "finalize_generated_rig"):
+            self._finalize_generated_rig(armature, meta_rig)
         return True
 
+    def store_profile(self, state: RigGenerationState) -> None:
+        """Store the profile of a finished run on the source armature and print a summary."""
+        if not state.profile:
+            return
+        state.armature.aether_rig.generation_profile = state.profile.to_json()
+        state.profile.print_summary()
+
     def reveal_meta_rig(self, state: RigGenerationState):
         """Show meta rig for manual adjustments and hide the source armature."""
         self._set_meta_rig_visibility(state.meta_rig, visible=True)
@@ -132,7 +273,7 @@ class AetherRigGenerator:
         armature: bpy.types.Object,
         cleanup_existing: Callable[[], object] | None,
     ) -> bool:
-        bpy.ops.object.mode_set(mode='OBJECT')
+        profiler.mode_set('OBJECT')
         
         utils.armature.reset_transforms(armature)
 
@@ -152,83 +293,29 @@ class AetherRigGenerator:
 
         return True
     
-    def _append_widgets(self, armature: bpy.types.Object):
-        """Append widget objects from wgts.blend and place them in the armature's WGTS collection."""
-        def _base_object_name(object_name: str) -> str:
-            # Blender duplicate suffixes use the pattern ".001", ".002", etc.
-            if len(object_name) > 4 and object_name[-4] == "." and object_name[-3:].isdigit():
-                return object_name[:-4]
-            return object_name
-
-        def _widgets_by_base() -> dict[str, bpy.types.Object]:
-            """Return one widget object per base name, preferring non-suffixed names."""
-            widgets: dict[str, bpy.types.Object] = {}
-            for obj in bpy.data.objects:
-                if not obj.name.startswith(_WGTS_PREFIX):
-                    continue
-
-                base_name = _base_object_name(obj.name)
-                current = widgets.get(base_name)
-                if current is None or current.name != base_name:
-                    widgets[base_name] = obj
-            return widgets
-
-        if not _WGTS_FILE.exists():
-            print(f"[AetherBlend] Widget source file not found: {_WGTS_FILE}")
-            return
-
-        armature_collection = utils.collection.get_collection(armature)
-        if not armature_collection:
-            print(f"[AetherBlend] Could not resolve collection for armature '{armature.name}'.")
+    def _append_widgets(self, armature: bpy.types.Object, operation_stack: ABOperationStack | None):
+        """Append the widgets referenced by the rig's WidgetOperations to the armature's WGTS collection."""
+        if not operation_stack:
             return
 
-        wgts_collection = None
-        for collection in utils.collection.collection_tree(armature_collection):
-            if collection.name.upper().startswith(_WGTS_COLLECTION_NAME):
-                wgts_collection = collection
-                break
-
-        if not wgts_collection:
-            print(
-                f"[AetherBlend] No WGTS collection found under armature collection '{armature_collection.name}' "
-                f"for armature '{armature.name}'. Skipping widget append."
-            )
+        names = {
+            operation.custom_object
+            for operations in operation_stack.stack.values()
+            for operation in operations
+            if isinstance(operation, WidgetOperation) and operation.custom_object
+        }
+        if not names:
             return
 
-        with bpy.data.libraries.load(str(_WGTS_FILE), link=False) as (data_from, _):
-            widget_names = [name for name in data_from.objects if name and name.startswith(_WGTS_PREFIX)]
-
-        if not widget_names:
-            print(f"[AetherBlend] No widget objects found in '{_WGTS_FILE.name}'.")
+        if not widgets.LIBRARY.path.exists():
+            print(f"[AetherBlend] Widget source file not found: {widgets.LIBRARY.path}")
             return
 
-        widget_base_names = {_base_object_name(name) for name in widget_names}
-        existing_widgets = _widgets_by_base()
-
-        missing_widget_names = [
-            name
-            for name in widget_names
-            if _base_object_name(name) not in existing_widgets
-        ]
-
-        if missing_widget_names:
-            with bpy.data.libraries.load(str(_WGTS_FILE), link=False) as (_, data_to):
-                data_to.objects = missing_widget_names
-
-            existing_widgets = _widgets_by_base()
-
-        widgets_to_link = [
-            obj
-            for base_name, obj in existing_widgets.items()
-            if base_name in widget_base_names and all(existing is not obj for existing in wgts_collection.objects)
-        ]
-
-        if widgets_to_link:
-            utils.collection.link_to_collection(widgets_to_link, wgts_collection)
+        appended = widgets.ensure(armature, names)
+        profiler.count("widgets_appended", appended)
 
     def _create_meta_rig(self, armature: bpy.types.Object) -> bpy.types.Object:
-        meta_rig = utils.armature.duplicate(armature)
-        meta_rig.name = f"META_{armature.name}"
+        meta_rig = utils.armature.construct.copy(armature, name=f"META_{armature.name}")
 
         self._ensure_meta_rig_collections(meta_rig)
         self._join_link_rig(armature, meta_rig)
@@ -253,7 +340,7 @@ class AetherRigGenerator:
 
     def _build_operation_stacks(self, meta_rig: bpy.types.Object, generation_data: dict | None = None) -> tuple[PoseOperationsStack, ABOperationStack]:
         pose_ops_stack = PoseOperationsStack()
-        operation_stack = ABOperationStack()
+        operation_stack = ABOperationStack(verbose=True)
 
         for bone in meta_rig.data.bones:
             pose_ops_stack.add(bone.name, PoseOperations(rigify_settings=rigify.types.basic_raw_copy(True)))
@@ -266,14 +353,47 @@ class AetherRigGenerator:
         return pose_ops_stack, operation_stack
 
     def _join_link_rig(self, armature: bpy.types.Object, meta_rig: bpy.types.Object):
-        link_rig = utils.armature.duplicate(armature)
-        utils.armature.add_bone_prefix(link_rig, "LINK-")
+        utils.armature.construct.add_prefixed_bones(armature, meta_rig, "LINK-", collection_name="LINK")
+
+    def _restore_cached_meta_rig(
+        self,
+        armature: bpy.types.Object,
+        cached: meta_rig_cache.CachedMetaRig,
+        profile: profiler.GenerationProfiler,
+    ) -> RigGenerationState:
+        """Re-target a meta rig appended from the cache to the source armature."""
+        meta_rig = cached.meta_rig
+        meta_rig.name = f"META_{armature.name}"
 
-        if link_rig.data.collections.get("Original"):
-            link_rig.data.collections.remove(link_rig.data.collections["Original"])
+        armature_collection = utils.collection.get_collection(armature) or bpy.context.scene.collection
+        utils.collection.link_to_collection([meta_rig], armature_collection)
+        meta_rig.data.rigify_target_rig = armature
 
-        utils.armature.b_collection.assign_bones(link_rig, list(link_rig.data.bones.keys()), "LINK", clear=True)
-        utils.armature.join(src=link_rig, target=meta_rig)
+        operation_stack = cached.operation_stack
+        operation_stack.generation_data = self._build_generation_data(armature)
+        utils.object.select_only(meta_rig)
+        operation_stack.applyPreDataOperations(meta_rig)
+
+        self._active_ui_flags = set(cached.ui_flags)
+        self._sync_ui_flags_property(armature)
+        # Feature bone ownership is read from the module results of the run that built the cached rig.
+        armature.aether_rig.module_results = cached.module_results
+
+        visible_collections = [
+            meta_rig.data.collections[name]
+            for name in cached.visible_collections
+            if name in meta_rig.data.collections
+        ]
+
+        self._finalize_meta_rig(armature, meta_rig)
+
+        return RigGenerationState(
+            armature=armature,
+            meta_rig=meta_rig,
+            visible_collections=visible_collections,
+            operation_stack=operation_stack,
+            profile=profile,
+        )
 
     def _configure_meta_rig(self, armature: bpy.types.Object, meta_rig: bpy.types.Object):
         bpy.context.view_layer.objects.active = meta_rig
@@ -287,7 +407,7 @@ class AetherRigGenerator:
         for color_set in self.color_sets.values():
             color_set.add(meta_rig)
 
-    def _build_generation_data(self, armature: bpy.types.Object) -> dict | None:
+    def _build_generation_data(self, armature: bpy.types.Object, warn: bool = True) -> dict | None:
         eye_occlusion_objects = utils.object.find_by_armature_and_material_property(
             armature=armature,
             property_name="ShaderPackage",
@@ -300,9 +420,9 @@ class AetherRigGenerator:
             property_value="iris.shpk",
         )
 
-        if not eye_occlusion_objects:
+        if warn and not eye_occlusion_objects:
             print(f"[AetherBlend] Warning: No eye occlusion objects found for armature '{armature.name}'.")
-        if not iris_object:
+        if warn and not iris_object:
             print(f"[AetherBlend] Warning: No iris object found for armature '{armature.name}'.")
 
         return {
@@ -311,45 +431,166 @@ class AetherRigGenerator:
             "original_armature": armature,
         }
 
+    def _module_results_fingerprint(self, armature: bpy.types.Object, source_key: str, generation_data: dict | None) -> str:
+        available_data = sorted(key for key, value in (generation_data or {}).items() if value is not None)
+        # SkinBones are placed by vertex group weights, which the source key does not cover.
+        weights = skin_weights.weights_digest(utils.armature.find_meshes(armature))
+        return f"{source_key}:{weights}:{','.join(available_data)}:{self.link_mode}"
+
     def _run_generator_modules(
         self,
         meta_rig: bpy.types.Object,
         generation_data: dict | None,
         pose_ops_stack: PoseOperationsStack,
         operation_stack: ABOperationStack,
-    ) -> rigify.settings.UI_Collections:
+        fingerprint: str,
+        previous_results: module_results.ModuleResults,
+    ) -> tuple[rigify.settings.UI_Collections, module_results.ModuleResults]:
         ui_collections = rigify.settings.UI_Collections()
+        results = module_results.ModuleResults(fingerprint=fingerprint)
 
         self._active_ui_flags.clear()
 
-        for module_group in self.modules:
-            for module in module_group:
-                integrity, module_pose_ops, module_ui_collections, module_new_ops = module.execute(meta_rig, generation_data)
-                if not integrity:
-                    print(f"[AetherBlend] Module '{module.name}' failed integrity check during meta rig generation.")
+        # Records are only reusable for the same source skeleton; bones produced by re-run groups
+        # invalidate every later group that reads them.
+        previous_groups = previous_results.groups if previous_results.fingerprint == fingerprint else []
+        dirty_bones: set[str] = set()
+
+        # Pattern generators match against the bones present when the session starts, indexed once for all of them.
+        module_data = dict(generation_data or {})
+        module_data[skeleton_index.DATA_KEY] = skeleton_index.SkeletonIndex.from_bones(meta_rig.data.bones)
+        # SkinBones evaluate each skinned mesh once per generation.
+        module_data[skin_weights.DATA_KEY] = skin_weights.SkinWeightCache()
+        module_data[execution_plan.LINK_MODE_KEY] = self.link_mode
+
+        # Every module creates its edit bones in one edit session; linked flags are set when it ends.
+        with execution_plan.EditSession(meta_rig) as session:
+            for group_index, module_group in enumerate(self.compile().groups):
+                candidates = [module.key for module in module_group]
+                previous_record = previous_groups[group_index] if group_index < len(previous_groups) else None
+
+                outcome = None
+                if (
+                    previous_record
+                    and previous_record.candidates == candidates
+                    and not any(module_results.depends_on(module, dirty_bones) for module in module_group)
+                ):
+                    outcome = self._replay_module_group(meta_rig, module_group, previous_record, session)
+
+                if outcome is None:
+                    outcome = self._execute_module_group(meta_rig, module_data, module_group, candidates, session)
+                    dirty_bones |= outcome[0].bone_names()
+                    if previous_record:
+                        dirty_bones |= previous_record.bone_names()
+
+                record, module, module_pose_ops, module_new_ops = outcome
+                results.groups.append(record)
+                if module is None:
                     continue
 
                 pose_ops_stack.merge(module_pose_ops)
 
-                if module_ui_collections:
-                    ui_collections.add(module_ui_collections)
+                if module.ui_collections:
+                    ui_collections.add(module.ui_collections)
 
-                if module_new_ops:
-                    for operation in module_new_ops:
-                        operation_stack.add_operation(operation)
+                for operation in module_new_ops or []:
+                    operation_stack.add_operation(operation)
 
                 self._active_ui_flags.update(module.ui_flags)
 
-                break
+        return ui_collections, results
 
-        return ui_collections
+    def _execute_module_group(
+        self,
+        meta_rig: bpy.types.Object,
+        generation_data: dict | None,
+        module_group: tuple[execution_plan.CompiledModule, ...],
+        candidates: list[str],
+        session: execution_plan.EditSession,
+    ) -> tuple[module_results.ModuleRecord, execution_plan.CompiledModule | None, PoseOperationsStack | None, list | None]:
+        """Run the first module of a priority group that passes its integrity check and record its result."""
+        record = module_results.ModuleRecord(candidates=candidates)
+
+        for module, module_label in zip(module_group, candidates):
+            created_start = len(session.created)
+            edited_start = len(session.edited)
+            linked_start = len(session.linked)
+
+            with profiler.measure("modules", module_label):
+                integrity, module_pose_ops, _, module_new_ops = module.execute(meta_rig, generation_data, profile_key=module_label, session=session)
+            if not integrity:
+                print(f"[AetherBlend] Module '{module.name}' failed integrity check during meta rig generation.")
+                continue
+
+            record.winner = module_label
+            module_results.capture(
+                meta_rig,
+                session.created[created_start:] + session.edited[edited_start:],
+                session.linked[linked_start:],
+                record,
+                module_pose_ops,
+                module_new_ops,
+            )
+            return record, module, module_pose_ops, module_new_ops
+
+        return record, None, None, None
+
+    def _replay_module_group(
+        self,
+        meta_rig: bpy.types.Object,
+        module_group: tuple[execution_plan.CompiledModule, ...],
+        record: module_results.ModuleRecord,
+        session: execution_plan.EditSession,
+    ) -> tuple[module_results.ModuleRecord, execution_plan.CompiledModule | None, PoseOperationsStack | None, list | None] | None:
+        """Restore a priority group from the previous run, or return None if it has to be executed again."""
+        if record.winner is None:
+            return record, None, None, None
+
+        module = next((module for module in module_group if module.key == record.winner), None)
+        if module is None:
+            return None
+
+        with profiler.measure("modules", f"{record.winner} (reused)"):
+            restored = module_results.replay(meta_rig, record, session)
+        if restored is None:
+            return None
+
+        profiler.count("modules_reused")
+        module_pose_ops, module_new_ops = restored
+        return record, module, module_pose_ops, module_new_ops
+
+    def _direct_links(self, operation_stack: ABOperationStack | None) -> dict[str, str]:
+        """Original bone -> target of every link the modules turned into a direct parent."""
+        if not operation_stack:
+            return {}
+        return {
+            operation.bone_name: operation.target
+            for operations in operation_stack.stack.values()
+            for operation in operations
+            if isinstance(operation, DirectLinkOperation)
+        }
+
+    def _store_feature_bones(self, armature: bpy.types.Object):
+        """Stores which module family owns each generated bone, used by performance mode."""
+        module_collections = {
+            module.key: [collection.name for collection in module.ui_collections.collections]
+            for module_group in self.compile().groups
+            for module in module_group
+            if module.ui_collections
+        }
+        results = module_results.ModuleResults.from_json(armature.aether_rig.module_results)
+        owners = performance_mode.collect_owners(armature, results, module_collections)
+        profiler.count("feature_bones", sum(len(names) for names in owners.values()))
+        armature.aether_rig.feature_bones = json.dumps(owners)
+        armature.aether_rig.performance_state = ""
 
-    def _collect_original_bone_updates(self, meta_rig: bpy.types.Object, pose_ops_stack: PoseOperationsStack) -> list[str]:
+    def _collect_original_bone_updates(self, meta_rig: bpy.types.Object, pose_ops_stack: PoseOperationsStack, operation_stack: ABOperationStack) -> list[str]:
         bones_to_delete: list[str] = []
         original_collection = meta_rig.data.collections.get("Original")
         if not original_collection:
             return bones_to_delete
 
+        direct_bones = self._direct_links(operation_stack)
         original_bone_names = {bone.name for bone in original_collection.bones}
         for bone in meta_rig.data.bones.values():
             if bone.name not in original_bone_names:
@@ -357,6 +598,9 @@ class AetherRigGenerator:
 
             if bone.get("ab_linked", False):
                 pose_ops_stack.add(bone.name, PoseOperations(b_collection="Linked"))
+                # Directly linked bones are parented to their target and need no LINK- bone.
+                if bone.name in direct_bones and meta_rig.data.bones.get(f"LINK-{bone.name}"):
+                    bones_to_delete.append(f"LINK-{bone.name}")
                 continue
 
             pose_ops_stack.add(bone.name, PoseOperations(b_collection="Unlinked"))
@@ -377,7 +621,7 @@ class AetherRigGenerator:
             return
 
         utils.object.select_only(rig_object)
-        bpy.ops.object.mode_set(mode='EDIT')
+        profiler.mode_set('EDIT')
         for bone_name in bone_names:
             bone = rig_object.data.edit_bones.get(bone_name)
             if bone:
@@ -407,7 +651,7 @@ class AetherRigGenerator:
     def _finalize_meta_rig(self, armature: bpy.types.Object, meta_rig: bpy.types.Object):
         armature.aether_rig.meta_rig = meta_rig
 
-        bpy.ops.object.mode_set(mode='OBJECT')
+        profiler.mode_set('OBJECT')
         meta_rig.parent = armature
         self._set_meta_rig_visibility(meta_rig, visible=False)
         utils.object.select_only(armature)
@@ -434,7 +678,7 @@ class AetherRigGenerator:
         operation_stack.applyPostPoseOperations(armature)
 
     def _update_deform_bones(self, armature: bpy.types.Object):
-        bpy.ops.object.mode_set(mode='OBJECT')
+        profiler.mode_set('OBJECT')
 
         original_bone_names = set(utils.armature.b_collection.get_bones(armature, "Original").keys())
         for bone in armature.data.bones.values():
@@ -448,7 +692,7 @@ class AetherRigGenerator:
                 collection.is_visible = True
 
     def _finalize_generated_rig(self, armature: bpy.types.Object, meta_rig: bpy.types.Object):
-        bpy.ops.object.mode_set(mode='OBJECT')
+        profiler.mode_set('OBJECT')
         armature.aether_rig.rigified = True
         self._set_meta_rig_visibility(meta_rig, visible=False)
         utils.object.select_only(armature)
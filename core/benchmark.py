@@ -0,0 +1,263 @@
+"""Playback benchmark for generated rigs.
+
+run() keys synthetic motion on the FK/IK controls of a generated armature, scrubs
+a frame range and times every frame change. The result is a plain dict (written as
+JSON by aether.benchmark_playback and scripts/benchmark_playback.py) with FPS, the
+slowest frame and constraint and driver counts per bone collection, so template
+changes can be compared before and after.
+
+"timing" is the whole-scene frame time. Blender does not report evaluation time per
+object, so "objects" breaks it down by scrubbing again with parts switched off: a
+deforming mesh costs the difference its armature modifiers make, and the armature
+costs the difference between its motion with all its meshes' deformation disabled
+and the scene without that motion.
+"""
+
+import bpy
+import math
+import mathutils
+import re
+import statistics
+import time
+
+from collections import Counter
+from contextlib import contextmanager
+
+from . import profiler
+from .. import utils
+
+FORMAT_VERSION = 2
+CONTROL_PATTERN = r"(?i)[_.-](fk|ik)([_.-]|$)"
+MECHANISM_PREFIXES = ("ORG-", "DEF-", "MCH-", "LINK-", "VIS_", "WGT-")
+
+_POSE_BONE_PATH = re.compile(r'^pose\.bones\["((?:[^"\\]|\\.)*)"\]')
+_DATA_BONE_PATH = re.compile(r'^bones\["((?:[^"\\]|\\.)*)"\]')
+_IK_CONTROL = re.compile(r"(?i)[_.-]ik([_.-]|$)")
+_NO_COLLECTION = "(none)"
+
+
+def control_bones(armature: bpy.types.Object, pattern: str = CONTROL_PATTERN) -> list[bpy.types.PoseBone]:
+    """Returns the FK/IK control bones of a generated rig, or every control bone if none match the pattern."""
+    original = armature.data.collections_all.get("Original")
+    original_bones = {bone.name for bone in original.bones} if original else set()
+    controls = [
+        pose_bone for pose_bone in armature.pose.bones
+        if pose_bone.name not in original_bones and not pose_bone.name.startswith(MECHANISM_PREFIXES)
+    ]
+    match = re.compile(pattern).search
+    return [pose_bone for pose_bone in controls if match(pose_bone.name)] or controls
+
+
+def _key_frames(frame_start: int, frame_end: int, keys: int = 5) -> list[int]:
+    return sorted({round(frame_start + (frame_end - frame_start) * i / (keys - 1)) for i in range(keys)})
+
+
+def _key_synthetic_motion(bones: list[bpy.types.PoseBone], frames: list[int], angle: float) -> None:
+    """Keys a rotation swing on every control, plus a translation on IK controls."""
+    for i, frame in enumerate(frames):
+        phase = math.sin(i * math.pi / 2)
+        rotation = mathutils.Euler((phase * angle, 0.0, -0.5 * phase * angle))
+        for pose_bone in bones:
+            if pose_bone.rotation_mode == 'QUATERNION':
+                pose_bone.rotation_quaternion = rotation.to_quaternion()
+                pose_bone.keyframe_insert("rotation_quaternion", frame=frame, group=pose_bone.name)
+            elif pose_bone.rotation_mode != 'AXIS_ANGLE':
+                pose_bone.rotation_euler = rotation
+                pose_bone.keyframe_insert("rotation_euler", frame=frame, group=pose_bone.name)
+
+            if _IK_CONTROL.search(pose_bone.name) and not any(pose_bone.lock_location):
+                offset = 0.1 * phase * pose_bone.bone.length
+                pose_bone.location = (offset, 0.0, offset)
+                pose_bone.keyframe_insert("location", frame=frame, group=pose_bone.name)
+
+
+def _bone_name(data_path: str, pattern: re.Pattern) -> str | None:
+    match = pattern.match(data_path)
+    return match.group(1).replace('\\"', '"') if match else None
+
+
+def _driver_counts(armature: bpy.types.Object) -> tuple[Counter, int]:
+    """Returns drivers per bone and the number of drivers not tied to a bone."""
+    per_bone: Counter = Counter()
+    other = 0
+    for id_block, pattern in ((armature, _POSE_BONE_PATH), (armature.data, _DATA_BONE_PATH)):
+        if id_block.animation_data is None:
+            continue
+        for fcurve in id_block.animation_data.drivers:
+            name = _bone_name(fcurve.data_path, pattern)
+            if name is None:
+                other += 1
+            else:
+                per_bone[name] += 1
+    return per_bone, other
+
+
+def rig_statistics(armature: bpy.types.Object) -> dict:
+    """Counts bones, constraints and drivers per bone collection of the armature."""
+    drivers, other_drivers = _driver_counts(armature)
+    collections: dict[str, dict[str, int]] = {}
+
+    for pose_bone in armature.pose.bones:
+        names = [collection.name for collection in pose_bone.bone.collections] or [_NO_COLLECTION]
+        for name in names:
+            entry = collections.setdefault(name, {"bones": 0, "constraints": 0, "drivers": 0})
+            entry["bones"] += 1
+            entry["constraints"] += len(pose_bone.constraints)
+            entry["drivers"] += drivers.get(pose_bone.name, 0)
+
+    return {
+        "bones": len(armature.pose.bones),
+        "constraints": sum(len(pose_bone.constraints) for pose_bone in armature.pose.bones),
+        "drivers": sum(drivers.values()) + other_drivers,
+        "collections": dict(sorted(collections.items(), key=lambda item: -item[1]["constraints"])),
+    }
+
+
+def mesh_statistics(meshes: list[bpy.types.Object]) -> list[dict]:
+    results = []
+    for mesh in meshes:
+        shape_keys = mesh.data.shape_keys
+        animation_data = shape_keys.animation_data if shape_keys else None
+        results.append({
+            "name": mesh.name,
+            "vertices": len(mesh.data.vertices),
+            "modifiers": len(mesh.modifiers),
+            "shape_keys": len(shape_keys.key_blocks) if shape_keys else 0,
+            "shape_key_drivers": len(animation_data.drivers) if animation_data else 0,
+        })
+    return results
+
+
+def _timing(frame_times: list[tuple[int, float]]) -> dict:
+    seconds = [elapsed for _, elapsed in frame_times]
+    worst_frame, worst = max(frame_times, key=lambda item: item[1])
+    total = sum(seconds)
+    ordered = sorted(seconds)
+    return {
+        "frames": len(seconds),
+        "total_seconds": round(total, 6),
+        "fps": round(len(seconds) / total, 3) if total > 0 else 0.0,
+        "mean_ms": round(1000 * total / len(seconds), 3),
+        "median_ms": round(1000 * statistics.median(seconds), 3),
+        "p95_ms": round(1000 * ordered[min(len(ordered) - 1, math.ceil(0.95 * len(ordered)) - 1)], 3),
+        "worst_frame": worst_frame,
+        "worst_ms": round(1000 * worst, 3),
+    }
+
+
+def _scrub(scene: bpy.types.Scene, frames: range) -> list[tuple[int, float]]:
+    frame_times = []
+    for frame in frames:
+        time_start = time.perf_counter()
+        scene.frame_set(frame)
+        frame_times.append((frame, time.perf_counter() - time_start))
+    return frame_times
+
+
+def _mean_ms(frame_times: list[tuple[int, float]]) -> float:
+    return 1000 * sum(elapsed for _, elapsed in frame_times) / len(frame_times)
+
+
+@contextmanager
+def _deform_disabled(armature: bpy.types.Object, meshes: list[bpy.types.Object]):
+    """Switches off the viewport armature modifiers of the meshes that use the armature."""
+    modifiers = [
+        modifier for mesh in meshes for modifier in mesh.modifiers
+        if modifier.type == 'ARMATURE' and modifier.object == armature and modifier.show_viewport
+    ]
+    for modifier in modifiers:
+        modifier.show_viewport = False
+    try:
+        yield
+    finally:
+        for modifier in modifiers:
+            modifier.show_viewport = True
+
+
+def _object_breakdown(scene: bpy.types.Scene, frames: range, armature: bpy.types.Object, meshes: list[bpy.types.Object], scene_ms: float) -> dict:
+    """Per-object share of the frame time, measured as the difference switching each part off makes."""
+    mesh_costs = []
+    for mesh in meshes:
+        with _deform_disabled(armature, [mesh]):
+            without_ms = _mean_ms(_scrub(scene, frames))
+        mesh_costs.append({"name": mesh.name, "mean_ms": round(max(0.0, scene_ms - without_ms), 3)})
+
+    with _deform_disabled(armature, meshes):
+        rig_ms = _mean_ms(_scrub(scene, frames))
+        action = armature.animation_data.action
+        armature.animation_data.action = None
+        try:
+            static_ms = _mean_ms(_scrub(scene, frames))
+        finally:
+            armature.animation_data.action = action
+
+    return {
+        "armature": {"name": armature.name, "mean_ms": round(max(0.0, rig_ms - static_ms), 3)},
+        "meshes": sorted(mesh_costs, key=lambda entry: -entry["mean_ms"]),
+    }
+
+
+def run(
+    armature: bpy.types.Object,
+    frame_count: int = 120,
+    warmup_frames: int = 10,
+    angle: float = math.radians(30.0),
+    pattern: str = CONTROL_PATTERN,
+    per_object: bool = True,
+) -> dict:
+    """Scrubs frame_count frames of synthetic control motion and returns the timing report.
+
+    With per_object the frames are scrubbed again once per deforming mesh and twice for
+    the armature to break the frame time down per object. The armature's action, the
+    control poses and the current frame are restored afterwards.
+    """
+    scene = bpy.context.scene
+    frame_start = scene.frame_start
+    frame_end = frame_start + max(2, frame_count) - 1
+    frame_current = scene.frame_current
+
+    bones = control_bones(armature, pattern)
+    meshes = utils.armature.find_meshes(armature)
+    frames = range(frame_start, frame_end + 1)
+    rest_pose = {pose_bone.name: pose_bone.matrix_basis.copy() for pose_bone in bones}
+
+    if armature.animation_data is None:
+        armature.animation_data_create()
+    previous_action = armature.animation_data.action
+    armature.animation_data.action = None
+
+    frame_times: list[tuple[int, float]] = []
+    objects: dict = {}
+    try:
+        _key_synthetic_motion(bones, _key_frames(frame_start, frame_end), angle)
+
+        for frame in range(frame_start, frame_start + warmup_frames):
+            scene.frame_set(min(frame, frame_end))
+
+        frame_times = _scrub(scene, frames)
+        if per_object:
+            objects = _object_breakdown(scene, frames, armature, meshes, _mean_ms(frame_times))
+    finally:
+        benchmark_action = armature.animation_data.action
+        armature.animation_data.action = previous_action
+        if benchmark_action is not None and benchmark_action != previous_action:
+            bpy.data.actions.remove(benchmark_action)
+        for name, matrix in rest_pose.items():
+            armature.pose.bones[name].matrix_basis = matrix
+        scene.frame_set(frame_current)
+
+    return {
+        "format_version": FORMAT_VERSION,
+        "addon_version": profiler.addon_version(),
+        "blender_version": bpy.app.version_string,
+        "armature": armature.name,
+        "template": armature.aether_rig.selected_template,
+        "frame_start": frame_start,
+        "frame_end": frame_end,
+        "warmup_frames": warmup_frames,
+        "controls": len(bones),
+        "timing": _timing(frame_times),
+        "objects": objects,
+        "rig": rig_statistics(armature),
+        "meshes": mesh_statistics(meshes),
+    }
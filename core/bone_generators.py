@@ -1,7 +1,6 @@
 import bpy
 import math
 import mathutils 
-import re
 
 from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
@@ -10,7 +9,10 @@ from typing import TYPE_CHECKING, Literal
 if TYPE_CHECKING:
     from .operations import PoseOperations
 
+from . import bone_geometry
 from . import rigify
+from .skeleton_index import SkeletonIndex
+from .skin_weights import SkinWeightCache
 from .operations import ABOperation, ParentBoneOperation, PoseOperations, TransformLink, RigifyTypeOperation
 from .. import utils
 
@@ -32,6 +34,42 @@ class BoneGenerator(ABC):
     def generate(self, armature: bpy.types.Object, data: dict | None = None) -> list[str] | None:
         """Generates the bone and returns the created bone name(s)."""
         return NotImplementedError
+
+    def planned_bones(self, skeleton: SkeletonIndex) -> list[str] | None:
+        """Names of the bones generate() creates on an armature with the given bones, or None if that cannot be known in advance."""
+        return [self.name]
+
+    def edited_bones(self) -> list[str]:
+        """Existing bones generate() changes besides the ones it creates."""
+        return []
+
+    def geometry_request(self) -> bone_geometry.BoneRequest | None:
+        """Describes the bone for batched evaluation with bone_geometry.solve, or None if the generator must run on its own."""
+        return None
+
+    def apply_geometry(self, armature: bpy.types.Object, geometry: bone_geometry.BoneGeometry) -> list[str] | None:
+        """Creates the bone from geometry solved for this generator's geometry_request."""
+        raise NotImplementedError(f"{type(self).__name__} does not support batched geometry")
+
+    def _replace_bone(self, edit_bones: bpy.types.ArmatureEditBones, geometry: bone_geometry.BoneGeometry, roll: float = 0.0) -> bpy.types.EditBone:
+        """Creates the bone from solved geometry, replacing an existing bone of the same name."""
+        if self.name in edit_bones:
+            edit_bones.remove(edit_bones[self.name])
+
+        new_bone = edit_bones.new(self.name)
+        new_bone.head = geometry.head
+        new_bone.tail = geometry.tail
+        new_bone.roll = roll
+        return new_bone
+
+    def _roll_radians(self) -> float:
+        return math.radians(self.roll) if self.roll != 0.0 else 0.0
+
+    def _apply_simple_geometry(self, armature: bpy.types.Object, geometry: bone_geometry.BoneGeometry) -> list[str] | None:
+        edit_bones = armature.data.edit_bones
+        new_bone = self._replace_bone(edit_bones, geometry, self._roll_radians())
+        self._set_parent(new_bone, edit_bones)
+        return [new_bone.name]
         
     def _set_parent(self, new_bone: bpy.types.EditBone, edit_bones: bpy.types.ArmatureEditBones, is_connected_overrite: bool | None = None) -> None:
         """Sets the parent bone for the generated bone. Override in subclasses if needed."""
@@ -67,6 +105,10 @@ class RegexBoneGroup(BoneGenerator):
     _dynamic_pose_operations: dict[str, list['PoseOperations']] = field(default_factory=dict, init=False, repr=False)
     _dynamic_transform_links: list['TransformLink'] = field(default_factory=list, init=False, repr=False)
 
+    def planned_bones(self, skeleton: SkeletonIndex) -> list[str] | None:
+        # Every matched bone gets one bone, either an extension or a link of a chain.
+        return [f"{self.prefix}_{name}" for name in skeleton.matches(self.pattern)]
+
     def generate(self, armature: bpy.types.Object, data: dict | None = None) -> list[str] | None:
         """Generates bone chains for pattern-matched bones in the target armature."""
 
@@ -78,25 +120,24 @@ class RegexBoneGroup(BoneGenerator):
         self._dynamic_pose_operations = {}
         self._dynamic_transform_links = []
         
-        ref_bones = armature.data.bones
-        matched_bones = [bone for bone in ref_bones if re.match(self.pattern, bone.name)]
+        skeleton = SkeletonIndex.get(armature, data)
 
         created_bones = []
         processed_bones = set()
 
-        for bone in matched_bones:
-            if bone.name in processed_bones:
+        for matched_bone in skeleton.matches(self.pattern):
+            if matched_bone in processed_bones:
                 continue
 
-            children = [child for child in bone.children if re.match(self.pattern, child.name)]
-            parent = self.parent if not self.original_parent else bone.parent.name
+            children = skeleton.matching_children(matched_bone, self.pattern)
+            parent = self.parent if not self.original_parent else skeleton.parent(matched_bone)
 
             if not children:
                 # Single bone without children - create extension bone
-                bone_name = f"{self.prefix}_{bone.name}"
+                bone_name = f"{self.prefix}_{matched_bone}"
                 extension_bone = ExtensionBone(
                     name=bone_name,
-                    bone_a=bone.name,
+                    bone_a=matched_bone,
                     size_factor=self.extension_size_factor,
                     axis_type=self.extension_axis_type,
                     axis=self.extension_axis,
@@ -117,13 +158,13 @@ class RegexBoneGroup(BoneGenerator):
                         )
                     ]
                     self._dynamic_transform_links.append(
-                        TransformLink(target=f"DEF-{bone_name}", bone=bone.name)
+                        TransformLink(target=f"DEF-{bone_name}", bone=matched_bone)
                     )
                 
-                processed_bones.add(bone.name)
+                processed_bones.add(matched_bone)
             else:
                 # Chain of bones - create connect bones for each
-                chain_bones = self._build_chain(bone)
+                chain_bones = skeleton.chain(matched_bone, self.pattern)
                 processed_bones.update(chain_bones)
                 
                 # Create ConnectBones for all bones in chain including last
@@ -173,21 +214,6 @@ class RegexBoneGroup(BoneGenerator):
                         
         return created_bones if created_bones else None
     
-    def _build_chain(self, start_bone) -> list[str]:
-        """Build a chain of bones starting from start_bone following the pattern."""
-        chain = [start_bone.name]
-        current = start_bone
-        
-        while True:
-            children = [child for child in current.children if re.match(self.pattern, child.name)]
-            if not children:
-                break
-            # Follow the first matching child
-            current = children[0]
-            chain.append(current.name)
-        
-        return chain
-    
     def get_dynamic_pose_operations(self) -> dict[str, list['PoseOperations']]:
         """Returns the dynamically generated pose operations after generate() is called."""
         return self._dynamic_pose_operations if self._dynamic_pose_operations else {}
@@ -242,6 +268,12 @@ class ConnectBone(BoneGenerator):
         
         return [created_name]
 
+    def geometry_request(self) -> bone_geometry.BoneRequest | None:
+        return bone_geometry.Connect(self.name, self.bone_a, self.bone_b, start_tail=self.start == "tail", end_tail=self.end == "tail")
+
+    def apply_geometry(self, armature: bpy.types.Object, geometry: bone_geometry.BoneGeometry) -> list[str] | None:
+        return self._apply_simple_geometry(armature, geometry)
+
 @dataclass
 class ExtensionBone(BoneGenerator):
     """Creates a bone extending from a source bone in a given direction."""
@@ -325,6 +357,19 @@ class ExtensionBone(BoneGenerator):
         
         return [created_name]
 
+    def geometry_request(self) -> bone_geometry.BoneRequest | None:
+        axis = bone_geometry.axis_index(self.axis)
+        if axis is None or self.axis_type not in bone_geometry.AXIS_TYPES:
+            return None
+        try:
+            size_factor = float(self.size_factor)
+        except (TypeError, ValueError):
+            return None
+        return bone_geometry.Extension(self.name, self.bone_a, self.axis_type, axis, size_factor, start_tail=self.start == "tail")
+
+    def apply_geometry(self, armature: bpy.types.Object, geometry: bone_geometry.BoneGeometry) -> list[str] | None:
+        return self._apply_simple_geometry(armature, geometry)
+
 @dataclass
 class CopyBone(BoneGenerator):
     """Creates a bone by copying the transform of an existing bone."""
@@ -356,6 +401,15 @@ class CopyBone(BoneGenerator):
         created_name = new_bone.name
         return [created_name]
 
+    def geometry_request(self) -> bone_geometry.BoneRequest | None:
+        return bone_geometry.Copy(self.name, self.bone_a)
+
+    def apply_geometry(self, armature: bpy.types.Object, geometry: bone_geometry.BoneGeometry) -> list[str] | None:
+        edit_bones = armature.data.edit_bones
+        new_bone = self._replace_bone(edit_bones, geometry, math.radians(self.roll) if self.roll != 0.0 else geometry.roll)
+        self._set_parent(new_bone, edit_bones)
+        return [new_bone.name]
+
 
 @dataclass
 class OffsetBone(BoneGenerator):
@@ -412,6 +466,19 @@ class OffsetBone(BoneGenerator):
         created_name = new_bone.name
         return [created_name]
 
+    def geometry_request(self) -> bone_geometry.BoneRequest | None:
+        try:
+            offset = tuple(float(value) for value in self.offset)
+            size_factor = float(self.size_factor)
+        except (TypeError, ValueError):
+            return None
+        if len(offset) != 3:
+            return None
+        return bone_geometry.Offset(self.name, self.bone_a, offset, size_factor)
+
+    def apply_geometry(self, armature: bpy.types.Object, geometry: bone_geometry.BoneGeometry) -> list[str] | None:
+        return self._apply_simple_geometry(armature, geometry)
+
 @dataclass
 class ParallelBone(BoneGenerator):
     """Creates a bone extending from a source bone along an axis until it reaches a target coordinate."""
@@ -515,6 +582,25 @@ class ParallelBone(BoneGenerator):
         
         return [created_name]
 
+    def geometry_request(self) -> bone_geometry.BoneRequest | None:
+        axis = bone_geometry.axis_index(self.axis)
+        if axis is None or self.axis_type not in bone_geometry.AXIS_TYPES or self.end not in ("head", "tail"):
+            return None
+        coordinate = bone_geometry.axis_index(self.coordinate.upper())
+        return bone_geometry.Parallel(
+            self.name,
+            self.bone_a,
+            self.bone_b,
+            self.axis_type,
+            axis,
+            coordinate if coordinate is not None else 1,
+            start_tail=self.start == "tail",
+            end_tail=self.end == "tail",
+        )
+
+    def apply_geometry(self, armature: bpy.types.Object, geometry: bone_geometry.BoneGeometry) -> list[str] | None:
+        return self._apply_simple_geometry(armature, geometry)
+
 @dataclass
 class SkinBone(BoneGenerator):
     bone_a: str
@@ -545,7 +631,7 @@ class SkinBone(BoneGenerator):
             print(f"[AetherBlend] Reference bone '{self.bone_a}' not found in source armature for SkinBone '{self.name}'.")
             return None
         
-        world_co, weight = self._find_highest_weight_vertex_world_pos(self.bone_a, original_armature, mesh=skin)
+        world_co, weight = self._find_highest_weight_vertex_world_pos(self.bone_a, original_armature, mesh=skin, data=data)
         
         if world_co is None:
             print(f"[AetherBlend] No vertices found with weights for bone '{self.bone_a}'. Skipping SkinBone '{self.name}'.")
@@ -575,81 +661,21 @@ class SkinBone(BoneGenerator):
         created_name = new_bone.name
         return [created_name]
     
-    def _find_highest_weight_vertex_world_pos(self, bone_name: str, armature: bpy.types.Object, mesh = None) -> tuple:
+    def _find_highest_weight_vertex_world_pos(self, bone_name: str, armature: bpy.types.Object, mesh = None, data: dict | None = None) -> tuple:
         depsgraph = bpy.context.evaluated_depsgraph_get()
-        
-        best_weight = 0.0
-        best_world_co = None
+
+        if armature is None:
+            return (None, 0.0)
 
         if mesh is not None:
-            object_pool = [mesh]
+            candidate_objects = [
+                mesh for modifier in mesh.modifiers
+                if modifier.type == 'ARMATURE' and modifier.object == armature
+            ][:1]
         else:
-            object_pool = [obj for obj in bpy.data.objects if obj.type == 'MESH']
-            
-        candidate_objects = []
-        
-        for obj in object_pool:
-            if obj is None:
-                continue
-            if obj.type != 'MESH':
-                continue
-            
-            has_armature_mod = False
-            for modifier in obj.modifiers:
-                if modifier.type == 'ARMATURE' and modifier.object == armature:
-                    has_armature_mod = True
-                    break
-            
-            if not has_armature_mod:
-                continue
-                
-            vg = obj.vertex_groups.get(bone_name)
-            if vg is not None:
-                candidate_objects.append((obj, vg))
-        
-        if not candidate_objects:
-            return (None, 0.0)
-        
-        for obj, vertex_group in candidate_objects:
-            armature_mod = None
-            for mod in obj.modifiers:
-                if mod.type == 'ARMATURE' and mod.object == armature:
-                    armature_mod = mod
-                    break
-            
-            if not armature_mod:
-                continue
-            
-            eval_obj = obj.evaluated_get(depsgraph)
-            
-            try:
-                mesh_eval = eval_obj.to_mesh()
-            except Exception as e:
-                continue
-            
-            if mesh_eval is None:
-                continue
-            
-            orig_verts = obj.data.vertices
-            vg_index = vertex_group.index
-            
-            if len(mesh_eval.vertices) != len(orig_verts):
-                eval_obj.to_mesh_clear()
-                continue
-            
-            for v_idx, vertex in enumerate(orig_verts):
-                for group in vertex.groups:
-                    if group.group == vg_index and group.weight > best_weight:
-                        eval_local_co = mesh_eval.vertices[v_idx].co.copy()
-                        world_co = obj.matrix_world @ eval_local_co
-                        
-                        best_weight = group.weight
-                        best_world_co = world_co.copy()
-                        break
-            
-            eval_obj.to_mesh_clear()
-        
-        return (best_world_co, best_weight)
+            candidate_objects = utils.armature.find_meshes(armature)
+
+        return SkinWeightCache.get(data).highest_weight(bone_name, candidate_objects, depsgraph)
     
 @dataclass
 class BridgeBone(BoneGenerator):
@@ -659,6 +685,10 @@ class BridgeBone(BoneGenerator):
     offset_factor: mathutils.Vector = field(default_factory=lambda: mathutils.Vector((0.0, 0.0, 0.0)))
     is_connected: bool = field(default=True, kw_only=True)
 
+    def edited_bones(self) -> list[str]:
+        # bone_a ends at the bridge and takes the bridge's parent; bone_b is re-parented when connected.
+        return [self.bone_a, self.bone_b] if self.is_connected else [self.bone_a]
+
     def generate(self, armature: bpy.types.Object, data: dict | None = None) -> list[str] | None:
         """Generates the BridgeBone from bone_a to bone_b with curved offset in target armature."""
         if not armature:
@@ -704,6 +734,34 @@ class BridgeBone(BoneGenerator):
         created_name = new_bone.name  
         return [created_name]
 
+    def geometry_request(self) -> bone_geometry.BoneRequest | None:
+        try:
+            offset = tuple(float(value) for value in self.offset_factor)
+        except (TypeError, ValueError):
+            return None
+        if len(offset) != 3:
+            return None
+        return bone_geometry.Bridge(self.name, self.bone_a, self.bone_b, offset)
+
+    def apply_geometry(self, armature: bpy.types.Object, geometry: bone_geometry.BoneGeometry) -> list[str] | None:
+        edit_bones = armature.data.edit_bones
+        new_bone = self._replace_bone(edit_bones, geometry)
+
+        bone_a_ref = edit_bones[self.bone_a]
+        bone_a_ref.tail = geometry.head
+        new_bone.parent = bone_a_ref
+        new_bone.use_connect = True
+
+        self._set_parent(bone_a_ref, edit_bones, is_connected_overrite=False)
+
+        if self.is_connected:
+            bone_b_ref = edit_bones.get(self.bone_b)
+            if bone_b_ref:
+                bone_b_ref.parent = new_bone
+                bone_b_ref.use_connect = True
+
+        return [new_bone.name]
+
 @dataclass
 class CenterBone(BoneGenerator):
     ref_bones: list[str]
@@ -767,3 +825,21 @@ class CenterBone(BoneGenerator):
 
         created_name = new_bone.name
         return [created_name]
+
+    def geometry_request(self) -> bone_geometry.BoneRequest | None:
+        if not self.ref_bones:
+            return None
+        axis = bone_geometry.axis_index(self.axis)
+        return bone_geometry.Center(
+            self.name,
+            tuple(self.ref_bones),
+            float(self.size_factor),
+            axis if axis is not None else 1,
+            inverted=self.inverted,
+        )
+
+    def apply_geometry(self, armature: bpy.types.Object, geometry: bone_geometry.BoneGeometry) -> list[str] | None:
+        edit_bones = armature.data.edit_bones
+        new_bone = self._replace_bone(edit_bones, geometry)
+        self._set_parent(new_bone, edit_bones)
+        return [new_bone.name]
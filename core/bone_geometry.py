@@ -0,0 +1,388 @@
+"""Batched rest geometry for bone generators.
+
+Bone generators describe the bone they create as a small request (Connect,
+Extension, Offset, ...). solve evaluates a whole list of requests against a
+Skeleton, the heads, tails and rolls of all bones as flat arrays, with one NumPy
+pass per request type. Generators then only write the results back.
+
+This module does not import bpy: a Skeleton can be read from edit bones with
+foreach_get or built from plain arrays, so the geometry can be checked and
+benchmarked outside Blender.
+"""
+
+import math
+from dataclasses import dataclass
+
+import numpy # type: ignore
+
+_AXES = {"X": 0, "Y": 1, "Z": 2}
+AXIS_TYPES = ("local", "armature", "global")
+_MIN_COMPONENT = 0.0001
+# Thresholds of Blender's vec_roll_to_mat3_normalized.
+_SAFE_THRESHOLD = 6.1e-3
+_CRITICAL_THRESHOLD_SQUARED = 2.5e-4 * 2.5e-4
+
+
+def axis_index(axis: str) -> int | None:
+    return _AXES.get(axis)
+
+
+# ------------------------------
+# Requests
+# ------------------------------
+@dataclass(frozen=True)
+class BoneRequest:
+    """Geometry of one generated bone, computed from existing bones."""
+    name: str
+
+    @property
+    def inputs(self) -> tuple[str, ...]:
+        """Bones whose geometry the request reads."""
+        return ()
+
+    @property
+    def outputs(self) -> tuple[str, ...]:
+        """Bones whose geometry changes when the request is written back."""
+        return (self.name,)
+
+
+@dataclass(frozen=True)
+class Connect(BoneRequest):
+    bone_a: str
+    bone_b: str
+    start_tail: bool = False
+    end_tail: bool = False
+
+    @property
+    def inputs(self) -> tuple[str, ...]:
+        return (self.bone_a, self.bone_b)
+
+
+@dataclass(frozen=True)
+class Copy(BoneRequest):
+    bone_a: str
+
+    @property
+    def inputs(self) -> tuple[str, ...]:
+        return (self.bone_a,)
+
+
+@dataclass(frozen=True)
+class Extension(BoneRequest):
+    bone_a: str
+    axis_type: str = "local"
+    axis: int = 1
+    size_factor: float = 1.0
+    start_tail: bool = True
+
+    @property
+    def inputs(self) -> tuple[str, ...]:
+        return (self.bone_a,)
+
+
+@dataclass(frozen=True)
+class Offset(BoneRequest):
+    bone_a: str
+    offset: tuple[float, float, float] = (0.0, 0.0, 0.0)
+    size_factor: float = 1.0
+
+    @property
+    def inputs(self) -> tuple[str, ...]:
+        return (self.bone_a,)
+
+
+@dataclass(frozen=True)
+class Parallel(BoneRequest):
+    bone_a: str
+    bone_b: str
+    axis_type: str = "local"
+    axis: int = 1
+    coordinate: int = 1
+    start_tail: bool = True
+    end_tail: bool = False
+
+    @property
+    def inputs(self) -> tuple[str, ...]:
+        return (self.bone_a, self.bone_b)
+
+
+@dataclass(frozen=True)
+class Center(BoneRequest):
+    ref_bones: tuple[str, ...]
+    size_factor: float = 1.0
+    axis: int = 2
+    inverted: bool = False
+
+    @property
+    def inputs(self) -> tuple[str, ...]:
+        return self.ref_bones
+
+
+@dataclass(frozen=True)
+class Bridge(BoneRequest):
+    bone_a: str
+    bone_b: str
+    offset: tuple[float, float, float] = (0.0, 0.0, 0.0)
+
+    @property
+    def inputs(self) -> tuple[str, ...]:
+        return (self.bone_a, self.bone_b)
+
+    @property
+    def outputs(self) -> tuple[str, ...]:
+        # The bridge moves the tail of bone_a onto its own head.
+        return (self.name, self.bone_a)
+
+
+@dataclass(frozen=True)
+class BoneGeometry:
+    head: tuple[float, float, float]
+    tail: tuple[float, float, float]
+    roll: float = 0.0
+
+
+# ------------------------------
+# Skeleton
+# ------------------------------
+def roll_matrices(heads: numpy.ndarray, tails: numpy.ndarray, rolls: numpy.ndarray) -> numpy.ndarray:
+    """Returns the rest rotation of each bone, axes as columns, the way Blender derives it from head, tail and roll."""
+    count = len(heads)
+    vectors = tails - heads
+    lengths = numpy.linalg.norm(vectors, axis=1)
+    directions = numpy.zeros_like(vectors)
+    nonzero = lengths > 0.0
+    directions[nonzero] = vectors[nonzero] / lengths[nonzero, None]
+    directions[~nonzero] = (0.0, 1.0, 0.0)
+    x, y, z = directions.T
+
+    theta = 1.0 + y
+    theta_alt = x * x + z * z
+    safe = theta > _SAFE_THRESHOLD
+    regular = safe | (theta_alt > _CRITICAL_THRESHOLD_SQUARED)
+    theta = numpy.where(safe, theta, theta_alt * 0.5 + theta_alt * theta_alt * 0.125)
+    theta = numpy.where(regular, theta, 1.0)
+
+    base = numpy.empty((count, 3, 3))
+    base[:, 0, 0] = 1.0 - x * x / theta
+    base[:, 1, 0] = -x
+    base[:, 2, 0] = -x * z / theta
+    base[:, 0, 1] = x
+    base[:, 1, 1] = y
+    base[:, 2, 1] = z
+    base[:, 0, 2] = -x * z / theta
+    base[:, 1, 2] = -z
+    base[:, 2, 2] = 1.0 - z * z / theta
+    # Bones pointing straight down -Y.
+    base[~regular] = numpy.diag((-1.0, -1.0, 1.0))
+
+    cos = numpy.cos(rolls)
+    sin = numpy.sin(rolls)
+    inv_cos = 1.0 - cos
+    roll = numpy.empty((count, 3, 3))
+    roll[:, 0, 0] = inv_cos * x * x + cos
+    roll[:, 0, 1] = inv_cos * x * y - sin * z
+    roll[:, 0, 2] = inv_cos * x * z + sin * y
+    roll[:, 1, 0] = inv_cos * x * y + sin * z
+    roll[:, 1, 1] = inv_cos * y * y + cos
+    roll[:, 1, 2] = inv_cos * y * z - sin * x
+    roll[:, 2, 0] = inv_cos * x * z - sin * y
+    roll[:, 2, 1] = inv_cos * y * z + sin * x
+    roll[:, 2, 2] = inv_cos * z * z + cos
+
+    return roll @ base
+
+
+class Skeleton:
+    """Heads, tails and rolls of a set of bones as flat arrays."""
+
+    def __init__(self, names, heads, tails, rolls):
+        self.names = list(names)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        count = len(self.names)
+        self.heads = numpy.asarray(heads, dtype=numpy.float64).reshape(count, 3)
+        self.tails = numpy.asarray(tails, dtype=numpy.float64).reshape(count, 3)
+        self.rolls = numpy.asarray(rolls, dtype=numpy.float64).reshape(count)
+        self._matrices = None
+        self._lengths = None
+
+    @classmethod
+    def from_edit_bones(cls, edit_bones) -> 'Skeleton':
+        """Reads every edit bone of an armature with one foreach_get per attribute."""
+        count = len(edit_bones)
+        heads = numpy.empty(count * 3, dtype=numpy.float32)
+        tails = numpy.empty(count * 3, dtype=numpy.float32)
+        rolls = numpy.empty(count, dtype=numpy.float32)
+        edit_bones.foreach_get("head", heads)
+        edit_bones.foreach_get("tail", tails)
+        edit_bones.foreach_get("roll", rolls)
+        return cls(edit_bones.keys(), heads, tails, rolls)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.index
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def indices(self, names) -> numpy.ndarray:
+        return numpy.fromiter((self.index[name] for name in names), dtype=numpy.intp)
+
+    @property
+    def matrices(self) -> numpy.ndarray:
+        if self._matrices is None:
+            self._matrices = roll_matrices(self.heads, self.tails, self.rolls)
+        return self._matrices
+
+    @property
+    def lengths(self) -> numpy.ndarray:
+        if self._lengths is None:
+            self._lengths = numpy.linalg.norm(self.tails - self.heads, axis=1)
+        return self._lengths
+
+    def points(self, indices: numpy.ndarray, use_tail: numpy.ndarray) -> numpy.ndarray:
+        return numpy.where(use_tail[:, None], self.tails[indices], self.heads[indices])
+
+
+# ------------------------------
+# Kernels
+# ------------------------------
+def _directions(skeleton: Skeleton, indices, axis_types, axes, world_inverse) -> numpy.ndarray:
+    """Normalized bone local, armature or world axes per request, in armature space."""
+    axes = numpy.asarray(axes, dtype=numpy.intp)
+    axis_types = numpy.asarray(axis_types)
+    directions = numpy.eye(3)[axes]
+
+    local = axis_types == "local"
+    if local.any():
+        directions[local] = skeleton.matrices[indices[local], :, axes[local]]
+
+    world = axis_types == "global"
+    if world.any():
+        directions[world] = directions[world] @ world_inverse.T
+
+    lengths = numpy.linalg.norm(directions, axis=1)
+    return directions / numpy.where(lengths > 0.0, lengths, 1.0)[:, None]
+
+
+def _connect(skeleton: Skeleton, requests: list[Connect], world_inverse) -> tuple:
+    a = skeleton.indices(request.bone_a for request in requests)
+    b = skeleton.indices(request.bone_b for request in requests)
+    heads = skeleton.points(a, numpy.array([request.start_tail for request in requests]))
+    tails = skeleton.points(b, numpy.array([request.end_tail for request in requests]))
+    return heads, tails, numpy.zeros(len(requests)), None
+
+
+def _copy(skeleton: Skeleton, requests: list[Copy], world_inverse) -> tuple:
+    a = skeleton.indices(request.bone_a for request in requests)
+    return skeleton.heads[a], skeleton.tails[a], skeleton.rolls[a], None
+
+
+def _extension(skeleton: Skeleton, requests: list[Extension], world_inverse) -> tuple:
+    a = skeleton.indices(request.bone_a for request in requests)
+    heads = skeleton.points(a, numpy.array([request.start_tail for request in requests]))
+    directions = _directions(
+        skeleton, a,
+        [request.axis_type for request in requests],
+        [request.axis for request in requests],
+        world_inverse,
+    )
+    lengths = skeleton.lengths[a]
+    lengths = numpy.where(lengths > 0.0, lengths, 1.0) * numpy.array([request.size_factor for request in requests])
+    return heads, heads + directions * lengths[:, None], numpy.zeros(len(requests)), None
+
+
+def _offset(skeleton: Skeleton, requests: list[Offset], world_inverse) -> tuple:
+    a = skeleton.indices(request.bone_a for request in requests)
+    offsets = numpy.array([request.offset for request in requests], dtype=numpy.float64)
+    size_factors = numpy.array([request.size_factor for request in requests])
+    heads = skeleton.heads[a] + numpy.einsum("nij,nj->ni", skeleton.matrices[a], offsets)
+    tails = heads + (skeleton.tails[a] - skeleton.heads[a]) * size_factors[:, None]
+    return heads, tails, numpy.zeros(len(requests)), None
+
+
+def _parallel(skeleton: Skeleton, requests: list[Parallel], world_inverse) -> tuple:
+    a = skeleton.indices(request.bone_a for request in requests)
+    b = skeleton.indices(request.bone_b for request in requests)
+    heads = skeleton.points(a, numpy.array([request.start_tail for request in requests]))
+    targets = skeleton.points(b, numpy.array([request.end_tail for request in requests]))
+    directions = _directions(
+        skeleton, a,
+        [request.axis_type for request in requests],
+        [request.axis for request in requests],
+        world_inverse,
+    )
+
+    # Solve start[c] + t * direction[c] = target[c] along the requested coordinate.
+    rows = numpy.arange(len(requests))
+    coordinates = numpy.array([request.coordinate for request in requests], dtype=numpy.intp)
+    components = directions[rows, coordinates]
+    valid = numpy.abs(components) >= _MIN_COMPONENT
+    distances = (targets[rows, coordinates] - heads[rows, coordinates]) / numpy.where(valid, components, 1.0)
+    return heads, heads + directions * distances[:, None], numpy.zeros(len(requests)), valid
+
+
+def _center(skeleton: Skeleton, requests: list[Center], world_inverse) -> tuple:
+    counts = numpy.array([len(request.ref_bones) for request in requests], dtype=numpy.intp)
+    owners = numpy.repeat(numpy.arange(len(requests)), counts)
+    refs = skeleton.indices(name for request in requests for name in request.ref_bones)
+
+    positions = numpy.zeros((len(requests), 3))
+    numpy.add.at(positions, owners, skeleton.heads[refs])
+    total_lengths = numpy.zeros(len(requests))
+    numpy.add.at(total_lengths, owners, skeleton.lengths[refs])
+
+    centers = positions / counts[:, None]
+    lengths = numpy.where(total_lengths > 0.0, total_lengths / counts, 0.3)
+    lengths = lengths * numpy.array([request.size_factor for request in requests])
+    vectors = numpy.eye(3)[[request.axis for request in requests]] * lengths[:, None]
+
+    inverted = numpy.array([request.inverted for request in requests])
+    heads = numpy.where(inverted[:, None], centers + vectors, centers)
+    tails = numpy.where(inverted[:, None], centers, centers + vectors)
+    return heads, tails, numpy.zeros(len(requests)), None
+
+
+def _bridge(skeleton: Skeleton, requests: list[Bridge], world_inverse) -> tuple:
+    a = skeleton.indices(request.bone_a for request in requests)
+    b = skeleton.indices(request.bone_b for request in requests)
+    offsets = numpy.array([request.offset for request in requests], dtype=numpy.float64)
+    # The curve factor sin(pi * t) is at its maximum of 1 for the midpoint.
+    heads = (skeleton.heads[a] + skeleton.heads[b]) / 2.0 + offsets * math.sin(math.pi * 0.5)
+    return heads, skeleton.heads[b], numpy.zeros(len(requests)), None
+
+
+_KERNELS = {
+    Connect: _connect,
+    Copy: _copy,
+    Extension: _extension,
+    Offset: _offset,
+    Parallel: _parallel,
+    Center: _center,
+    Bridge: _bridge,
+}
+
+
+def solve(skeleton: Skeleton, requests: list[BoneRequest], world_matrix=None) -> list[BoneGeometry | None]:
+    """Computes the geometry of every request, batched per request type.
+
+    All request inputs must exist in the skeleton. world_matrix is the armature's
+    world rotation, only needed by requests using global axes. Requests that cannot
+    be solved (a direction without a component along the target coordinate) yield None.
+    """
+    results: list[BoneGeometry | None] = [None] * len(requests)
+    world_inverse = numpy.linalg.inv(numpy.asarray(world_matrix, dtype=numpy.float64)) if world_matrix is not None else numpy.eye(3)
+
+    by_type: dict[type, list[int]] = {}
+    for position, request in enumerate(requests):
+        by_type.setdefault(type(request), []).append(position)
+
+    for request_type, positions in by_type.items():
+        heads, tails, rolls, valid = _KERNELS[request_type](skeleton, [requests[position] for position in positions], world_inverse)
+        heads = heads.tolist()
+        tails = tails.tolist()
+        rolls = rolls.tolist()
+        for row, position in enumerate(positions):
+            if valid is not None and not valid[row]:
+                continue
+            results[position] = BoneGeometry(tuple(heads[row]), tuple(tails[row]), rolls[row])
+
+    return results
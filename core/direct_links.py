@@ -0,0 +1,66 @@
+"""Direct links between original bones and their Rigify targets.
+
+With the "DIRECT" link mode a TransformLink whose original bone shares the rest
+matrix of its DEF- target is realised by parenting the original bone to the target
+instead of a LINK- bone plus a CopyTransforms constraint. That changes the game
+hierarchy of the original bones; the link table stores each bone's game parent,
+and to_game/to_direct switch the bones between the two setups.
+"""
+
+import bpy
+
+from . import link_table
+from .constraints import CopyTransformsConstraint
+from .link_table import Link
+
+
+def load(armature: bpy.types.Object) -> list[Link]:
+    """Returns the direct links of the armature's link table."""
+    return link_table.load(armature).direct()
+
+
+def is_direct(armature: bpy.types.Object, link: Link) -> bool:
+    bone = armature.data.bones.get(link.bone)
+    return bool(bone and bone.parent and bone.parent.name == link.target)
+
+
+def _reparent(armature: bpy.types.Object, parents: dict[str, str]) -> None:
+    bpy.ops.object.mode_set(mode='EDIT')
+    edit_bones = armature.data.edit_bones
+    for bone_name, parent_name in parents.items():
+        edit_bone = edit_bones.get(bone_name)
+        if edit_bone is None:
+            continue
+        edit_bone.use_connect = False
+        edit_bone.parent = edit_bones.get(parent_name) if parent_name else None
+    bpy.ops.object.mode_set(mode='POSE')
+
+
+def to_game(armature: bpy.types.Object, links: list[Link]) -> int:
+    """Restores the game hierarchy of directly linked bones, following their targets with a constraint. Returns the number of bones changed."""
+    links = [link for link in links if is_direct(armature, link) and armature.data.bones.get(link.target)]
+    if not links:
+        return 0
+
+    _reparent(armature, {link.bone: link.parent for link in links})
+    for link in links:
+        pose_bone = armature.pose.bones.get(link.bone)
+        if pose_bone and not pose_bone.constraints.get(link.constraint):
+            CopyTransformsConstraint(link.target, name=link.constraint, remove_target_shear=True).apply(pose_bone, armature)
+    return len(links)
+
+
+def to_direct(armature: bpy.types.Object, links: list[Link]) -> int:
+    """Parents the bones to their targets again and removes the constraints added by to_game. Returns the number of bones changed."""
+    links = [link for link in links if not is_direct(armature, link) and armature.data.bones.get(link.target)]
+    if not links:
+        return 0
+
+    bpy.ops.object.mode_set(mode='POSE')
+    for link in links:
+        pose_bone = armature.pose.bones.get(link.bone)
+        constraint = pose_bone.constraints.get(link.constraint) if pose_bone else None
+        if constraint:
+            pose_bone.constraints.remove(constraint)
+    _reparent(armature, {link.bone: link.target for link in links})
+    return len(links)
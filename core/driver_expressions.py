@@ -0,0 +1,176 @@
+"""Driver expression compiler for Blender's simple expression evaluator.
+
+Blender evaluates SCRIPTED driver expressions that only use variables, numbers,
+arithmetic, comparisons, boolean operators, conditionals and a fixed set of math
+functions without the Python interpreter. Any other expression takes the Python
+path, which needs the GIL and is much slower during playback. compile_expression
+checks expressions against that subset, rewrites the ones that are better served
+by a native driver type (AVERAGE, SUM, MIN, MAX) or a simple form, and reports
+why the others cannot run on the fast path.
+"""
+
+import ast
+
+from dataclasses import dataclass
+from functools import lru_cache
+
+# Function name -> accepted argument counts (None for any count >= 1).
+SIMPLE_FUNCTIONS: dict[str, tuple[int, ...] | None] = {
+    "radians": (1,), "degrees": (1,),
+    "abs": (1,), "fabs": (1,),
+    "floor": (1,), "ceil": (1,), "trunc": (1,), "round": (1,), "int": (1,),
+    "sin": (1,), "cos": (1,), "tan": (1,),
+    "asin": (1,), "acos": (1,), "atan": (1,), "atan2": (2,),
+    "exp": (1,), "log": (1, 2), "sqrt": (1,), "pow": (2,), "fmod": (2,),
+    "min": None, "max": None,
+    "lerp": (3,), "clamp": (1, 3), "smoothstep": (3,),
+}
+SIMPLE_CONSTANTS = frozenset({"pi", "True", "False"})
+# Names the simple evaluator provides besides the driver variables.
+SIMPLE_NAMES = SIMPLE_CONSTANTS | {"frame"}
+
+_BIN_OPS = (ast.Add, ast.Sub, ast.Mult, ast.Div)
+_UNARY_OPS = (ast.UAdd, ast.USub, ast.Not)
+_COMPARE_OPS = (ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE)
+
+
+@dataclass(frozen=True)
+class CompiledExpression:
+    """Driver type and expression to write, and whether Blender can evaluate it without Python."""
+    type: str
+    expression: str | None
+    simple: bool
+    reason: str | None = None  # Why the expression stays on the Python path; None when it compiles
+    rewritten: bool = False
+
+
+class _PowToCall(ast.NodeTransformer):
+    """Rewrites a ** b as pow(a, b), which the simple evaluator supports."""
+
+    def visit_BinOp(self, node: ast.BinOp) -> ast.AST:
+        self.generic_visit(node)
+        if isinstance(node.op, ast.Pow):
+            return ast.copy_location(ast.Call(func=ast.Name(id="pow", ctx=ast.Load()), args=[node.left, node.right], keywords=[]), node)
+        return node
+
+
+def _unsupported(node: ast.AST, variables: frozenset[str]) -> str | None:
+    """Returns why the expression tree is outside the simple subset, or None if it is inside."""
+    if isinstance(node, ast.Expression):
+        return _unsupported(node.body, variables)
+
+    if isinstance(node, ast.Constant):
+        if isinstance(node.value, (bool, int, float)):
+            return None
+        return f"constant {node.value!r}"
+
+    if isinstance(node, ast.Name):
+        if node.id in variables or node.id in SIMPLE_NAMES:
+            return None
+        return f"name '{node.id}' is not a driver variable"
+
+    if isinstance(node, ast.BinOp):
+        if not isinstance(node.op, _BIN_OPS):
+            return f"operator {type(node.op).__name__}"
+        return _unsupported(node.left, variables) or _unsupported(node.right, variables)
+
+    if isinstance(node, ast.UnaryOp):
+        if not isinstance(node.op, _UNARY_OPS):
+            return f"operator {type(node.op).__name__}"
+        return _unsupported(node.operand, variables)
+
+    if isinstance(node, ast.BoolOp):
+        return next((reason for value in node.values if (reason := _unsupported(value, variables))), None)
+
+    if isinstance(node, ast.Compare):
+        for op in node.ops:
+            if not isinstance(op, _COMPARE_OPS):
+                return f"operator {type(op).__name__}"
+        return next((reason for value in [node.left, *node.comparators] if (reason := _unsupported(value, variables))), None)
+
+    if isinstance(node, ast.IfExp):
+        return _unsupported(node.test, variables) or _unsupported(node.body, variables) or _unsupported(node.orelse, variables)
+
+    if isinstance(node, ast.Call):
+        if not isinstance(node.func, ast.Name) or node.func.id not in SIMPLE_FUNCTIONS:
+            return f"call to '{ast.unparse(node.func)}'"
+        if node.keywords or any(isinstance(arg, ast.Starred) for arg in node.args):
+            return f"keyword or starred arguments in '{node.func.id}'"
+        counts = SIMPLE_FUNCTIONS[node.func.id]
+        if (counts is None and not node.args) or (counts is not None and len(node.args) not in counts):
+            return f"'{node.func.id}' with {len(node.args)} arguments"
+        return next((reason for arg in node.args if (reason := _unsupported(arg, variables))), None)
+
+    return type(node).__name__.lower()
+
+
+def _sum_terms(node: ast.AST) -> list[ast.AST]:
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+        return _sum_terms(node.left) + _sum_terms(node.right)
+    return [node]
+
+
+def _is_each_variable_once(nodes: list[ast.AST], variables: tuple[str, ...]) -> bool:
+    names = [node.id for node in nodes if isinstance(node, ast.Name)]
+    return len(names) == len(nodes) and sorted(names) == sorted(variables)
+
+
+def _native_type(body: ast.AST, variables: tuple[str, ...]) -> str | None:
+    """Returns the native driver type computing the same value as the expression, if any."""
+    if not variables:
+        return None
+
+    if isinstance(body, ast.Name) and variables == (body.id,):
+        return 'AVERAGE'
+
+    if isinstance(body, ast.Call) and isinstance(body.func, ast.Name) and body.func.id in ('min', 'max'):
+        if not body.keywords and _is_each_variable_once(body.args, variables):
+            return body.func.id.upper()
+
+    if len(variables) > 1 and _is_each_variable_once(_sum_terms(body), variables):
+        return 'SUM'
+
+    if (
+        isinstance(body, ast.BinOp) and isinstance(body.op, ast.Div)
+        and isinstance(body.right, ast.Constant) and not isinstance(body.right.value, bool)
+        and body.right.value == len(variables)
+        and _is_each_variable_once(_sum_terms(body.left), variables)
+    ):
+        return 'AVERAGE'
+
+    return None
+
+
+@lru_cache(maxsize=1024)
+def compile_expression(driver_type: str, expression: str | None, variables: tuple[str, ...], use_self: bool = False) -> CompiledExpression:
+    """Compiles a driver definition to the fastest equivalent Blender can evaluate."""
+    if driver_type != 'SCRIPTED':
+        return CompiledExpression(driver_type, expression, True)
+
+    if use_self:
+        return CompiledExpression(driver_type, expression, False, "uses 'self'")
+
+    invalid = [name for name in variables if not name.isidentifier() or name in SIMPLE_CONSTANTS]
+    if invalid:
+        return CompiledExpression(driver_type, expression, False, f"invalid variable names: {', '.join(invalid)}")
+
+    try:
+        tree = ast.parse((expression or "").strip(), mode="eval")
+    except SyntaxError as e:
+        return CompiledExpression(driver_type, expression, False, f"syntax error: {e.msg}")
+
+    names = frozenset(variables)
+    original = ast.unparse(tree)
+    tree = ast.fix_missing_locations(_PowToCall().visit(tree))
+    reason = _unsupported(tree, names)
+    if reason:
+        return CompiledExpression(driver_type, expression, False, reason)
+
+    native_type = _native_type(tree.body, variables)
+    if native_type:
+        return CompiledExpression(native_type, expression, True, rewritten=True)
+
+    simplified = ast.unparse(tree)
+    if simplified != original:
+        return CompiledExpression(driver_type, simplified, True, rewritten=True)
+    return CompiledExpression(driver_type, expression, True)
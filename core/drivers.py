@@ -3,6 +3,9 @@ from abc import ABC, abstractmethod
 from typing import Literal, ClassVar
 import bpy
 
+from . import driver_expressions
+from . import profiler
+
 DriverType = Literal['AVERAGE', 'SUM', 'SCRIPTED', 'MIN', 'MAX']
 VariableType = Literal['SINGLE_PROP', 'TRANSFORMS', 'ROTATION_DIFF', 'LOC_DIFF', 'CONTEXT_PROP']
 
@@ -30,6 +33,11 @@ class Driver():
     use_self: bool | None = None
     variables: list[DriverVariable] = field(default=None, kw_only=True)
     
+    def compile(self) -> driver_expressions.CompiledExpression:
+        """Returns the driver type and expression to write, rewritten for Blender's simple expression evaluator where possible."""
+        names = tuple(variable.name for variable in self.variables or [])
+        return driver_expressions.compile_expression(self.type, self.expression, names, bool(self.use_self))
+
     def apply(self, target: bpy.types.PoseBone | bpy.types.Object | bpy.types.Constraint, property: tuple[str, int] | str, armature: bpy.types.Object) -> None:
         """Applies the driver to the given bone."""
         if isinstance(property, str):
@@ -37,8 +45,10 @@ class Driver():
         else:
             driver = target.driver_add(property[0], property[1])
 
-        if self.expression is not None:
-            driver.driver.expression = self.expression
+        compiled = self.compile()
+        driver.driver.type = compiled.type
+        if compiled.expression is not None:
+            driver.driver.expression = compiled.expression
 
         if self.use_self is not None:
             driver.driver.use_self = self.use_self
@@ -49,6 +59,78 @@ class Driver():
         for variable in self.variables:
             variable.add(driver, armature)
 
+        if compiled.rewritten:
+            profiler.count("drivers_rewritten")
+        if not compiled.simple:
+            profiler.count("drivers_slow_path")
+
+
+@dataclass(frozen=True)
+class DriverAudit:
+    """A driver reading an armature that Blender evaluates with the Python interpreter."""
+    owner: str
+    data_path: str
+    array_index: int
+    expression: str
+    reason: str
+    suggestion: str | None = None
+
+
+def _reads(fcurve: bpy.types.FCurve, ids: tuple[bpy.types.ID, ...]) -> bool:
+    return any(
+        target.id is not None and any(target.id == id_block for id_block in ids)
+        for variable in fcurve.driver.variables
+        for target in variable.targets
+    )
+
+
+def _animated_ids(obj: bpy.types.Object) -> list[bpy.types.ID]:
+    ids = [obj]
+    if obj.data is not None:
+        ids.append(obj.data)
+        shape_keys = getattr(obj.data, 'shape_keys', None)
+        if shape_keys is not None:
+            ids.append(shape_keys)
+    return ids
+
+
+def audit(armature: bpy.types.Object) -> list[DriverAudit]:
+    """Returns every SCRIPTED driver on the armature, or reading it, that is not a simple expression."""
+    rig_ids = (armature, armature.data)
+    results: list[DriverAudit] = []
+    seen: set[int] = set()
+
+    for obj in bpy.data.objects:
+        for id_block in _animated_ids(obj):
+            pointer = id_block.as_pointer()
+            if pointer in seen or id_block.animation_data is None:
+                continue
+            seen.add(pointer)
+            owned = any(id_block == rig_id for rig_id in rig_ids)
+
+            for fcurve in id_block.animation_data.drivers:
+                driver = fcurve.driver
+                if driver.type != 'SCRIPTED' or not (owned or _reads(fcurve, rig_ids)):
+                    continue
+
+                names = tuple(variable.name for variable in driver.variables)
+                compiled = driver_expressions.compile_expression(driver.type, driver.expression, names, driver.use_self)
+                if getattr(driver, 'is_simple_expression', compiled.simple and compiled.expression == driver.expression):
+                    continue
+
+                suggestion = None
+                if compiled.simple:
+                    suggestion = compiled.type if compiled.type != 'SCRIPTED' else compiled.expression
+                results.append(DriverAudit(
+                    owner=id_block.name,
+                    data_path=fcurve.data_path,
+                    array_index=fcurve.array_index,
+                    expression=driver.expression,
+                    reason=compiled.reason or "rejected by Blender's simple expression parser",
+                    suggestion=suggestion,
+                ))
+    return results
+
 ####################################################
 # Driver Variables 
 ####################################################
@@ -0,0 +1,398 @@
+"""Compiled execution plans for rig modules.
+
+Templates are trees of RigModule -> BoneGroup -> BoneGenerator dataclasses shared
+as singletons. Compiling flattens a module once into immutable tuples of generator
+steps, static operations, transform links and its bone inputs, so generation
+iterates those instead of re-deriving and copying the template structure on every
+run. Compiled modules are cached by module identity; reloading the add-on rebuilds
+the module registry with new objects, which invalidates the cache.
+
+Compiled groups run inside an EditSession, which keeps the armature in edit mode
+across any number of groups and modules and defers object mode work until it ends.
+"""
+
+import bpy
+
+from dataclasses import dataclass, fields
+from typing import TYPE_CHECKING, Callable
+
+from . import bone_geometry
+from . import profiler
+from .operations import ABOperation, PoseOperations, PoseOperationsStack, TransformLink
+
+if TYPE_CHECKING:
+    from . import rigify
+    from .bone_generators import BoneGenerator
+    from .shared import BoneGroup, RigModule
+
+# Generation data key holding the template's LinkMode ("LINK" or "DIRECT").
+LINK_MODE_KEY = "link_mode"
+
+
+class EditSession:
+    """Keeps an armature in edit mode across bone groups, deferring object mode work until the session ends."""
+
+    def __init__(self, armature: bpy.types.Object):
+        self.armature = armature
+        self.linked: list[str] = []
+        self.created: list[str] = []
+        self.edited: list[str] = []  # Existing bones changed by the generators
+
+    def link(self, bone_name: str) -> None:
+        """Marks a bone as linked once the session is back in object mode."""
+        self.linked.append(bone_name)
+
+    def __enter__(self) -> 'EditSession':
+        bpy.context.view_layer.objects.active = self.armature
+        profiler.mode_set('EDIT')
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        profiler.mode_set('OBJECT')
+        # Custom properties set on edit bones do not reliably survive leaving edit mode.
+        bones = self.armature.data.bones
+        for bone_name in self.linked:
+            bone = bones.get(bone_name)
+            if bone:
+                bone["ab_linked"] = True
+        return False
+
+
+@dataclass(frozen=True)
+class GeneratorStep:
+    """One bone generator with its template state captured at compile time."""
+    generator: 'BoneGenerator'
+    template_operations: list[ABOperation]
+    static_operations: tuple[ABOperation, ...]
+    req_bones: tuple[str, ...]
+    data_key: str | None
+    is_optional: bool
+    pose_operations: PoseOperations | None
+
+    def generate(self, armature: bpy.types.Object, data: dict | None) -> tuple[list[str] | None, list[ABOperation]]:
+        """Runs the generator and returns its bones and the operations it emitted during this run only."""
+        return self._isolated(self.generator.generate, armature, data=data)
+
+    def apply(self, armature: bpy.types.Object, geometry: bone_geometry.BoneGeometry) -> tuple[list[str] | None, list[ABOperation]]:
+        """Writes back geometry solved for the generator, like generate."""
+        return self._isolated(self.generator.apply_geometry, armature, geometry)
+
+    def _isolated(self, function: Callable, *args, **kwargs) -> tuple[list[str] | None, list[ABOperation]]:
+        generator = self.generator
+        runtime_operations: list[ABOperation] = []
+        generator.operations = runtime_operations
+        try:
+            new_bones = function(*args, **kwargs)
+        finally:
+            generator.operations = self.template_operations
+        return new_bones, runtime_operations
+
+
+@dataclass(frozen=True)
+class CompiledBoneGroup:
+    name: str
+    steps: tuple[GeneratorStep, ...]
+    operations: tuple[ABOperation, ...]
+    transform_links: tuple[TransformLink, ...]
+
+    def check(self, armature: bpy.types.Object, data: dict | None = None) -> bool:
+        """Check if all required bones exist in the armature for this bone group."""
+        future_bones: list[str] = []
+        # Data bones are not updated until edit mode ends, so inside a session the edit bones are authoritative.
+        bones = armature.data.edit_bones if armature.mode == 'EDIT' else armature.data.bones
+
+        for step in self.steps:
+            future_bones.append(step.generator.name)
+            if step.data_key is not None:
+                data_value = data.get(step.data_key) if data else None
+                if data_value is None:
+                    print(f"[AetherBlend] Error Code: DEMON")
+                    return False
+            for req_bone in step.req_bones:
+                # Check if bone will be created in this group or already exists
+                if req_bone not in future_bones and req_bone not in bones:
+                    if step.is_optional:
+                        future_bones.remove(step.generator.name)
+                        break
+                    return False
+        return True
+
+    def generate(self, armature: bpy.types.Object, data: dict | None = None, edited: list[str] | None = None) -> tuple[list[str], list[ABOperation]]:
+        """Generate all bones in this group, adding the existing bones the generators changed to edited."""
+        generated_bones: list[str] = []
+        generated_operations: list[ABOperation] = list(self.operations)
+
+        for step, new_bones, runtime_operations in self._run_steps(armature, data):
+            generated_operations.extend(step.static_operations)
+            generated_operations.extend(runtime_operations)
+            if new_bones:
+                generated_bones.extend(new_bones)
+                if edited is not None:
+                    edited.extend(step.generator.edited_bones())
+
+        return generated_bones, generated_operations
+
+    def _run_steps(self, armature: bpy.types.Object, data: dict | None):
+        """Runs the steps in order, solving consecutive geometry requests in one batch.
+
+        A batch is flushed before a step that reads a bone written by the batch, and
+        before steps without a geometry request, so every step sees the same edit
+        bones as it would when run one by one.
+        """
+        edit_bones = armature.data.edit_bones
+        skeleton: bone_geometry.Skeleton | None = None
+        pending: list[tuple[GeneratorStep, bone_geometry.BoneRequest]] = []
+        written: set[str] = set()
+
+        def flush():
+            geometries = bone_geometry.solve(skeleton, [request for _, request in pending], armature.matrix_world.to_3x3())
+            for (step, _), geometry in zip(pending, geometries):
+                if geometry is None:
+                    yield step, *step.generate(armature, data)
+                else:
+                    yield step, *step.apply(armature, geometry)
+            profiler.count("batched_bones", len(pending))
+            pending.clear()
+            written.clear()
+
+        for step in self.steps:
+            request = step.generator.geometry_request()
+            if request is not None and pending and written.intersection(request.inputs):
+                yield from flush()
+                skeleton = None
+
+            if request is not None:
+                if skeleton is None:
+                    skeleton = bone_geometry.Skeleton.from_edit_bones(edit_bones)
+                if all(name in skeleton for name in request.inputs):
+                    pending.append((step, request))
+                    written.update(request.outputs)
+                    continue
+
+            # Generators without a request, or with missing inputs, run on their own and report their own errors.
+            if pending:
+                yield from flush()
+            skeleton = None
+            yield step, *step.generate(armature, data)
+
+        if pending:
+            yield from flush()
+
+    def execute(
+        self,
+        armature: bpy.types.Object,
+        data: dict | None = None,
+        session: EditSession | None = None,
+    ) -> tuple[list[str], dict[str, list[PoseOperations]], list[ABOperation]]:
+        """Execute the full generation process for this bone group, in its own edit session unless one is given."""
+        if session is None:
+            with EditSession(armature) as session:
+                return self.execute(armature, data, session=session)
+
+        if not self.check(armature, data=data):
+            print(f"[AetherBlend] BoneGroup '{self.name}' check failed - missing required bones")
+            return [], {}, []
+
+        generated_bones, generated_operations = self.generate(armature, data=data, edited=session.edited)
+        profiler.count("bones_created", len(generated_bones))
+        session.created.extend(generated_bones)
+
+        pose_operations_dict: dict[str, list[PoseOperations]] = {}
+
+        direct = (data or {}).get(LINK_MODE_KEY) == "DIRECT"
+        for link_item in self.transform_links:
+            session.link(link_item.bone)
+            generated_operations.extend(link_item.to_ABOperation(direct=direct and link_item.can_link_directly(armature)))
+
+        for step in self.steps:
+            generator = step.generator
+            for bone_name, operations in generator.get_dynamic_pose_operations().items():
+                pose_operations_dict.setdefault(bone_name, []).extend(operations)
+
+            for link_item in generator.get_dynamic_transform_links():
+                session.link(link_item.bone)
+                if direct and link_item.can_link_directly(armature):
+                    generated_operations.extend(link_item.to_ABOperation(direct=True))
+                    continue
+                for bone_name, operations in link_item.to_pose_operations().items():
+                    pose_operations_dict.setdefault(bone_name, []).extend(operations)
+
+            if step.pose_operations:
+                pose_operations_dict.setdefault(generator.name, []).append(step.pose_operations)
+
+        return generated_bones, pose_operations_dict, generated_operations
+
+
+@dataclass(frozen=True)
+class CompiledModule:
+    module: 'RigModule'
+    key: str
+    groups: tuple[CompiledBoneGroup, ...]
+    operations: tuple[ABOperation, ...]
+    ui_collections: 'rigify.settings.UI_Collections | None'
+    ui_flags: tuple[str, ...]
+    input_bones: frozenset[str]
+    input_patterns: tuple[str, ...]
+
+    @property
+    def name(self) -> str:
+        return self.module.name
+
+    @property
+    def type(self) -> str:
+        return self.module.type
+
+    def execute(
+        self,
+        armature: bpy.types.Object,
+        data: dict,
+        profile_key: str | None = None,
+        session: EditSession | None = None,
+    ) -> tuple[bool, PoseOperationsStack, 'rigify.settings.UI_Collections | None', list[ABOperation]]:
+        """Execute every bone group of the module, in its own edit session unless one is given."""
+        if session is None:
+            with EditSession(armature) as session:
+                return self.execute(armature, data, profile_key=profile_key, session=session)
+
+        pose_op_stack = PoseOperationsStack()
+        module_operations: list[ABOperation] = list(self.operations)
+        integrity = self.type in ("Patch", "UI-Addon")
+        group_prefix = profile_key or self.key
+
+        for group in self.groups:
+            with profiler.measure("bone_groups", f"{group_prefix}/{group.name}"):
+                bones, pose_ops, operations = group.execute(armature, data, session=session)
+
+            if not bones and not pose_ops:
+                continue
+
+            integrity = True
+            pose_op_stack.merge(PoseOperationsStack(stack=pose_ops))
+            module_operations.extend(operations)
+
+        return integrity, pose_op_stack, self.ui_collections, module_operations
+
+
+@dataclass(frozen=True)
+class CompiledTemplate:
+    """Compiled module priority groups of one template / module key list."""
+    keys: tuple[tuple[str, ...], ...]
+    groups: tuple[tuple[CompiledModule, ...], ...]
+
+
+# Caches are keyed by module key and bone group name. Each entry keeps the object it
+# was compiled from and is only reused for that same object, so reloaded or
+# replaced definitions under the same name are compiled again.
+_GROUP_CACHE: dict[tuple[str, str], tuple['BoneGroup', CompiledBoneGroup]] = {}
+_MODULE_CACHE: dict[str, tuple['RigModule', CompiledModule]] = {}
+_TEMPLATE_CACHE: dict[tuple[tuple[str, ...], ...], tuple[tuple['RigModule', ...], CompiledTemplate]] = {}
+_TEMPLATE_CACHE_SIZE = 16
+
+
+def _string_fields(item) -> set[str]:
+    values: set[str] = set()
+    for item_field in fields(item):
+        if item_field.name in ("name", "data_key"):
+            continue
+        value = getattr(item, item_field.name)
+        if isinstance(value, str):
+            values.add(value)
+        elif isinstance(value, (list, tuple)):
+            values.update(entry for entry in value if isinstance(entry, str))
+    return values
+
+
+def _compile_step(generator: 'BoneGenerator') -> GeneratorStep:
+    return GeneratorStep(
+        generator=generator,
+        template_operations=generator.operations,
+        static_operations=tuple(generator.operations),
+        req_bones=tuple(generator.req_bones or ()),
+        data_key=generator.data_key,
+        is_optional=generator.is_optional,
+        pose_operations=generator.pose_operations,
+    )
+
+
+def compile_bone_group(bone_group: 'BoneGroup', module_key: str = "") -> CompiledBoneGroup:
+    """Returns the cached compiled form of a bone group of the module with the given key."""
+    cache_key = (module_key, bone_group.name)
+    cached = _GROUP_CACHE.get(cache_key)
+    if cached and cached[0] is bone_group:
+        return cached[1]
+
+    compiled = CompiledBoneGroup(
+        name=bone_group.name,
+        steps=tuple(_compile_step(generator) for generator in bone_group.generators),
+        operations=tuple(bone_group.operations),
+        transform_links=tuple(bone_group.transform_link),
+    )
+    _GROUP_CACHE[cache_key] = (bone_group, compiled)
+    return compiled
+
+
+def compile_module(module: 'RigModule', key: str = "") -> CompiledModule:
+    """Returns the cached compiled form of a rig module."""
+    key = key or module.name
+    cached = _MODULE_CACHE.get(key)
+    if cached and cached[0] is module:
+        return cached[1]
+
+    # Every string field of generators and transform links is treated as a potential bone
+    # reference, which over-approximates a module's inputs but never misses one.
+    input_bones: set[str] = set()
+    input_patterns: list[str] = []
+    for bone_group in module.bone_groups:
+        for generator in bone_group.generators:
+            input_bones |= _string_fields(generator)
+            pattern = getattr(generator, "pattern", None)
+            if pattern:
+                input_patterns.append(pattern)
+        for link in bone_group.transform_link:
+            input_bones |= _string_fields(link)
+
+    compiled = CompiledModule(
+        module=module,
+        key=key,
+        groups=tuple(compile_bone_group(bone_group, key) for bone_group in module.bone_groups),
+        operations=tuple(module.operations),
+        ui_collections=module.ui_collections,
+        ui_flags=tuple(module.ui_flags),
+        input_bones=frozenset(input_bones),
+        input_patterns=tuple(input_patterns),
+    )
+    _MODULE_CACHE[key] = (module, compiled)
+    return compiled
+
+
+def compile_template(
+    modules: 'list[list[RigModule]]',
+    module_key: Callable[['RigModule'], str] | None = None,
+) -> CompiledTemplate:
+    """Returns the cached compiled plan for a list of module priority groups."""
+    keys = [[(module_key(module) if module_key else "") or module.name for module in group] for group in modules]
+    cache_key = tuple(tuple(group) for group in keys)
+    flat_modules = tuple(module for group in modules for module in group)
+    cached = _TEMPLATE_CACHE.get(cache_key)
+    if cached and len(cached[0]) == len(flat_modules) and all(a is b for a, b in zip(cached[0], flat_modules)):
+        return cached[1]
+
+    groups = tuple(
+        tuple(compile_module(module, key) for module, key in zip(group, group_keys))
+        for group, group_keys in zip(modules, keys)
+    )
+    compiled = CompiledTemplate(
+        keys=tuple(tuple(module.key for module in group) for group in groups),
+        groups=groups,
+    )
+
+    if len(_TEMPLATE_CACHE) >= _TEMPLATE_CACHE_SIZE:
+        _TEMPLATE_CACHE.clear()
+    _TEMPLATE_CACHE[cache_key] = (flat_modules, compiled)
+    return compiled
+
+
+def clear_cache() -> None:
+    _GROUP_CACHE.clear()
+    _MODULE_CACHE.clear()
+    _TEMPLATE_CACHE.clear()
@@ -0,0 +1,238 @@
+"""Table of the transform links of a generated rig.
+
+Every original bone linked during generation follows a Rigify target, either via a
+LINK- bone and a constraint on the original bone, or (direct links) by being
+parented to the target. The generator stores the complete table on
+aether_rig.link_table so that game support removal, clean-up, link mode switching
+and pose export look links up by bone instead of rescanning constraints.
+
+The stored form is compact: every bone and constraint name is written once in a
+name list and each link is a row of indices into it. The rest matrix of each
+original bone is stored alongside, so bones removed by game support removal can
+still be posed from their target.
+"""
+
+import bpy
+import json
+import mathutils
+
+from dataclasses import dataclass
+from functools import lru_cache
+
+_FORMAT_VERSION = 2
+_READABLE_VERSIONS = (1, 2)  # Version 1 tables have no rest matrices
+_LINK_PREFIX = "LINK-"
+_CONSTRAINT_PREFIX = "AB-LINK"
+
+
+@dataclass(frozen=True)
+class Link:
+    bone: str
+    target: str
+    link_bone: str = ""  # "" for direct links
+    constraint: str = ""  # Constraint following the target; for direct links the one added when switched to the game hierarchy
+    parent: str = ""  # Parent in the game skeleton, "" for root bones
+    rest: tuple[float, ...] = ()  # Armature space rest matrix of the original bone, row by row; () if unknown
+
+    @property
+    def direct(self) -> bool:
+        return not self.link_bone
+
+
+class LinkTable:
+    """Links of one rig, indexed by original bone and by target."""
+
+    def __init__(self, links: list[Link] | None = None):
+        self.links = links or []
+        self._by_bone = {link.bone: link for link in self.links}
+        self._by_target: dict[str, list[Link]] = {}
+        for link in self.links:
+            self._by_target.setdefault(link.target, []).append(link)
+
+    def __len__(self) -> int:
+        return len(self.links)
+
+    def __iter__(self):
+        return iter(self.links)
+
+    def __contains__(self, bone_name: str) -> bool:
+        return bone_name in self._by_bone
+
+    def get(self, bone_name: str) -> Link | None:
+        return self._by_bone.get(bone_name)
+
+    def by_target(self, target: str) -> list[Link]:
+        return self._by_target.get(target, [])
+
+    def targets(self) -> dict[str, str]:
+        """Original bone -> target of every link."""
+        return {link.bone: link.target for link in self.links}
+
+    def direct(self) -> list[Link]:
+        return [link for link in self.links if link.direct]
+
+    def to_json(self) -> str:
+        names: list[str] = []
+        index: dict[str, int] = {}
+
+        def ref(name: str) -> int:
+            if not name:
+                return -1
+            if name not in index:
+                index[name] = len(names)
+                names.append(name)
+            return index[name]
+
+        rows = [[ref(link.bone), ref(link.target), ref(link.link_bone), ref(link.constraint), ref(link.parent)] for link in self.links]
+        rest = [list(link.rest) or None for link in self.links]
+        return json.dumps({"version": _FORMAT_VERSION, "names": names, "links": rows, "rest": rest}, separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, raw: str) -> 'LinkTable':
+        if not raw:
+            return cls()
+        try:
+            data = json.loads(raw)
+        except ValueError:
+            return cls()
+        if not isinstance(data, dict) or data.get("version") not in _READABLE_VERSIONS:
+            return cls()
+
+        names = data.get("names", [])
+        rows = data.get("links", [])
+        rests = data.get("rest") or []
+        if not (
+            isinstance(names, list) and all(isinstance(name, str) for name in names)
+            and isinstance(rows, list) and all(_valid_row(row) for row in rows)
+            and isinstance(rests, list)
+        ):
+            return cls()
+        # Version 1 tables, and rows beyond a short rest list, have no rest matrix.
+        rests = rests + [None] * (len(rows) - len(rests))
+
+        def name(i: int) -> str:
+            return names[i] if 0 <= i < len(names) else ""
+
+        def rest(values) -> tuple[float, ...]:
+            if isinstance(values, list) and len(values) == 16 and all(_is_number(value) for value in values):
+                return tuple(float(value) for value in values)
+            return ()
+
+        return cls([
+            Link(name(b), name(t), name(l), name(c), name(p), rest(values))
+            for (b, t, l, c, p), values in zip(rows, rests)
+        ])
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _valid_row(row) -> bool:
+    """Whether a stored link row has the shape to_json writes: five name indices."""
+    return isinstance(row, list) and len(row) == 5 and all(isinstance(i, int) and not isinstance(i, bool) for i in row)
+
+
+@lru_cache(maxsize=8)
+def _parse(raw: str) -> LinkTable:
+    return LinkTable.from_json(raw)
+
+
+def load(armature: bpy.types.Object) -> LinkTable:
+    """Returns the link table stored on the armature, rebuilt from its constraints for rigs generated without one."""
+    raw = getattr(armature.aether_rig, "link_table", "")
+    if raw:
+        return _parse(raw)
+    return from_constraints(armature)
+
+
+def _rest(bone: bpy.types.Bone) -> tuple[float, ...]:
+    return tuple(round(value, 6) for row in bone.matrix_local for value in row)
+
+
+def rest_matrix(link: Link) -> mathutils.Matrix | None:
+    """Returns the stored rest matrix of the original bone, or None for tables written without one."""
+    if not link.rest:
+        return None
+    return mathutils.Matrix([link.rest[i:i + 4] for i in range(0, 16, 4)])
+
+
+def store(armature: bpy.types.Object, table: LinkTable) -> None:
+    armature.aether_rig.link_table = table.to_json() if len(table) else ""
+
+
+def clear(armature: bpy.types.Object) -> None:
+    armature.aether_rig.link_table = ""
+
+
+def collect(armature: bpy.types.Object, direct_targets: dict[str, str], game_parents: dict[str, str]) -> LinkTable:
+    """Builds the table of a freshly generated rig.
+
+    direct_targets maps the directly linked bones to their targets and game_parents
+    holds the parents of the original bones before Rigify generation.
+    """
+    bones = armature.data.bones
+    links: list[Link] = []
+    for pose_bone in armature.pose.bones:
+        name = pose_bone.name
+        target = direct_targets.get(name)
+        if target:
+            links.append(Link(name, target, constraint=f"{_CONSTRAINT_PREFIX}@{target}", parent=game_parents.get(name, ""), rest=_rest(pose_bone.bone)))
+            continue
+
+        link_bone = bones.get(f"{_LINK_PREFIX}{name}")
+        if link_bone is None or link_bone.parent is None:
+            continue
+        # Custom link constraints keep their own names but always read from the LINK- bone.
+        constraint = next((c for c in pose_bone.constraints if getattr(c, "subtarget", "") == link_bone.name), None)
+        links.append(Link(
+            name,
+            link_bone.parent.name,
+            link_bone=link_bone.name,
+            constraint=constraint.name if constraint else "",
+            parent=game_parents.get(name, ""),
+            rest=_rest(pose_bone.bone),
+        ))
+    return LinkTable(links)
+
+
+def is_full_transform(armature: bpy.types.Object, link: Link) -> bool:
+    """Whether the original bone copies the whole transform of its target.
+
+    True for direct links and for links followed through an AB-LINK Copy Transforms
+    constraint; links made with custom constraints (Copy Location, ...) only copy part.
+    """
+    if link.direct:
+        return True
+    pose_bone = armature.pose.bones.get(link.bone)
+    constraint = pose_bone.constraints.get(link.constraint) if pose_bone and link.constraint else None
+    return (
+        constraint is not None
+        and constraint.type == 'COPY_TRANSFORMS'
+        and constraint.name.startswith(_CONSTRAINT_PREFIX)
+        and constraint.target is not None
+    )
+
+
+def from_constraints(armature: bpy.types.Object) -> LinkTable:
+    """Rebuilds the links of deform bones from their AB-LINK constraints."""
+    bones = armature.data.bones
+    links: list[Link] = []
+    for pose_bone in armature.pose.bones:
+        if not pose_bone.bone.use_deform:
+            continue
+        constraint = next((c for c in pose_bone.constraints if c.type == 'COPY_TRANSFORMS' and c.name.startswith(_CONSTRAINT_PREFIX)), None)
+        if constraint is None or not (constraint.target and constraint.subtarget):
+            continue
+
+        parent = pose_bone.bone.parent.name if pose_bone.bone.parent else ""
+        subtarget = bones.get(constraint.subtarget)
+        if subtarget is None:
+            continue
+        if subtarget.name.startswith(_LINK_PREFIX):
+            if subtarget.parent:
+                links.append(Link(pose_bone.name, subtarget.parent.name, subtarget.name, constraint.name, parent, _rest(pose_bone.bone)))
+        else:
+            # Direct links switched to the game hierarchy follow the Rigify bone itself.
+            links.append(Link(pose_bone.name, subtarget.name, constraint=constraint.name, parent=parent, rest=_rest(pose_bone.bone)))
+    return LinkTable(links)
@@ -0,0 +1,341 @@
+"""Content-addressed cache of generated meta rigs.
+
+For a given source skeleton, skinned meshes, module list and color sets the meta
+rig generation is deterministic. MetaRigCache stores the finished meta rig in a
+.blend library next to a JSON payload holding the operation stack (as plain data,
+see plain_data), the module results and UI state that rigify generation still
+needs, keyed by a hash of those inputs and of the add-on's source code.
+"""
+
+import bpy
+import hashlib
+import json
+import time
+from array import array
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+from . import plain_data
+from . import profiler
+from .operations import ABOperation, ABOperationStack
+
+_INDEX_FILE = "index.json"
+_PRECISION = 5
+_ADDON_DIR = Path(__file__).resolve().parent.parent
+
+
+@dataclass
+class CachedMetaRig:
+    """Meta rig and generation state restored from a cache entry."""
+    meta_rig: bpy.types.Object
+    operation_stack: ABOperationStack
+    ui_flags: list[str]
+    visible_collections: list[str]
+    module_results: str
+
+
+def _rounded(values) -> tuple[float, ...]:
+    return tuple(round(value, _PRECISION) for value in values)
+
+
+@lru_cache(maxsize=1)
+def sources_digest() -> str:
+    """Hashes the add-on's Python sources, so entries of a changed module or template are never reused.
+
+    The sources loaded in a session do not change until the add-on is reloaded,
+    which also clears this cache.
+    """
+    digest = hashlib.sha256()
+    for path in sorted(_ADDON_DIR.rglob("*.py")):
+        if "__pycache__" in path.parts:
+            continue
+        digest.update(path.relative_to(_ADDON_DIR).as_posix().encode("utf-8"))
+        try:
+            digest.update(path.read_bytes())
+        except OSError:
+            pass
+    return digest.hexdigest()
+
+
+def source_key(armature: bpy.types.Object) -> str:
+    """Hashes the source skeleton and the meshes bound to it."""
+    digest = hashlib.sha256()
+
+    def _update(*values):
+        digest.update(repr(values).encode("utf-8"))
+
+    _update(profiler.addon_version(), bpy.app.version_string)
+    _update(tuple(_rounded(row) for row in armature.matrix_world))
+
+    for bone in sorted(armature.data.bones, key=lambda bone: bone.name):
+        _update(
+            bone.name,
+            bone.parent.name if bone.parent else None,
+            bone.use_connect,
+            bone.use_deform,
+            _rounded(bone.head_local),
+            _rounded(bone.tail_local),
+            # matrix_local carries the bone roll, which data bones do not expose directly.
+            tuple(_rounded(row) for row in bone.matrix_local),
+            sorted(collection.name for collection in bone.collections),
+        )
+
+    # SkinBone generators place bones on skinned vertices, so the bound meshes are part of the input.
+    for mesh in sorted(_bound_meshes(armature), key=lambda obj: obj.name):
+        coordinates = array('f', [0.0]) * (len(mesh.data.vertices) * 3)
+        mesh.data.vertices.foreach_get("co", coordinates)
+        _update(mesh.name, sorted(group.name for group in mesh.vertex_groups), tuple(_rounded(row) for row in mesh.matrix_world))
+        digest.update(coordinates.tobytes())
+
+    return digest.hexdigest()
+
+
+def compute_key(
+    source: str,
+    template: str,
+    module_keys: list[list[str]],
+    color_sets: dict | None,
+    link_mode: str = "LINK",
+) -> str:
+    """Hashes every input that influences the generated meta rig."""
+    digest = hashlib.sha256()
+    digest.update(repr((
+        sources_digest(),
+        source,
+        template,
+        module_keys,
+        sorted((name, repr(color_set)) for name, color_set in (color_sets or {}).items()),
+        link_mode,
+    )).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _bound_meshes(armature: bpy.types.Object) -> list[bpy.types.Object]:
+    return [
+        obj for obj in bpy.data.objects
+        if obj.type == 'MESH' and any(mod.type == 'ARMATURE' and mod.object == armature for mod in obj.modifiers)
+    ]
+
+
+def _has_external_references(meta_rig: bpy.types.Object) -> bool:
+    """Returns True if the meta rig points at data blocks other than itself, which a library write would drag along."""
+    own_ids = {meta_rig, meta_rig.data}
+
+    for pose_bone in meta_rig.pose.bones:
+        if pose_bone.custom_shape is not None:
+            return True
+        for constraint in pose_bone.constraints:
+            target = getattr(constraint, "target", None)
+            if target is not None and target not in own_ids:
+                return True
+
+    animation_data = meta_rig.animation_data
+    if animation_data:
+        for fcurve in animation_data.drivers:
+            for variable in fcurve.driver.variables:
+                for target in variable.targets:
+                    if target.id is not None and target.id not in own_ids:
+                        return True
+
+    return False
+
+
+def _read_payload(data) -> dict:
+    """Checks a payload read from disk and rebuilds its operation stack."""
+    if not isinstance(data, dict):
+        raise plain_data.PlainDataError("payload is not an object")
+    stack = plain_data.decode(data.get("stack"))
+    if not isinstance(stack, dict) or set(stack) - set(ABOperationStack.STACK_KEYS):
+        raise plain_data.PlainDataError("unexpected operation stack")
+    for operations in stack.values():
+        if not isinstance(operations, list) or not all(isinstance(operation, ABOperation) for operation in operations):
+            raise plain_data.PlainDataError("operation stack holds something other than operations")
+
+    ui_flags = data.get("ui_flags")
+    visible_collections = data.get("visible_collections")
+    for names in (ui_flags, visible_collections):
+        if not isinstance(names, list) or not all(isinstance(name, str) for name in names):
+            raise plain_data.PlainDataError("expected a list of names")
+    results = data.get("module_results")
+    if not isinstance(results, str):
+        raise plain_data.PlainDataError("expected module results")
+    return {"stack": stack, "ui_flags": ui_flags, "visible_collections": visible_collections, "module_results": results}
+
+
+class MetaRigCache:
+    """Stores finished meta rigs in a local .blend library with size and age based eviction."""
+
+    def __init__(self, directory: Path, max_megabytes: int = 512, max_age_days: int = 30):
+        self.directory = Path(directory)
+        self.max_bytes = max(0, max_megabytes) * 1024 * 1024
+        self.max_age_seconds = max(0, max_age_days) * 86400
+
+    # ------------------------------
+    # Index
+    # ------------------------------
+    def _index_path(self) -> Path:
+        return self.directory / _INDEX_FILE
+
+    def _load_index(self) -> dict[str, dict]:
+        try:
+            with self._index_path().open("r", encoding="utf-8") as f:
+                index = json.load(f)
+            return index if isinstance(index, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index(self, index: dict[str, dict]) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with self._index_path().open("w", encoding="utf-8") as f:
+            json.dump(index, f, indent=2)
+
+    def _entry_files(self, key: str) -> tuple[Path, Path]:
+        return self.directory / f"{key}.blend", self.directory / f"{key}.json"
+
+    def _remove_entry(self, index: dict[str, dict], key: str) -> None:
+        index.pop(key, None)
+        for path in self._entry_files(key):
+            path.unlink(missing_ok=True)
+        # Payload of entries written before payloads were stored as JSON.
+        (self.directory / f"{key}.pickle").unlink(missing_ok=True)
+
+    # ------------------------------
+    # Public API
+    # ------------------------------
+    def load(self, key: str) -> CachedMetaRig | None:
+        """Appends the cached meta rig for key into the current file, or returns None on a miss."""
+        index = self._load_index()
+        entry = index.get(key)
+        blend_path, payload_path = self._entry_files(key)
+        if not entry or not blend_path.exists() or not payload_path.exists():
+            return None
+
+        try:
+            with payload_path.open("r", encoding="utf-8") as f:
+                payload = _read_payload(json.load(f))
+
+            with bpy.data.libraries.load(str(blend_path), link=False) as (data_from, data_to):
+                if entry["object"] not in data_from.objects:
+                    raise KeyError(entry["object"])
+                data_to.objects = [entry["object"]]
+            meta_rig = data_to.objects[0]
+        except Exception as e:
+            print(f"[AetherBlend] Discarding unreadable meta rig cache entry {key[:12]}: {e}")
+            self._remove_entry(index, key)
+            self._save_index(index)
+            return None
+
+        operation_stack = ABOperationStack(verbose=True)
+        operation_stack.stack.update(payload["stack"])
+
+        entry["last_used"] = time.time()
+        entry["hits"] = entry.get("hits", 0) + 1
+        self._save_index(index)
+
+        return CachedMetaRig(
+            meta_rig=meta_rig,
+            operation_stack=operation_stack,
+            ui_flags=list(payload["ui_flags"]),
+            visible_collections=list(payload["visible_collections"]),
+            module_results=payload["module_results"],
+        )
+
+    def store(
+        self,
+        key: str,
+        template: str,
+        meta_rig: bpy.types.Object,
+        operation_stack: ABOperationStack,
+        ui_flags: list[str],
+        visible_collections: list[bpy.types.BoneCollection],
+        module_results: str,
+    ) -> bool:
+        """Writes a finished meta rig and its generation state to the cache."""
+        if _has_external_references(meta_rig):
+            print(f"[AetherBlend] Meta rig '{meta_rig.name}' references external data; not caching it.")
+            return False
+
+        blend_path, payload_path = self._entry_files(key)
+        try:
+            payload = {
+                "stack": plain_data.encode(operation_stack.stack),
+                "ui_flags": sorted(ui_flags),
+                "visible_collections": [collection.name for collection in visible_collections],
+                "module_results": module_results,
+            }
+        except plain_data.PlainDataError as e:
+            print(f"[AetherBlend] Meta rig '{meta_rig.name}' has operations that cannot be cached: {e}")
+            return False
+
+        target_rig = meta_rig.data.rigify_target_rig
+        parent = meta_rig.parent
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with payload_path.open("w", encoding="utf-8") as f:
+                json.dump(payload, f, separators=(",", ":"))
+
+            # Both are re-targeted to the current source armature on load.
+            meta_rig.data.rigify_target_rig = None
+            meta_rig.parent = None
+            bpy.data.libraries.write(str(blend_path), {meta_rig}, compress=True)
+        except Exception as e:
+            print(f"[AetherBlend] Failed to write meta rig cache entry {key[:12]}: {e}")
+            blend_path.unlink(missing_ok=True)
+            payload_path.unlink(missing_ok=True)
+            return False
+        finally:
+            meta_rig.data.rigify_target_rig = target_rig
+            meta_rig.parent = parent
+
+        now = time.time()
+        index = self._load_index()
+        index[key] = {
+            "template": template,
+            "object": meta_rig.name,
+            "bytes": blend_path.stat().st_size + payload_path.stat().st_size,
+            "created": now,
+            "last_used": now,
+            "hits": 0,
+        }
+        self.evict(index)
+        return True
+
+    def evict(self, index: dict[str, dict] | None = None) -> int:
+        """Removes entries older than the age limit, then least recently used ones until under the size limit."""
+        index = self._load_index() if index is None else index
+        removed = 0
+        now = time.time()
+
+        if self.max_age_seconds:
+            for key in [key for key, entry in index.items() if now - entry.get("last_used", 0) > self.max_age_seconds]:
+                self._remove_entry(index, key)
+                removed += 1
+
+        if self.max_bytes:
+            by_last_use = sorted(index.items(), key=lambda item: item[1].get("last_used", 0))
+            total = sum(entry.get("bytes", 0) for _, entry in by_last_use)
+            for key, entry in by_last_use:
+                if total <= self.max_bytes:
+                    break
+                total -= entry.get("bytes", 0)
+                self._remove_entry(index, key)
+                removed += 1
+
+        self._save_index(index)
+        return removed
+
+    def clear(self) -> int:
+        """Removes every cache entry and returns how many were removed."""
+        index = self._load_index()
+        count = len(index)
+        for key in list(index.keys()):
+            self._remove_entry(index, key)
+        self._save_index(index)
+        return count
+
+    def size_bytes(self) -> int:
+        return sum(entry.get("bytes", 0) for entry in self._load_index().values())
+
+    def entry_count(self) -> int:
+        return len(self._load_index())
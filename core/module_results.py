@@ -0,0 +1,223 @@
+"""Per-module result tracking for incremental meta rig regeneration.
+
+Every module run during meta rig generation is recorded with the edit bones it
+created or changed, the bones it marked as linked and its pose operations and operations,
+stored as plain data (see plain_data) and checked before they are applied. On the
+next generation a module whose key, candidates and inputs are unchanged is
+replayed from its record instead of running its bone generators; only modules
+that are new, changed, or depend on bones of a re-run module execute.
+"""
+
+import bpy
+import json
+import re
+from dataclasses import dataclass, field
+
+from . import plain_data
+from . import profiler
+from .execution_plan import CompiledModule, EditSession
+from .operations import ABOperation, PoseOperations, PoseOperationsStack
+
+_FORMAT_VERSION = 3
+
+# Recorded edit bone field -> accepted types.
+_BONE_SCHEMA = {
+    "name": (str,),
+    "head": (list,),
+    "tail": (list,),
+    "roll": (int, float),
+    "parent": (str, type(None)),
+    "use_connect": (bool,),
+    "use_deform": (bool,),
+}
+
+
+def _is_vector(value) -> bool:
+    return isinstance(value, list) and len(value) == 3 and all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in value)
+
+
+def _is_names(value) -> bool:
+    return isinstance(value, list) and all(isinstance(name, str) for name in value)
+
+
+def _valid_bone(bone_data) -> bool:
+    """Whether a recorded bone matches the shape capture() writes."""
+    return (
+        isinstance(bone_data, dict)
+        and set(bone_data) == set(_BONE_SCHEMA)
+        and all(isinstance(bone_data[key], types) for key, types in _BONE_SCHEMA.items())
+        and not isinstance(bone_data["roll"], bool)
+        and _is_vector(bone_data["head"])
+        and _is_vector(bone_data["tail"])
+    )
+
+
+@dataclass
+class ModuleRecord:
+    """Outcome of one module priority group in a generation run."""
+    candidates: list[str]
+    winner: str | None = None
+    bones: list[dict] = field(default_factory=list)
+    linked: list[str] = field(default_factory=list)
+    payload: dict | None = None
+
+    def bone_names(self) -> set[str]:
+        return {bone["name"] for bone in self.bones}
+
+    def to_dict(self) -> dict:
+        return {
+            "candidates": self.candidates,
+            "winner": self.winner,
+            "bones": self.bones,
+            "linked": self.linked,
+            "payload": self.payload,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'ModuleRecord':
+        """Reads a stored record, raising TypeError if it does not have the shape to_dict writes."""
+        candidates = data.get("candidates", [])
+        winner = data.get("winner")
+        bones = data.get("bones", [])
+        linked = data.get("linked", [])
+        if not (
+            _is_names(candidates)
+            and isinstance(winner, (str, type(None)))
+            and isinstance(bones, list) and all(_valid_bone(bone_data) for bone_data in bones)
+            and _is_names(linked)
+        ):
+            raise TypeError("unexpected module record")
+        return cls(
+            candidates=list(candidates),
+            winner=winner,
+            bones=list(bones),
+            linked=list(linked),
+            payload=data.get("payload") or None,
+        )
+
+
+@dataclass
+class ModuleResults:
+    """Module records of a generation run, keyed by the fingerprint of its source inputs."""
+    fingerprint: str = ""
+    groups: list[ModuleRecord] = field(default_factory=list)
+
+    def to_json(self) -> str:
+        return json.dumps({
+            "version": _FORMAT_VERSION,
+            "fingerprint": self.fingerprint,
+            "groups": [record.to_dict() for record in self.groups],
+        })
+
+    @classmethod
+    def from_json(cls, raw: str) -> 'ModuleResults':
+        if not raw:
+            return cls()
+        try:
+            data = json.loads(raw)
+        except ValueError:
+            return cls()
+        if not isinstance(data, dict) or data.get("version") != _FORMAT_VERSION:
+            return cls()
+        try:
+            return cls(
+                fingerprint=str(data.get("fingerprint", "")),
+                groups=[ModuleRecord.from_dict(record) for record in data.get("groups", [])],
+            )
+        except (AttributeError, TypeError):
+            return cls()
+
+
+def depends_on(module: CompiledModule, bone_names: set[str]) -> bool:
+    """Returns True if the module reads any of the given bones."""
+    if not bone_names:
+        return False
+    if module.input_bones & bone_names:
+        return True
+    return any(re.match(pattern, bone_name) for pattern in module.input_patterns for bone_name in bone_names)
+
+
+def _read_payload(payload) -> tuple[dict[str, list[PoseOperations]], list[ABOperation]]:
+    """Rebuilds the recorded operations, raising PlainDataError if they are not what capture() stored."""
+    if not isinstance(payload, dict) or set(payload) != {"pose_operations", "operations"}:
+        raise plain_data.PlainDataError("unexpected payload")
+    stack = plain_data.decode(payload["pose_operations"])
+    operations = plain_data.decode(payload["operations"])
+    if not isinstance(stack, dict) or not all(
+        isinstance(entries, list) and all(isinstance(entry, PoseOperations) for entry in entries)
+        for entries in stack.values()
+    ):
+        raise plain_data.PlainDataError("pose operations hold something other than PoseOperations")
+    if not isinstance(operations, list) or not all(isinstance(operation, ABOperation) for operation in operations):
+        raise plain_data.PlainDataError("operations hold something other than operations")
+    return stack, operations
+
+
+def capture(
+    armature: bpy.types.Object,
+    bones: list[str],
+    linked: list[str],
+    record: ModuleRecord,
+    pose_ops: PoseOperationsStack,
+    operations: list[ABOperation],
+) -> None:
+    """Stores the edit bones a module created or changed, the bones it linked and its operations on the record."""
+    edit_bones = armature.data.edit_bones
+    for name in dict.fromkeys(bones):
+        edit_bone = edit_bones.get(name)
+        if edit_bone is None:
+            continue
+        record.bones.append({
+            "name": edit_bone.name,
+            "head": list(edit_bone.head),
+            "tail": list(edit_bone.tail),
+            "roll": edit_bone.roll,
+            "parent": edit_bone.parent.name if edit_bone.parent else None,
+            "use_connect": edit_bone.use_connect,
+            "use_deform": edit_bone.use_deform,
+        })
+
+    record.linked = sorted(set(linked))
+    try:
+        record.payload = {
+            "pose_operations": plain_data.encode(pose_ops.stack),
+            "operations": plain_data.encode(operations),
+        }
+    except plain_data.PlainDataError as e:
+        # Operations that hold scene data cannot be stored; the module simply runs again next time.
+        print(f"[AetherBlend] Module result '{record.winner}' is not reusable: {e}")
+        record.payload = None
+
+
+def replay(armature: bpy.types.Object, record: ModuleRecord, session: EditSession) -> tuple[PoseOperationsStack, list[ABOperation]] | None:
+    """Recreates the recorded bones, or restores the recorded state of existing ones, and returns the recorded operations."""
+    if not record.payload:
+        return None
+
+    try:
+        stack, operations = _read_payload(record.payload)
+    except plain_data.PlainDataError as e:
+        print(f"[AetherBlend] Could not restore module result '{record.winner}': {e}")
+        return None
+
+    edit_bones = armature.data.edit_bones
+    for bone_data in record.bones:
+        edit_bone = edit_bones.get(bone_data["name"]) or edit_bones.new(bone_data["name"])
+        edit_bone.head = bone_data["head"]
+        edit_bone.tail = bone_data["tail"]
+        edit_bone.roll = bone_data["roll"]
+        edit_bone.use_deform = bone_data["use_deform"]
+
+    # Parents are assigned in a second pass because a recorded bone may parent to one recorded after it.
+    for bone_data in record.bones:
+        edit_bone = edit_bones[bone_data["name"]]
+        parent = edit_bones.get(bone_data["parent"]) if bone_data["parent"] else None
+        edit_bone.parent = parent
+        edit_bone.use_connect = bone_data["use_connect"] if parent else False
+
+    profiler.count("bones_created", len(record.bones))
+
+    for bone_name in record.linked:
+        session.link(bone_name)
+
+    return PoseOperationsStack(stack=stack), operations
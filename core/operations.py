@@ -1,6 +1,8 @@
 import bpy
+import heapq
 import math
 import mathutils
+import time
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
@@ -10,13 +12,16 @@ from .drivers import Driver
 from .custom_properties import CustomProperty
 
 from .constraints import Constraint, CopyTransformsConstraint
+from . import profiler
 from . import rigify
+from . import widgets
 from .. import utils
 
 Mode = Literal["POSE", "EDIT"]
 Time = Literal["Pre", "Post"]
+LinkMode = Literal["LINK", "DIRECT"]
 
-_WGTS = "WGTS"
+_DIRECT_LINK_TOLERANCE = 1e-4
 
 @dataclass
 class PoseOperations:
@@ -79,35 +84,104 @@ class PoseOperationsStack:
             else:
                 print(f"[AetherBlend] PoseOperationsStack: Bone '{bone_name}' not found in armature.")
 
+def _current_mode() -> str:
+    """Returns the current context mode collapsed to POSE/EDIT/OBJECT."""
+    current_mode = bpy.context.mode.upper()
+    if current_mode.startswith("EDIT"):
+        return "EDIT"
+    if current_mode.startswith("POSE"):
+        return "POSE"
+    return current_mode
+
+
+def _ensure_mode(mode: Mode) -> bool:
+    """Switches to the given mode if necessary. Returns False if the switch failed."""
+    if _current_mode() == mode:
+        return True
+    try:
+        bpy.ops.object.mode_set(mode=mode)
+        profiler.count("mode_switches")
+        return True
+    except Exception as e:
+        print(f"[AetherBlend] Error switching to {mode} mode: {e}")
+        return False
+
+
+class BoneTable:
+    """Name to bone lookup shared by every operation of one scheduled batch.
+
+    Pose tables hold pose bones, edit tables hold edit bones. Each name is
+    resolved at most once and missing bones are only reported once per batch.
+    """
+
+    def __init__(self, armature: bpy.types.Object, mode: Mode):
+        self.armature = armature
+        self.mode = mode
+        self._collection = armature.data.edit_bones if mode == "EDIT" else armature.pose.bones
+        self._bones: dict[str, object | None] = {}
+        self._reported: set[str] = set()
+
+    def resolve(self, bone_names) -> None:
+        """Resolves all given bone names into the table."""
+        collection = self._collection
+        bones = self._bones
+        for bone_name in bone_names:
+            if bone_name and bone_name not in bones:
+                bones[bone_name] = collection.get(bone_name)
+
+    def get(self, bone_name: str, report: bool = True):
+        """Returns the resolved bone, or None if it does not exist in the armature."""
+        try:
+            bone = self._bones[bone_name]
+        except KeyError:
+            bone = self._bones[bone_name] = self._collection.get(bone_name)
+
+        if bone is None and report and bone_name not in self._reported:
+            self._reported.add(bone_name)
+            kind = "Edit" if self.mode == "EDIT" else "Pose"
+            print(f"[AetherBlend] {kind} bone '{bone_name}' not found in armature '{self.armature.name}'.")
+        return bone
+
+    @property
+    def resolved_count(self) -> int:
+        return sum(1 for bone in self._bones.values() if bone is not None)
+
+    @property
+    def missing_count(self) -> int:
+        return sum(1 for bone in self._bones.values() if bone is None)
+
 @dataclass()
 class ABOperation(ABC):
     mode: ClassVar[Mode] = "POSE"
+    batch_order: ClassVar[int] = 100
     time: Time = field(default="Pre", kw_only=True)
 
     @abstractmethod
-    def apply(self, armature: bpy.types.Object):
+    def apply(self, armature: bpy.types.Object, data_dict: dict | None = None, bones: BoneTable | None = None):
         """Apply the operation to the given bone."""
         raise NotImplementedError
 
-    def _switch_mode(self) -> bool:
+    def target_bones(self) -> tuple[str, ...]:
+        """Returns the bone names this operation looks up, used to prefill batch bone tables."""
+        bone_name = getattr(self, "bone_name", None)
+        return (bone_name,) if bone_name else ()
+
+    def dependency_keys(self) -> tuple[str, ...]:
+        """Returns the keys of the data this operation changes; operations sharing a key keep their declared order."""
+        # Operations without a bone act on the armature itself.
+        return self.target_bones() or ("",)
+
+    def _switch_mode(self, bones: BoneTable | None = None) -> bool:
         """Switches the current mode to the operation's mode if necessary."""
-        current_mode = bpy.context.mode.upper()
-        if current_mode.startswith("EDIT"):
-            current_mode = "EDIT"
-        elif current_mode.startswith("POSE"):
-            current_mode = "POSE"
-
-        if current_mode != self.mode:
-            try:
-                bpy.ops.object.mode_set(mode=self.mode)
-                return True
-            except Exception as e:
-                print(f"[AetherBlend] Error switching to {self.mode} mode: {e}")
-                return False
-        return True
+        if bones is not None and bones.mode == self.mode:
+            # The scheduler already entered this mode for the whole batch.
+            return True
+        return _ensure_mode(self.mode)
 
-    def _getPoseBone(self, bone_name: str, armature: bpy.types.Object) -> bpy.types.PoseBone | None:
+    def _getPoseBone(self, bone_name: str, armature: bpy.types.Object, bones: BoneTable | None = None) -> bpy.types.PoseBone | None:
         """Gets the corresponding pose bone for the given data bone."""
+        if bones is not None and bones.mode == "POSE":
+            return bones.get(bone_name)
         try:
             pose_bone = armature.pose.bones.get(bone_name)
             if not pose_bone:
@@ -118,8 +192,10 @@ class ABOperation(ABC):
             print(f"[AetherBlend] Error getting pose bone for '{bone_name}': {e}")
             return None
 
-    def _getEditBone(self, bone_name: str, armature: bpy.types.Object) -> bpy.types.EditBone | None:
+    def _getEditBone(self, bone_name: str, armature: bpy.types.Object, bones: BoneTable | None = None) -> bpy.types.EditBone | None:
         """Gets the corresponding edit bone for the given data bone."""
+        if bones is not None and bones.mode == "EDIT":
+            return bones.get(bone_name)
         try:
             edit_bone = armature.data.edit_bones.get(bone_name)
             if not edit_bone:
@@ -130,14 +206,122 @@ class ABOperation(ABC):
             print(f"[AetherBlend] Error getting edit bone for '{bone_name}': {e}")
             return None
 
+@dataclass
+class PhaseReport:
+    """Counts and timing of one scheduled operation phase."""
+    phase: str
+    mode: Mode
+    operation_counts: dict[str, int] = field(default_factory=dict)
+    operation_seconds: dict[str, float] = field(default_factory=dict)
+    bones_resolved: int = 0
+    bones_missing: int = 0
+    mode_switched: bool = False
+    seconds: float = 0.0
+
+    @property
+    def operation_total(self) -> int:
+        return sum(self.operation_counts.values())
+
+    def summary(self) -> str:
+        counts = ", ".join(f"{kind} {count}" for kind, count in self.operation_counts.items())
+        return (
+            f"[AetherBlend] {self.phase}: {self.operation_total} operations ({counts}), "
+            f"{self.bones_resolved} bones resolved, {self.bones_missing} missing, {self.seconds:.3f}s"
+        )
+
+def batched(operations: list[ABOperation]) -> list[ABOperation]:
+    """Orders operations by ``batch_order`` without reordering dependent ones.
+
+    Operations that share a dependency key (a bone, or the armature itself) form a
+    chain that always runs in declaration order. Among the operations whose
+    predecessors have all run, the lowest ``batch_order`` goes first, so every kind
+    still runs as one block wherever the chains allow it.
+    """
+    successors: list[list[int]] = [[] for _ in operations]
+    pending = [0] * len(operations)
+    last: dict[str, int] = {}
+    for index, operation in enumerate(operations):
+        for key in set(operation.dependency_keys()):
+            previous = last.get(key)
+            if previous is not None:
+                successors[previous].append(index)
+                pending[index] += 1
+            last[key] = index
+
+    ready = [(operation.batch_order, index) for index, operation in enumerate(operations) if not pending[index]]
+    heapq.heapify(ready)
+    ordered: list[ABOperation] = []
+    while ready:
+        _order, index = heapq.heappop(ready)
+        ordered.append(operations[index])
+        for successor in successors[index]:
+            pending[successor] -= 1
+            if not pending[successor]:
+                heapq.heappush(ready, (operations[successor].batch_order, successor))
+    return ordered
+
+class ABOperationScheduler:
+    """Runs one phase of operations grouped by kind inside a single mode session.
+
+    Operations are ordered by ``batched`` so that every kind runs as one block
+    while the declared order of operations on the same bone (e.g. constraint stack
+    order, or a constraint before the driver on it) is preserved. The phase mode is
+    entered once and every targeted bone is resolved once into a BoneTable shared
+    by the whole batch. Errors propagate to the caller instead of leaving a half
+    built rig behind a successful generation.
+    """
+
+    def __init__(self, verbose: bool = False):
+        self.verbose = verbose
+        self.reports: list[PhaseReport] = []
+
+    def run(self, phase: str, mode: Mode, operations: list[ABOperation], armature: bpy.types.Object, data_dict: dict | None = None) -> PhaseReport:
+        report = PhaseReport(phase=phase, mode=mode)
+        self.reports.append(report)
+        if not operations:
+            return report
+
+        time_start = time.perf_counter()
+        report.mode_switched = _current_mode() != mode
+        if not _ensure_mode(mode):
+            return report
+
+        bones = BoneTable(armature, mode)
+        bones.resolve(bone_name for operation in operations for bone_name in operation.target_bones())
+
+        counts = report.operation_counts
+        seconds = report.operation_seconds
+        for operation in batched(operations):
+            kind = type(operation).__name__
+            operation_start = time.perf_counter()
+            operation.apply(armature, data_dict, bones=bones)
+            counts[kind] = counts.get(kind, 0) + 1
+            seconds[kind] = seconds.get(kind, 0.0) + time.perf_counter() - operation_start
+
+        for kind, count in counts.items():
+            profiler.record("operations", kind, seconds[kind], count)
+
+        report.bones_resolved = bones.resolved_count
+        report.bones_missing = bones.missing_count
+        report.seconds = time.perf_counter() - time_start
+        if self.verbose:
+            print(report.summary())
+        return report
+
 class ABOperationStack:
     STACK_KEYS : ClassVar[tuple[str, ...]] = ('prePOSE', 'postPOSE', 'preEDIT', 'postEDIT')
     generation_data: dict | None = None
 
-    def __init__(self):
+    def __init__(self, verbose: bool = False):
         self.stack: dict[str, list[ABOperation]] = {
             key: [] for key in self.STACK_KEYS
         }
+        self.scheduler = ABOperationScheduler(verbose=verbose)
+
+    @property
+    def reports(self) -> list[PhaseReport]:
+        """Per-phase reports of every phase applied so far."""
+        return self.scheduler.reports
 
     def add_operation(self, operation: ABOperation):
         operationMode = operation.mode
@@ -163,16 +347,24 @@ class ABOperationStack:
             ]
 
     def applyPrePoseOperations(self, armature: bpy.types.Object):
-        self._apply_operations(self.stack['prePOSE'], armature,)
+        self._apply_operations('prePOSE', armature)
 
     def applyPostPoseOperations(self, armature: bpy.types.Object):
-        self._apply_operations(self.stack['postPOSE'], armature)
+        self._apply_operations('postPOSE', armature)
 
     def applyPreEditOperations(self, armature: bpy.types.Object):
-        self._apply_operations(self.stack['preEDIT'], armature)
+        self._apply_operations('preEDIT', armature)
 
     def applyPostEditOperations(self, armature: bpy.types.Object):
-        self._apply_operations(self.stack['postEDIT'], armature)
+        self._apply_operations('postEDIT', armature)
+
+    def applyPreDataOperations(self, armature: bpy.types.Object):
+        """Re-applies the pre operations that target generation data blocks rather than the armature itself."""
+        for key in ('preEDIT', 'prePOSE'):
+            operations = [operation for operation in self.stack[key] if getattr(operation, "data", None) is not None]
+            if operations:
+                mode: Mode = "EDIT" if key.endswith("EDIT") else "POSE"
+                self.scheduler.run(key, mode, operations, armature, self.generation_data)
 
     def _addPoseOperationStack(self, pose_ops_stack: PoseOperationsStack):
         for bone_name, operations in pose_ops_stack.stack.items():
@@ -191,25 +383,27 @@ class ABOperationStack:
                     collection_op = CollectionOperation(bone_name, operation.b_collection)
                     self.add_operation(collection_op)
 
-    def _apply_operations(self, operations: list[ABOperation], armature: bpy.types.Object):
+    def _apply_operations(self, key: str, armature: bpy.types.Object):
+        operations = self.stack[key]
         if not operations:
             return
 
-        for operation in operations:
-            operation.apply(armature, self.generation_data)
+        mode: Mode = "EDIT" if key.endswith("EDIT") else "POSE"
+        self.scheduler.run(key, mode, operations, armature, self.generation_data)
 
 @dataclass()
 class ConstraintOperation(ABOperation):
     mode: ClassVar[Mode] = "POSE"
+    batch_order: ClassVar[int] = 30
 
     bone_name: str
     constraint: Constraint
 
-    def apply(self, armature: bpy.types.Object, data_dict: dict | None = None):
+    def apply(self, armature: bpy.types.Object, data_dict: dict | None = None, bones: BoneTable | None = None):
         """Applies the constraint operation to the given pose bone."""
-        if not self._switch_mode():
+        if not self._switch_mode(bones):
             return
-        poseBone = self._getPoseBone(self.bone_name, armature)
+        poseBone = self._getPoseBone(self.bone_name, armature, bones)
         if not poseBone:
             return
         try:
@@ -220,15 +414,16 @@ class ConstraintOperation(ABOperation):
 @dataclass()
 class RigifyTypeOperation(ABOperation):
     mode: ClassVar[Mode] = "POSE"
+    batch_order: ClassVar[int] = 20
 
     bone_name: str
     rigify_type: rigify.types.rigify_type
 
-    def apply(self, armature: bpy.types.Object, data_dict: dict | None = None):
+    def apply(self, armature: bpy.types.Object, data_dict: dict | None = None, bones: BoneTable | None = None):
         """Applies the Rigify type operation to the given pose bone."""
-        if not self._switch_mode():
+        if not self._switch_mode(bones):
             return
-        poseBone = self._getPoseBone(self.bone_name, armature)
+        poseBone = self._getPoseBone(self.bone_name, armature, bones)
         if not poseBone:
             return
         try:
@@ -273,8 +468,32 @@ class TransformLink:
         )
         return pose_operations_dict
     
-    def to_ABOperation(self) -> list[ABOperation]:
+    def can_link_directly(self, armature: bpy.types.Object) -> bool:
+        """Whether the bone shares the rest matrix of the meta bone its DEF target is generated from.
+
+        Such a bone can be parented to the target after generation, which needs neither
+        a LINK- bone nor a CopyTransforms constraint. Must be called in edit mode.
+        """
+        if self.constraint is not None or not self.target.startswith("DEF-"):
+            return False
+
+        edit_bones = armature.data.edit_bones
+        bone = edit_bones.get(self.bone)
+        source = edit_bones.get(self.target[len("DEF-"):])
+        if bone is None or source is None:
+            return False
+
+        return all(
+            abs(a - b) <= _DIRECT_LINK_TOLERANCE
+            for row_a, row_b in zip(bone.matrix, source.matrix)
+            for a, b in zip(row_a, row_b)
+        )
+
+    def to_ABOperation(self, direct: bool = False) -> list[ABOperation]:
         """Convert this TransformLink to an ABOperation."""
+        if direct:
+            return [DirectLinkOperation(self.bone, target=self.target)]
+
         ops = []
         ff_bone = self.bone
         link_bone = f"LINK-{ff_bone}"
@@ -287,18 +506,40 @@ class TransformLink:
 
         return ops
 
+@dataclass()
+class DirectLinkOperation(ABOperation):
+    """Makes Rigify parent an original bone to its link target, replacing the LINK- bone and its constraint."""
+    mode: ClassVar[Mode] = "POSE"
+    batch_order: ClassVar[int] = 21
+
+    bone_name: str
+    target: str
+
+    def apply(self, armature: bpy.types.Object, data_dict: dict | None = None, bones: BoneTable | None = None):
+        """Sets the raw copy parent of the original bone to the link target."""
+        if not self._switch_mode(bones):
+            return
+        poseBone = self._getPoseBone(self.bone_name, armature, bones)
+        if not poseBone:
+            return
+        try:
+            rigify.types.basic_raw_copy(True, self.target).apply(poseBone, armature)
+        except Exception as e:
+            print(f"[AetherBlend] Error applying DirectLinkOperation for bone '{self.bone_name}': {e}")
+
 @dataclass()
 class CollectionOperation(ABOperation):
     mode: ClassVar[Mode] = "POSE"
+    batch_order: ClassVar[int] = 40
 
     bone_name: str
     collection_name: str
 
-    def apply(self, armature: bpy.types.Object, data_dict: dict | None = None):
+    def apply(self, armature: bpy.types.Object, data_dict: dict | None = None, bones: BoneTable | None = None):
         """Applies the collection operation to the given pose bone."""
-        if not self._switch_mode():
+        if not self._switch_mode(bones):
             return
-        poseBone = self._getPoseBone(self.bone_name, armature)
+        poseBone = self._getPoseBone(self.bone_name, armature, bones)
         if not poseBone:
             return
         try:
@@ -313,17 +554,21 @@ class ParentBoneOperation(ABOperation):
     is_connected: bool = False
     
     mode: ClassVar[Mode] = "EDIT"
+    batch_order: ClassVar[int] = 0
 
-    def apply(self, armature: bpy.types.Object, data_dict: dict | None = None):
+    def target_bones(self) -> tuple[str, ...]:
+        return (self.bone_name, *self.parent)
+
+    def apply(self, armature: bpy.types.Object, data_dict: dict | None = None, bones: BoneTable | None = None):
         """Applies the parent bone operation to the given edit bone."""
-        if not self._switch_mode():
+        if not self._switch_mode(bones):
             return
-        editBone = self._getEditBone(self.bone_name, armature)
+        editBone = self._getEditBone(self.bone_name, armature, bones)
         if not editBone:
             return
         parent_bone = None 
         for parent_name in self.parent:
-                parent_bone = self._getEditBone(parent_name, armature)
+                parent_bone = self._getEditBone(parent_name, armature, bones)
                 if parent_bone:
                     break
                 
@@ -341,6 +586,7 @@ class ParentBoneOperation(ABOperation):
 @dataclass()
 class DriverOperation(ABOperation):
     mode: ClassVar[Mode] = "POSE"
+    batch_order: ClassVar[int] = 60
     bone_name: str = field(default=None, kw_only=True)
     constraint_name: str = field(default=None, kw_only=True)
     driver_name: str
@@ -348,13 +594,13 @@ class DriverOperation(ABOperation):
     driver: Driver
     data: str | None = None ## Optional for referencing data blocks
 
-    def apply(self, armature: bpy.types.Object, data_dict: dict | None = None):
+    def apply(self, armature: bpy.types.Object, data_dict: dict | None = None, bones: BoneTable | None = None):
         """Applies the driver operation to the given pose bone."""
-        if not self._switch_mode():
+        if not self._switch_mode(bones):
             return
         target = armature
         if self.data is None and self.bone_name is not None:          
-            poseBone = self._getPoseBone(self.bone_name, armature)
+            poseBone = self._getPoseBone(self.bone_name, armature, bones)
             target = poseBone
             if self.constraint_name is not None:
                 constraint = poseBone.constraints.get(self.constraint_name)
@@ -373,19 +619,20 @@ class DriverOperation(ABOperation):
 @dataclass()
 class CustomPropertyOperation(ABOperation):
     mode: ClassVar[Mode] = "POSE"
+    batch_order: ClassVar[int] = 10
 
     property: CustomProperty
     bone_name: str | None = None
 
-    def apply(self, armature: bpy.types.Object, data_dict: dict | None = None):
+    def apply(self, armature: bpy.types.Object, data_dict: dict | None = None, bones: BoneTable | None = None):
         """Creates a custom property for a given bone or armature"""
-        if not self._switch_mode():
+        if not self._switch_mode(bones):
             return
         
         try:
             target = armature.data
             if self.bone_name:
-                poseBone = self._getPoseBone(self.bone_name, armature)
+                poseBone = self._getPoseBone(self.bone_name, armature, bones)
                 if not poseBone:
                     return
                 target = poseBone
@@ -399,6 +646,7 @@ class CustomPropertyOperation(ABOperation):
 class WidgetOperation(ABOperation):
     """Overrides the widget of a bone."""
     mode: ClassVar[Mode] = "POSE"
+    batch_order: ClassVar[int] = 90
     time : Time = field(default="Post", kw_only=True)
 
     bone_name: str
@@ -419,9 +667,12 @@ class WidgetOperation(ABOperation):
     wire_width: float = 1.0
 
 
-    def apply(self, armature: bpy.types.Object, data_dict: dict | None = None) -> None:
+    def apply(self, armature: bpy.types.Object, data_dict: dict | None = None, bones: BoneTable | None = None) -> None:
         """Applies the widget override to the given pose bone."""
-        pose_bone = armature.pose.bones.get(self.bone_name)
+        if bones is not None and bones.mode == "POSE":
+            pose_bone = bones.get(self.bone_name, report=False)
+        else:
+            pose_bone = armature.pose.bones.get(self.bone_name)
         if not pose_bone:
             print(f"[AetherBlend] WidgetOperation bone '{self.bone_name}' not found in armature.")
             return
@@ -443,8 +694,7 @@ class WidgetOperation(ABOperation):
                     if self.custom_color_active:
                         pose_bone.color.custom.active = mathutils.Color(self.custom_color_active)
             if self.custom_object:
-                custom_object_name = self._searchWGTS(armature, self.custom_object)
-                custom_shape_obj = bpy.data.objects.get(custom_object_name) if custom_object_name else None
+                custom_shape_obj = widgets.find(armature, self.custom_object)
 
                 # Always reassign the custom shape when a custom object is requested.
                 pose_bone.custom_shape = custom_shape_obj
@@ -462,42 +712,6 @@ class WidgetOperation(ABOperation):
         except Exception as e:
             print(f"[AetherBlend] Error applying WidgetOperation for bone '{pose_bone.name}': {e}")
 
-    @staticmethod
-    def _searchWGTS(armature, name: str) -> str | None:
-        """Searches for a widget object in the WGTS collection of the armature."""
-        search_name = name.strip()
-        if not search_name:
-            return None
-
-        expected_widget_name = search_name if search_name.startswith("AB_WGT_") else f"AB_WGT_{search_name}"
-
-        local_collections: list[bpy.types.Collection] = []
-        for armature_collection in armature.users_collection:
-            local_collections.extend(utils.collection.collection_tree(armature_collection))
-
-        matcher = lambda object_name: object_name == expected_widget_name
-
-        found_name = utils.collection.find_object_name_in_prefixed_collections(
-            local_collections,
-            _WGTS,
-            matcher,
-        )
-        if found_name:
-            return found_name
-
-        # Fallback: search all WGTS collections in the blend file.
-        global_collections = [collection for collection in bpy.data.collections if collection.name.upper().startswith("WGTS")]
-        found_name = utils.collection.find_object_name_in_prefixed_collections(
-            global_collections,
-            _WGTS,
-            matcher,
-        )
-        if found_name:
-            return found_name
-
-        print(f"[AetherBlend] WidgetOperation: No matching WGTS widget '{expected_widget_name}' found for armature '{armature.name}'.")
-        return None
-
     @staticmethod
     def _normalizeWidgetName(name: str) -> str:
         normalized_name = name.strip().lower()
@@ -509,6 +723,7 @@ class WidgetOperation(ABOperation):
 @dataclass()
 class BoneRestrictionOperation(ABOperation):
     mode: ClassVar[Mode] = "POSE"
+    batch_order: ClassVar[int] = 50
 
     bone_name: str
     hide_select: bool | None = None
@@ -520,12 +735,12 @@ class BoneRestrictionOperation(ABOperation):
     inherit_rotation: bool | None = None
     inherit_scale: Literal["FULL", "FIX_SHEAR", "ALIGNED", "AVERAGE", "NONE", "NONE_LEGACY"] | None = None
 
-    def apply(self, armature: bpy.types.Object, data_dict: dict | None = None):
+    def apply(self, armature: bpy.types.Object, data_dict: dict | None = None, bones: BoneTable | None = None):
         """Applies the bone restriction to the given pose bone."""
-        if not self._switch_mode():
+        if not self._switch_mode(bones):
             return
-        poseBone = self._getPoseBone(self.bone_name, armature)
-        dataBone = armature.data.bones.get(self.bone_name)
+        poseBone = self._getPoseBone(self.bone_name, armature, bones)
+        dataBone = poseBone.bone if poseBone else None
         if not poseBone or not dataBone:
             return
         if self.hide_select is not None:
@@ -569,6 +784,7 @@ class BoneRestrictionOperation(ABOperation):
 class PoseBoneOperation(ABOperation):
     """Poses a bone by setting its location, rotation, and scale."""
     mode: ClassVar[Mode] = "POSE"
+    batch_order: ClassVar[int] = 80
     time : Time = field(default="Post", kw_only=True)
 
     bone_name: str
@@ -576,11 +792,11 @@ class PoseBoneOperation(ABOperation):
     rotation: tuple[float, float, float] | None = None
     scale: tuple[float, float, float] | None = None
 
-    def apply(self, armature: bpy.types.Object, data_dict: dict | None = None):
+    def apply(self, armature: bpy.types.Object, data_dict: dict | None = None, bones: BoneTable | None = None):
         """Poses a bone by setting its location, rotation, and scale."""
-        if not self._switch_mode():
+        if not self._switch_mode(bones):
             return
-        poseBone = self._getPoseBone(self.bone_name, armature)
+        poseBone = self._getPoseBone(self.bone_name, armature, bones)
         if not poseBone:
             return
         if self.location:
@@ -595,17 +811,18 @@ class PoseBoneOperation(ABOperation):
 class PropOverrideOperation(ABOperation):
     """Overrides a custom property of a bone."""
     mode: ClassVar[Mode] = "POSE"
+    batch_order: ClassVar[int] = 70
     time : Time = field(default="Post", kw_only=True)
 
     bone_name: str
     property_name: str
     value: float | int | str | bool
 
-    def apply(self, armature: bpy.types.Object, data_dict: dict | None = None) -> None:
+    def apply(self, armature: bpy.types.Object, data_dict: dict | None = None, bones: BoneTable | None = None) -> None:
         """Applies the property override to the given pose bone."""
-        if not self._switch_mode():
+        if not self._switch_mode(bones):
             return
-        poseBone = self._getPoseBone(self.bone_name, armature)
+        poseBone = self._getPoseBone(self.bone_name, armature, bones)
         if not poseBone:
             return
         ## Alternatively in the futuire we could use data dict in here to target properties from speicifc objects
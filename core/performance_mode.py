@@ -0,0 +1,255 @@
+"""Playback performance mode of generated rigs.
+
+Generation stores which module family ("face", "mouth", "clothing", ...) owns each
+bone of the generated rig. Performance mode mutes the constraints and drivers of
+the bones of selected families and hides the bone collections only they use, in
+one pass. Everything it changes is recorded on aether_rig.performance_state, so
+disabling the mode restores exactly what was active before and leaves constraints,
+drivers and collections the user had already muted or hidden alone.
+
+Ownership of generated bones is derived from the meta bones each module created or
+linked: a generated bone belongs to a family if it sits in a bone collection only
+that family's modules define, if its name without the Rigify prefix derives from
+one of the family's meta bones, or otherwise if its parent belongs to it.
+"""
+
+import bpy
+import json
+
+from . import module_results
+
+FEATURE_GROUPS = (
+    ('face', "Face", "Face skin chains, eyes and lids"),
+    ('mouth', "Mouth", "Lips, jaw and tongue"),
+    ('clothing', "Clothing", "Skirt and other clothing chains"),
+    ('tail', "Tail", "Tail chains"),
+    ('genitals', "Genitals", "Genital rigs"),
+    ('hair', "Hair", "Hair chains"),
+    ('ears', "Ears", "Ear rigs"),
+)
+DEFAULT_GROUPS = {'face', 'mouth', 'clothing', 'tail', 'genitals'}
+
+_PREFIXES = ("ORG-", "DEF-", "MCH-", "LINK-", "VIS_", "tweak_")
+
+
+def _strip_prefix(name: str) -> str:
+    for prefix in _PREFIXES:
+        if name.startswith(prefix):
+            return name[len(prefix):]
+    return name
+
+
+def _split(name: str) -> tuple[str, str]:
+    """Splits a bone name into its stem and its side/number suffix ("lip_end.T.L" -> ("lip_end", ".T.L"))."""
+    index = name.find(".")
+    return (name, "") if index < 0 else (name[:index], name[index:])
+
+
+def _derived_owner(name: str, meta_owners: dict[str, str], stems: dict[str, list[tuple[str, str]]]) -> str | None:
+    """Owner of a Rigify bone whose name derives from a meta bone, e.g. MCH-lip_end.T.L from lip.T.L."""
+    base = _strip_prefix(name)
+    owner = meta_owners.get(base)
+    if owner:
+        return owner
+
+    stem, suffix = _split(base)
+    best: tuple[int, str] | None = None
+    for meta_stem, family in stems.get(suffix, ()):
+        if stem == meta_stem or stem.startswith(f"{meta_stem}_"):
+            if best is None or len(meta_stem) > best[0]:
+                best = (len(meta_stem), family)
+    return best[1] if best else None
+
+
+def bone_owners(
+    armature: bpy.types.Object,
+    meta_owners: dict[str, str],
+    collection_owners: dict[str, str],
+) -> dict[str, str]:
+    """Returns generated bone name -> module family for every bone that can be attributed to one."""
+    stems: dict[str, list[tuple[str, str]]] = {}
+    for meta_name, family in meta_owners.items():
+        stem, suffix = _split(meta_name)
+        stems.setdefault(suffix, []).append((stem, family))
+
+    bones = armature.data.bones
+    direct: dict[str, str | None] = {}
+    for bone in bones:
+        owner = next((collection_owners[c.name] for c in bone.collections if c.name in collection_owners), None)
+        direct[bone.name] = owner or _derived_owner(bone.name, meta_owners, stems)
+
+    owners: dict[str, str] = {}
+    for bone in bones:
+        # Helpers that cannot be attributed by name follow the owner of their closest attributed parent.
+        current = bone
+        owner = None
+        while current is not None:
+            owner = owners.get(current.name) or direct.get(current.name)
+            if owner:
+                break
+            current = current.parent
+        if owner:
+            owners[bone.name] = owner
+    return owners
+
+
+def collect_owners(armature: bpy.types.Object, results: module_results.ModuleResults, module_collections: dict[str, list[str]]) -> dict[str, list[str]]:
+    """Builds family -> bone names of a freshly generated rig from the module results of its meta rig.
+
+    module_collections maps module keys to the bone collection names they define.
+    """
+    original = armature.data.collections_all.get("Original")
+    original_bones = {bone.name for bone in original.bones} if original else set()
+
+    meta_owners: dict[str, str] = {}
+    collection_families: dict[str, set[str]] = {}
+    for record in results.groups:
+        if not record.winner:
+            continue
+        family = record.winner.split(".", 1)[0]
+        for name in record.bone_names() - original_bones:
+            meta_owners.setdefault(name, family)
+        for name in record.linked:
+            meta_owners.setdefault(name, family)
+        for collection_name in module_collections.get(record.winner, ()):
+            collection_families.setdefault(collection_name, set()).add(family)
+
+    # Collections shared by several families say nothing about ownership.
+    collection_owners = {name: next(iter(families)) for name, families in collection_families.items() if len(families) == 1}
+
+    families: dict[str, list[str]] = {}
+    for name, family in bone_owners(armature, meta_owners, collection_owners).items():
+        families.setdefault(family, []).append(name)
+    return {family: sorted(names) for family, names in sorted(families.items())}
+
+
+def load_owners(armature: bpy.types.Object) -> dict[str, list[str]]:
+    raw = armature.aether_rig.feature_bones
+    try:
+        return json.loads(raw) if raw else {}
+    except ValueError:
+        return {}
+
+
+def is_enabled(armature: bpy.types.Object) -> bool:
+    return bool(armature.aether_rig.performance_state)
+
+
+def _driver_bone(data_path: str) -> str | None:
+    """Bone a driver writes to, for pose.bones["..."] paths of the object and bones["..."] paths of the armature data."""
+    for prefix in ('pose.bones["', 'bones["'):
+        if data_path.startswith(prefix):
+            end = data_path.find('"]', len(prefix))
+            return data_path[len(prefix):end] if end >= 0 else None
+    return None
+
+
+def _reads_only(fcurve: bpy.types.FCurve, armature: bpy.types.Object, bones: set[str]) -> bool:
+    """Whether every bone the driver reads from the armature is in bones (and it reads at least one)."""
+    targets = [
+        target.bone_target
+        for variable in fcurve.driver.variables
+        for target in variable.targets
+        if target.id == armature and target.bone_target
+    ]
+    return bool(targets) and all(name in bones for name in targets)
+
+
+def _driver_owners(armature: bpy.types.Object) -> list[bpy.types.ID]:
+    """ID blocks whose drivers can belong to the rig: the armature, its data and the shape keys of its meshes."""
+    ids: list[bpy.types.ID] = [armature, armature.data]
+    for obj in bpy.data.objects:
+        if obj.type == 'MESH' and any(mod.type == 'ARMATURE' and mod.object == armature for mod in obj.modifiers):
+            if obj.data.shape_keys:
+                ids.append(obj.data.shape_keys)
+    return ids
+
+
+def _id_key(id_block: bpy.types.ID) -> list[str]:
+    return [type(id_block).__name__, id_block.name]
+
+
+def _find_id(key: list[str]) -> bpy.types.ID | None:
+    collection = {"Object": bpy.data.objects, "Armature": bpy.data.armatures, "Key": bpy.data.shape_keys}.get(key[0])
+    return collection.get(key[1]) if collection is not None else None
+
+
+def enable(armature: bpy.types.Object, groups: set[str]) -> dict[str, int]:
+    """Mutes the constraints and drivers of the bones of the given families and hides their collections."""
+    if is_enabled(armature):
+        disable(armature)
+
+    owners = load_owners(armature)
+    bones = {name for family in groups for name in owners.get(family, ())}
+
+    constraints: list[list[str]] = []
+    for pose_bone in armature.pose.bones:
+        if pose_bone.name not in bones:
+            continue
+        for constraint in pose_bone.constraints:
+            if constraint.enabled:
+                constraint.enabled = False
+                constraints.append([pose_bone.name, constraint.name])
+
+    drivers: list[list] = []
+    for id_block in _driver_owners(armature):
+        if id_block.animation_data is None:
+            continue
+        for fcurve in id_block.animation_data.drivers:
+            if fcurve.mute:
+                continue
+            if _driver_bone(fcurve.data_path) in bones or (id_block != armature and _reads_only(fcurve, armature, bones)):
+                fcurve.mute = True
+                drivers.append([*_id_key(id_block), fcurve.data_path, fcurve.array_index])
+
+    collections: list[str] = []
+    for collection in armature.data.collections_all:
+        if not collection.is_visible or not collection.bones:
+            continue
+        if all(bone.name in bones for bone in collection.bones):
+            collection.is_visible = False
+            collections.append(collection.name)
+
+    armature.aether_rig.performance_state = json.dumps({
+        "groups": sorted(groups),
+        "constraints": constraints,
+        "drivers": drivers,
+        "collections": collections,
+    })
+    armature.update_tag()
+    return {"bones": len(bones), "constraints": len(constraints), "drivers": len(drivers), "collections": len(collections)}
+
+
+def disable(armature: bpy.types.Object) -> dict[str, int]:
+    """Restores every constraint, driver and collection performance mode changed."""
+    raw = armature.aether_rig.performance_state
+    try:
+        state = json.loads(raw) if raw else {}
+    except ValueError:
+        state = {}
+
+    restored = {"constraints": 0, "drivers": 0, "collections": 0}
+    pose_bones = armature.pose.bones
+    for bone_name, constraint_name in state.get("constraints", []):
+        pose_bone = pose_bones.get(bone_name)
+        constraint = pose_bone.constraints.get(constraint_name) if pose_bone else None
+        if constraint:
+            constraint.enabled = True
+            restored["constraints"] += 1
+
+    for id_type, id_name, data_path, array_index in state.get("drivers", []):
+        id_block = _find_id([id_type, id_name])
+        fcurve = id_block.animation_data.drivers.find(data_path, index=array_index) if id_block and id_block.animation_data else None
+        if fcurve:
+            fcurve.mute = False
+            restored["drivers"] += 1
+
+    for collection_name in state.get("collections", []):
+        collection = armature.data.collections_all.get(collection_name)
+        if collection:
+            collection.is_visible = True
+            restored["collections"] += 1
+
+    armature.aether_rig.performance_state = ""
+    armature.update_tag()
+    return restored
@@ -0,0 +1,104 @@
+"""Plain data form of generation operations.
+
+Operations, constraints, drivers, custom properties and Rigify types are dataclasses
+made of names, numbers and other such dataclasses. encode() turns them into JSON
+compatible data with every dataclass tagged by its class name; decode() rebuilds
+only dataclasses of those modules and checks every stored field against the class,
+so data read from a .blend file or the cache directory can fail to load but never
+runs code.
+"""
+
+import dataclasses
+from functools import lru_cache
+
+from . import constraints
+from . import custom_properties
+from . import drivers
+from . import operations
+from .rigify import types as rigify_types
+
+_CLASS_KEY = "__class__"
+_TUPLE_KEY = "__tuple__"
+_DICT_KEY = "__dict__"
+_MODULES = (operations, constraints, drivers, custom_properties, rigify_types)
+_PLAIN = (str, int, float, bool, type(None))
+
+
+class PlainDataError(ValueError):
+    """Raised when a value cannot be stored as or rebuilt from plain data."""
+
+
+@lru_cache(maxsize=1)
+def _classes() -> dict[str, type]:
+    """Concrete dataclasses that may be rebuilt, keyed by their tag."""
+    classes = {}
+    for module in _MODULES:
+        for value in vars(module).values():
+            if (
+                isinstance(value, type)
+                and value.__module__ == module.__name__
+                and dataclasses.is_dataclass(value)
+                and not getattr(value, "__abstractmethods__", None)
+            ):
+                classes[_tag(value)] = value
+    return classes
+
+
+def _tag(cls: type) -> str:
+    return f"{cls.__module__.rsplit('.', 1)[-1]}.{cls.__qualname__}"
+
+
+def encode(value):
+    """Returns value as JSON compatible data."""
+    if isinstance(value, _PLAIN):
+        return value
+    if isinstance(value, list):
+        return [encode(item) for item in value]
+    if isinstance(value, tuple):
+        return {_TUPLE_KEY: [encode(item) for item in value]}
+    if isinstance(value, dict):
+        if not all(isinstance(key, str) for key in value):
+            raise PlainDataError("only dictionaries with string keys can be stored")
+        return {_DICT_KEY: {key: encode(item) for key, item in value.items()}}
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        tag = _tag(type(value))
+        if _classes().get(tag) is not type(value):
+            raise PlainDataError(f"'{tag}' cannot be stored")
+        data = {_CLASS_KEY: tag}
+        for data_field in dataclasses.fields(value):
+            if data_field.init:
+                data[data_field.name] = encode(getattr(value, data_field.name))
+        return data
+    raise PlainDataError(f"'{type(value).__name__}' cannot be stored")
+
+
+def decode(data):
+    """Rebuilds a value written by encode(); raises PlainDataError on anything else."""
+    if isinstance(data, _PLAIN):
+        return data
+    if isinstance(data, list):
+        return [decode(item) for item in data]
+    if not isinstance(data, dict):
+        raise PlainDataError(f"unexpected '{type(data).__name__}'")
+
+    if set(data) == {_TUPLE_KEY} and isinstance(data[_TUPLE_KEY], list):
+        return tuple(decode(item) for item in data[_TUPLE_KEY])
+    if set(data) == {_DICT_KEY} and isinstance(data[_DICT_KEY], dict):
+        return {key: decode(item) for key, item in data[_DICT_KEY].items()}
+
+    cls = _classes().get(data.get(_CLASS_KEY))
+    if cls is None:
+        raise PlainDataError(f"unknown class '{data.get(_CLASS_KEY)}'")
+
+    init_fields = {data_field.name: data_field for data_field in dataclasses.fields(cls) if data_field.init}
+    values = {key: value for key, value in data.items() if key != _CLASS_KEY}
+    unknown = set(values) - set(init_fields)
+    if unknown:
+        raise PlainDataError(f"unknown fields {sorted(unknown)} for '{data[_CLASS_KEY]}'")
+    missing = [
+        name for name, data_field in init_fields.items()
+        if name not in values and data_field.default is dataclasses.MISSING and data_field.default_factory is dataclasses.MISSING
+    ]
+    if missing:
+        raise PlainDataError(f"missing fields {missing} for '{data[_CLASS_KEY]}'")
+    return cls(**{key: decode(value) for key, value in values.items()})
@@ -0,0 +1,228 @@
+"""Dry-run planning of rig generation.
+
+Evaluates a template's module priority groups against a set of bone names and
+available generation data keys, mirroring BoneGroup.check and the first-wins
+module selection of AetherRigGenerator, without touching the scene. Pattern based
+generators are matched through a SkeletonIndex like at runtime. This module does
+not import bpy so plans can be built and inspected outside Blender.
+
+A plan is not certain when a generator's bones cannot be predicted (an invalid
+pattern, or a generator without planned_bones); callers should then run the
+modules instead of trusting the plan.
+"""
+
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Callable
+
+from .skeleton_index import SkeletonIndex
+
+
+@dataclass
+class GroupPlan:
+    """Whether a bone group passes its check, and why not."""
+    name: str
+    will_run: bool
+    creates: list[str] = field(default_factory=list)
+    skipped_optional: list[str] = field(default_factory=list)
+    missing_bones: list[str] = field(default_factory=list)
+    missing_data: list[str] = field(default_factory=list)
+    unsure: list[str] = field(default_factory=list)
+
+
+@dataclass
+class ModulePlan:
+    key: str
+    name: str
+    type: str
+    will_run: bool
+    groups: list[GroupPlan] = field(default_factory=list)
+
+    @property
+    def missing_bones(self) -> list[str]:
+        return sorted({bone for group in self.groups for bone in group.missing_bones})
+
+
+@dataclass
+class PriorityGroupPlan:
+    """One module priority group: every candidate evaluated in order and the one that wins."""
+    candidates: list[ModulePlan]
+    winner: str | None = None
+
+
+@dataclass
+class GenerationPlan:
+    template: str
+    groups: list[PriorityGroupPlan] = field(default_factory=list)
+    seconds: float = 0.0
+
+    @property
+    def winners(self) -> list[ModulePlan]:
+        return [
+            candidate
+            for group in self.groups
+            for candidate in group.candidates
+            if candidate.key == group.winner
+        ]
+
+    @property
+    def generates_bones(self) -> bool:
+        """True if at least one generator module will produce bones."""
+        return any(module.type == "Generator" for module in self.winners)
+
+    @property
+    def unsure(self) -> list[str]:
+        """Generators whose bones the plan could not predict."""
+        return sorted({
+            name
+            for group in self.groups
+            for candidate in group.candidates
+            for group_plan in candidate.groups
+            for name in group_plan.unsure
+        })
+
+    @property
+    def certain(self) -> bool:
+        return not self.unsure
+
+    @property
+    def missing_bones(self) -> list[str]:
+        """Bones missing from groups that will not run, across all evaluated modules."""
+        return sorted({bone for group in self.groups for candidate in group.candidates for bone in candidate.missing_bones})
+
+    def summary(self) -> str:
+        skipped = sum(1 for group in self.groups if group.winner is None)
+        summary = (f"Plan '{self.template}': {len(self.winners)}/{len(self.groups)} module groups will run, "
+                   f"{skipped} skipped, {len(self.missing_bones)} missing bones ({self.seconds * 1000:.1f}ms)")
+        if not self.certain:
+            summary += f", {len(self.unsure)} generators unpredictable"
+        return summary
+
+    def to_dict(self) -> dict:
+        return {
+            "template": self.template,
+            "seconds": round(self.seconds, 6),
+            "certain": self.certain,
+            "groups": [
+                {
+                    "winner": group.winner,
+                    "candidates": [
+                        {
+                            "key": candidate.key,
+                            "type": candidate.type,
+                            "will_run": candidate.will_run,
+                            "groups": [
+                                {
+                                    "name": group_plan.name,
+                                    "will_run": group_plan.will_run,
+                                    "missing_bones": group_plan.missing_bones,
+                                    "missing_data": group_plan.missing_data,
+                                    "skipped_optional": group_plan.skipped_optional,
+                                    "unsure": group_plan.unsure,
+                                }
+                                for group_plan in candidate.groups
+                            ],
+                        }
+                        for candidate in group.candidates
+                    ],
+                }
+                for group in self.groups
+            ],
+        }
+
+
+def _planned_bones(generator, skeleton: SkeletonIndex) -> list[str] | None:
+    planned_bones = getattr(generator, "planned_bones", None)
+    if planned_bones is None:
+        return None
+    try:
+        return planned_bones(skeleton)
+    except re.error:
+        return None
+
+
+def plan_bone_group(bone_group, bone_names: set[str], data_keys: set[str], skeleton: SkeletonIndex) -> GroupPlan:
+    """Evaluates a bone group the way BoneGroup.check does, collecting every failure instead of stopping at the first.
+
+    skeleton holds the bones present when generation starts, which pattern based
+    generators match against.
+    """
+    plan = GroupPlan(name=bone_group.name, will_run=False)
+    future_bones: set[str] = set()
+    creates: list[str] = []
+
+    for generator in bone_group.generators:
+        if generator.data_key is not None and generator.data_key not in data_keys:
+            plan.missing_data.append(generator.data_key)
+
+        missing = [
+            bone for bone in (generator.req_bones or [])
+            if bone not in future_bones and bone not in bone_names
+        ]
+        if missing:
+            if generator.is_optional:
+                plan.skipped_optional.append(generator.name)
+                continue
+            plan.missing_bones.extend(bone for bone in missing if bone not in plan.missing_bones)
+
+        future_bones.add(generator.name)
+        planned = _planned_bones(generator, skeleton)
+        if planned is None:
+            plan.unsure.append(generator.name)
+        else:
+            creates.extend(planned)
+
+    # A group only counts at runtime if it created bones or queued pose operations.
+    produces = bool(creates or plan.unsure) or any(generator.pose_operations for generator in bone_group.generators)
+    plan.will_run = bool(bone_group.generators) and not plan.missing_bones and not plan.missing_data and produces
+    if plan.will_run:
+        plan.creates = creates
+    return plan
+
+
+def plan_module(module, key: str, bone_names: set[str], data_keys: set[str], skeleton: SkeletonIndex) -> ModulePlan:
+    plan = ModulePlan(key=key, name=module.name, type=module.type, will_run=module.type in ("Patch", "UI-Addon"))
+    for bone_group in module.bone_groups:
+        group_plan = plan_bone_group(bone_group, bone_names, data_keys, skeleton)
+        plan.groups.append(group_plan)
+        if group_plan.will_run:
+            plan.will_run = True
+    return plan
+
+
+def plan_generation(
+    modules: list[list],
+    bone_names: set[str],
+    data_keys: set[str],
+    template: str = "",
+    module_key: Callable[[object], str] | None = None,
+    link_prefix: str = "LINK-",
+) -> GenerationPlan:
+    """Plans which modules a generation run would execute for the given source bones and data keys.
+
+    The meta rig contains the source bones plus their LINK copies, and every module that
+    runs adds the bones it creates for the modules after it.
+    """
+    time_start = time.perf_counter()
+    plan = GenerationPlan(template=template)
+    available = set(bone_names) | {f"{link_prefix}{bone}" for bone in bone_names}
+    # Pattern generators see the bones of the meta rig as it was when the modules started.
+    initial = sorted(available)
+    skeleton = SkeletonIndex(initial, [-1] * len(initial))
+
+    for module_group in modules:
+        group_plan = PriorityGroupPlan(candidates=[])
+        for module in module_group:
+            key = (module_key(module) if module_key else "") or module.name
+            module_plan = plan_module(module, key, available, data_keys, skeleton)
+            group_plan.candidates.append(module_plan)
+            if module_plan.will_run:
+                group_plan.winner = key
+                for bone_group in module_plan.groups:
+                    available.update(bone_group.creates)
+                break
+        plan.groups.append(group_plan)
+
+    plan.seconds = time.perf_counter() - time_start
+    return plan
@@ -0,0 +1,152 @@
+"""Timing instrumentation for the rig generation pipeline.
+
+A GenerationProfiler is activated by AetherRigGenerator for the duration of a
+generation run. Code along the pipeline reports into it through the module
+level helpers (measure, count, mode_set), which are no-ops when no profiler is
+active, so modules and operations do not need to carry a profiler around.
+"""
+
+import bpy
+import json
+import time
+import tomllib
+
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+
+_MANIFEST_FILE = Path(__file__).resolve().parents[1] / "blender_manifest.toml"
+
+CATEGORIES = ("stages", "modules", "bone_groups", "operations")
+
+_active: 'GenerationProfiler | None' = None
+
+
+def addon_version() -> str:
+    """Returns the addon version from the extension manifest."""
+    try:
+        with _MANIFEST_FILE.open("rb") as f:
+            return str(tomllib.load(f).get("version", "unknown"))
+    except Exception:
+        return "unknown"
+
+
+@dataclass
+class TimingEntry:
+    """Accumulated wall-clock time and call count of one measured key."""
+    seconds: float = 0.0
+    calls: int = 0
+
+    def add(self, seconds: float, calls: int = 1) -> None:
+        self.seconds += seconds
+        self.calls += calls
+
+
+@dataclass
+class GenerationProfiler:
+    """Collects per-stage, per-module, per-bone-group and per-operation timings."""
+    template: str
+    armature: str = ""
+    timings: dict[str, dict[str, TimingEntry]] = field(default_factory=lambda: {category: {} for category in CATEGORIES})
+    counters: dict[str, int] = field(default_factory=lambda: {"bones_created": 0, "mode_switches": 0})
+    total_seconds: float = 0.0
+    _time_start: float = field(default=0.0, init=False, repr=False)
+
+    def start(self) -> None:
+        """Activates this profiler for the pipeline helpers."""
+        global _active
+        _active = self
+        self._time_start = time.perf_counter()
+
+    def stop(self) -> None:
+        """Deactivates this profiler and stores the total run time."""
+        global _active
+        self.total_seconds += time.perf_counter() - self._time_start
+        if _active is self:
+            _active = None
+
+    def record(self, category: str, key: str, seconds: float, calls: int = 1) -> None:
+        entries = self.timings.setdefault(category, {})
+        entry = entries.get(key)
+        if entry is None:
+            entry = entries[key] = TimingEntry()
+        entry.add(seconds, calls)
+
+    def count(self, counter: str, amount: int = 1) -> None:
+        self.counters[counter] = self.counters.get(counter, 0) + amount
+
+    def slowest(self, category: str, limit: int = 5) -> list[tuple[str, TimingEntry]]:
+        """Returns the most expensive keys of a category."""
+        entries = self.timings.get(category, {})
+        return sorted(entries.items(), key=lambda item: item[1].seconds, reverse=True)[:limit]
+
+    def to_dict(self) -> dict:
+        return {
+            "addon_version": addon_version(),
+            "blender_version": bpy.app.version_string,
+            "template": self.template,
+            "armature": self.armature,
+            "total_seconds": round(self.total_seconds, 6),
+            "counters": dict(self.counters),
+            "timings": {
+                category: {
+                    key: {"seconds": round(entry.seconds, 6), "calls": entry.calls}
+                    for key, entry in sorted(entries.items(), key=lambda item: item[1].seconds, reverse=True)
+                }
+                for category, entries in self.timings.items()
+            },
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), indent=2)
+
+    def print_summary(self) -> None:
+        print(f"[AetherBlend] Generation profile '{self.template}': {self.total_seconds:.3f}s, "
+              f"{self.counters.get('bones_created', 0)} bones created, {self.counters.get('mode_switches', 0)} mode switches")
+        slow_drivers = self.counters.get('drivers_slow_path', 0)
+        if slow_drivers:
+            print(f"[AetherBlend]   {slow_drivers} drivers run on the Python path; use Audit Drivers to list them")
+        for category in CATEGORIES:
+            for key, entry in self.slowest(category, limit=3):
+                print(f"[AetherBlend]   {category}: {key} {entry.seconds:.3f}s ({entry.calls} calls)")
+
+
+def active() -> GenerationProfiler | None:
+    """Returns the profiler of the generation currently running, if any."""
+    return _active
+
+
+@contextmanager
+def measure(category: str, key: str):
+    """Times the enclosed block into the active profiler."""
+    profiler = _active
+    if profiler is None:
+        yield
+        return
+
+    time_start = time.perf_counter()
+    try:
+        yield
+    finally:
+        profiler.record(category, key, time.perf_counter() - time_start)
+
+
+def record(category: str, key: str, seconds: float, calls: int = 1) -> None:
+    """Adds an externally measured timing to the active profiler."""
+    if _active is not None:
+        _active.record(category, key, seconds, calls)
+
+
+def count(counter: str, amount: int = 1) -> None:
+    """Increments a counter on the active profiler."""
+    if _active is not None:
+        _active.count(counter, amount)
+
+
+def mode_set(mode: str) -> None:
+    """Calls bpy.ops.object.mode_set and counts the switch if the mode changes."""
+    obj = bpy.context.object
+    if obj is not None and obj.mode == mode:
+        return
+    bpy.ops.object.mode_set(mode=mode)
+    count("mode_switches")
@@ -10,7 +10,8 @@ from typing import Literal
 if TYPE_CHECKING:
     from .bone_generators import BoneGenerator
 
-from .operations import ABOperation, PoseOperations, PoseOperationsStack, TransformLink
+from .operations import ABOperation, LinkMode, PoseOperations, PoseOperationsStack, TransformLink
+from . import execution_plan
 from . import rigify
 from .bone_generators import BoneGenerator
 
@@ -34,104 +35,15 @@ class BoneGroup:
     
     def check(self, armature: bpy.types.Object, data: dict | None = None) -> bool:
         """Check if all required bones exist in the armature for this bone group."""
-        future_bones = []
-        
-        for bone_gen in self.generators:
-            future_bones.append(bone_gen.name)
-            if bone_gen.data_key is not None:
-                data_value = data.get(bone_gen.data_key) if data else None
-                if data_value is None:
-                    print(f"[AetherBlend] Error Code: DEMON")
-                    return False
-            if bone_gen.req_bones:
-                for req_bone in bone_gen.req_bones:
-                    # Check if bone will be created in this group or already exists
-                    if req_bone not in future_bones:
-                        if req_bone not in armature.data.bones:
-                            if bone_gen.is_optional:
-                                future_bones.remove(bone_gen.name)
-                                continue
-                            return False
-        return True
+        return execution_plan.compile_bone_group(self).check(armature, data=data)
     
     def generate(self, armature: bpy.types.Object, data: dict | None = None) -> tuple[list[str], list[ABOperation]]:
         """Generate all bones in this group."""
-
-        generated_bones: list[str] = []
-        generated_operations: list[ABOperation] = list(self.operations)
-
-        for bone_gen in self.generators:
-            # Generators are template singletons; isolate runtime-emitted operations per execution.
-            static_operations = list(bone_gen.operations)
-            bone_gen.operations = []
-            new_bones = bone_gen.generate(armature, data=data)
-            runtime_operations = list(bone_gen.operations)
-            bone_gen.operations = static_operations
-
-            if static_operations:
-                generated_operations.extend(static_operations)
-            if runtime_operations:
-                generated_operations.extend(runtime_operations)
-            if new_bones:
-                generated_bones.extend(new_bones)
-
-        return generated_bones, generated_operations
-        
+        return execution_plan.compile_bone_group(self).generate(armature, data=data)
     
     def execute(self, armature: bpy.types.Object, data: dict | None = None) -> tuple[list[str], dict[str, list[PoseOperations]], list[ABOperation]]:
         """Execute the full generation process for this bone group."""
-        # Check if bone group can theoriticlly be generated
-        if not self.check(armature, data=data):
-            print(f"[AetherBlend] BoneGroup '{self.name}' check failed - missing required bones")
-            return [], {}, []
-        
-        bpy.ops.object.mode_set(mode='EDIT')
-        
-        # Generate bones and collect runtime operations for this execution only.
-        generated_bones, generated_operations = self.generate(armature, data=data)
-        
-        # Collect Pose Operations
-        pose_operations_dict: dict[str, list[PoseOperations]] = {}
-
-        # # Add TransformLink operations
-        # bpy.ops.object.mode_set(mode='OBJECT')
-        # for link_item in self.transform_link:
-        #     link_item.mark_linked(armature)
-        #     for bone_name, operations in link_item.to_pose_operations().items():
-        #         if bone_name not in pose_operations_dict:
-        #             pose_operations_dict[bone_name] = []
-        #         pose_operations_dict[bone_name].extend(operations)
-
-        bpy.ops.object.mode_set(mode='OBJECT')
-        for link_item in self.transform_link:
-            link_item.mark_linked(armature)
-            for operation in link_item.to_ABOperation():
-                generated_operations.append(operation)
-        
-        # Add BoneGenerator pose operations
-        for bone_gen in self.generators:
-            # Collect dynamic pose operations (empty dict for most generators)
-            dynamic_ops = bone_gen.get_dynamic_pose_operations()
-            for bone_name, operations in dynamic_ops.items():
-                if bone_name not in pose_operations_dict:
-                    pose_operations_dict[bone_name] = []
-                pose_operations_dict[bone_name].extend(operations)
-            
-            # Collect dynamic transform links (empty list for most generators)
-            dynamic_links = bone_gen.get_dynamic_transform_links()
-            for link_item in dynamic_links:
-                link_item.mark_linked(armature)
-                for bone_name, operations in link_item.to_pose_operations().items():
-                    if bone_name not in pose_operations_dict:
-                        pose_operations_dict[bone_name] = []
-                    pose_operations_dict[bone_name].extend(operations)
-            
-            if bone_gen.pose_operations:
-                if bone_gen.name not in pose_operations_dict:
-                    pose_operations_dict[bone_gen.name] = []
-                pose_operations_dict[bone_gen.name].append(bone_gen.pose_operations)
-        
-        return generated_bones, pose_operations_dict, generated_operations
+        return execution_plan.compile_bone_group(self).execute(armature, data=data)
     
 @dataclass
 class UILink:
@@ -213,25 +125,8 @@ class RigModule:
     operations: list[ABOperation] = field(default_factory=list)
     ui_flags: list[str] = field(default_factory=list)
 
-    def execute(self, armature: bpy.types.Object, data: dict) -> tuple[bool, PoseOperationsStack, rigify.settings.UI_Collections | None, list[ABOperation]]:
-        bpy.context.view_layer.objects.active = armature
-        pose_op_stack = PoseOperationsStack()
-        module_operations: list[ABOperation] = list(self.operations)
-        integrity = False
-        if self.type == "Patch" or self.type == "UI-Addon":
-            integrity = True
-        for bone_group in self.bone_groups:
-            bones, pose_ops, operations = bone_group.execute(armature, data)
-
-            if not bones and not pose_ops:
-                continue 
-                
-            integrity = True
-            pose_op_stack.merge(PoseOperationsStack(stack = pose_ops))
-            module_operations.extend(operations or [])
-
-            
-        return integrity, pose_op_stack, self.ui_collections, module_operations
+    def execute(self, armature: bpy.types.Object, data: dict, profile_key: str | None = None) -> tuple[bool, PoseOperationsStack, rigify.settings.UI_Collections | None, list[ABOperation]]:
+        return execution_plan.compile_module(self).execute(armature, data, profile_key=profile_key)
 
 
 @dataclass(frozen=True)
@@ -239,3 +134,4 @@ class Template():
     """Defines a rig template with its properties and modules."""
     name: str
     modules: 'list[list[RigModule]]'
+    link_mode: LinkMode = "LINK"
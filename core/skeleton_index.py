@@ -0,0 +1,84 @@
+"""Bone name and hierarchy index shared by the generators of one generation run.
+
+Pattern based generators (RegexBoneGroup) need every bone matching a regex and the
+matching children of those bones. SkeletonIndex stores bone names with parent and
+children index arrays, and matches each compiled pattern against every name once,
+caching the result as a bit mask so later queries are plain lookups.
+"""
+
+import re
+
+DATA_KEY = "skeleton_index"
+
+
+class SkeletonIndex:
+    """Names, parent/children arrays and cached pattern match masks of an armature's bones."""
+
+    def __init__(self, names: list[str], parents: list[int], children: list[list[int]] | None = None):
+        self.names = list(names)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.parents = list(parents)
+        if children is None:
+            children = [[] for _ in self.names]
+            for i, parent in enumerate(self.parents):
+                if parent >= 0:
+                    children[parent].append(i)
+        self.children = children
+        self._masks: dict[str, bytearray] = {}
+
+    @classmethod
+    def from_bones(cls, bones) -> 'SkeletonIndex':
+        """Builds the index from data bones, keeping Blender's child order."""
+        names = bones.keys()
+        index = {name: i for i, name in enumerate(names)}
+        parents = [index[bone.parent.name] if bone.parent else -1 for bone in bones]
+        children = [[index[child.name] for child in bone.children] for bone in bones]
+        return cls(names, parents, children)
+
+    @classmethod
+    def get(cls, armature, data: dict | None = None) -> 'SkeletonIndex':
+        """Returns the index shared through generation data, or builds one for the armature."""
+        skeleton_index = data.get(DATA_KEY) if data else None
+        if skeleton_index is None:
+            skeleton_index = cls.from_bones(armature.data.bones)
+        return skeleton_index
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.index
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def mask(self, pattern: str) -> bytearray:
+        """Returns a mask with 1 for every bone whose name matches the pattern (re.match semantics)."""
+        mask = self._masks.get(pattern)
+        if mask is None:
+            match = re.compile(pattern).match
+            mask = bytearray(1 if match(name) else 0 for name in self.names)
+            self._masks[pattern] = mask
+        return mask
+
+    def matches(self, pattern: str) -> list[str]:
+        """Returns the matching bone names in armature order."""
+        mask = self.mask(pattern)
+        return [name for name, matched in zip(self.names, mask) if matched]
+
+    def parent(self, name: str) -> str | None:
+        parent = self.parents[self.index[name]]
+        return self.names[parent] if parent >= 0 else None
+
+    def matching_children(self, name: str, pattern: str) -> list[str]:
+        mask = self.mask(pattern)
+        return [self.names[child] for child in self.children[self.index[name]] if mask[child]]
+
+    def chain(self, name: str, pattern: str) -> list[str]:
+        """Follows the first matching child from name for as long as there is one."""
+        mask = self.mask(pattern)
+        current = self.index[name]
+        chain = [name]
+        while True:
+            current = next((child for child in self.children[current] if mask[child]), None)
+            if current is None:
+                break
+            chain.append(self.names[current])
+        return chain
@@ -0,0 +1,129 @@
+"""Highest weighted vertex lookup for skin based bone placement.
+
+SkinBone places bones on the vertex a source bone deforms most. SkinWeightCache
+evaluates each candidate mesh once, reads all vertex group weights in a single
+pass and computes the argmax vertex of every group with NumPy, so every later
+SkinBone lookup on the same mesh is a dictionary access.
+"""
+
+import bpy
+import hashlib
+import mathutils
+import numpy # type: ignore
+
+from dataclasses import dataclass
+
+DATA_KEY = "skin_weights"
+
+
+@dataclass(frozen=True)
+class WeightPeak:
+    """Highest weighted vertex of a vertex group, in world space."""
+    world_co: tuple[float, float, float]
+    weight: float
+
+
+def mesh_peaks(obj: bpy.types.Object, depsgraph: bpy.types.Depsgraph) -> dict[str, WeightPeak]:
+    """Returns the highest weighted evaluated vertex of every vertex group of a mesh object."""
+    eval_obj = obj.evaluated_get(depsgraph)
+    try:
+        mesh_eval = eval_obj.to_mesh()
+    except Exception:
+        return {}
+    if mesh_eval is None:
+        return {}
+
+    vertices = obj.data.vertices
+    try:
+        # Weights are read from the original mesh, so the evaluated one must keep its vertex order.
+        if len(mesh_eval.vertices) != len(vertices):
+            return {}
+        coordinates = numpy.empty(len(vertices) * 3, dtype=numpy.float32)
+        mesh_eval.vertices.foreach_get("co", coordinates)
+    finally:
+        eval_obj.to_mesh_clear()
+
+    entries = [
+        (vertex_index, group.group, group.weight)
+        for vertex_index, vertex in enumerate(vertices)
+        for group in vertex.groups
+        if group.weight > 0.0
+    ]
+    if not entries:
+        return {}
+
+    entries = numpy.array(entries, dtype=numpy.float64)
+    vertex_ids = entries[:, 0].astype(numpy.intp)
+    group_ids = entries[:, 1].astype(numpy.intp)
+    weights = entries[:, 2]
+
+    # Sort by group, then highest weight, then lowest vertex index; the first row of each group is its peak.
+    order = numpy.lexsort((vertex_ids, -weights, group_ids))
+    groups, first = numpy.unique(group_ids[order], return_index=True)
+    best = order[first]
+
+    matrix = numpy.array(obj.matrix_world, dtype=numpy.float64)
+    local = coordinates.reshape(-1, 3)[vertex_ids[best]].astype(numpy.float64)
+    world = local @ matrix[:3, :3].T + matrix[:3, 3]
+
+    group_names = {vertex_group.index: vertex_group.name for vertex_group in obj.vertex_groups}
+    return {
+        group_names[group]: WeightPeak(tuple(world[row].tolist()), float(weights[best[row]]))
+        for row, group in enumerate(groups.tolist())
+        if group in group_names
+    }
+
+
+def weights_digest(objects: list[bpy.types.Object]) -> str:
+    """Hashes the vertex group weights of the given meshes, which decide where SkinBones are placed."""
+    digest = hashlib.sha256()
+    for obj in sorted(objects, key=lambda obj: obj.name):
+        digest.update(repr((obj.name, [vertex_group.name for vertex_group in obj.vertex_groups])).encode("utf-8"))
+        entries = [
+            (vertex_index, group.group, group.weight)
+            for vertex_index, vertex in enumerate(obj.data.vertices)
+            for group in vertex.groups
+        ]
+        digest.update(numpy.array(entries, dtype=numpy.float64).tobytes())
+    return digest.hexdigest()
+
+
+class SkinWeightCache:
+    """Vertex group weight peaks per mesh, computed once for a mesh and depsgraph state."""
+
+    def __init__(self):
+        self._meshes: dict[tuple, dict[str, WeightPeak]] = {}
+
+    @classmethod
+    def get(cls, data: dict | None = None) -> 'SkinWeightCache':
+        """Returns the cache shared through generation data, or a new one."""
+        cache = data.get(DATA_KEY) if data else None
+        return cache if cache is not None else cls()
+
+    def _key(self, obj: bpy.types.Object, depsgraph: bpy.types.Depsgraph) -> tuple:
+        return (obj.as_pointer(), obj.data.as_pointer(), depsgraph.as_pointer(), depsgraph.scene.frame_current)
+
+    def peaks(self, obj: bpy.types.Object, depsgraph: bpy.types.Depsgraph) -> dict[str, WeightPeak]:
+        key = self._key(obj, depsgraph)
+        peaks = self._meshes.get(key)
+        if peaks is None:
+            peaks = mesh_peaks(obj, depsgraph)
+            self._meshes[key] = peaks
+        return peaks
+
+    def highest_weight(self, group_name: str, objects: list[bpy.types.Object], depsgraph: bpy.types.Depsgraph) -> tuple[mathutils.Vector | None, float]:
+        """Returns the world position and weight of the highest weighted vertex of group_name across objects."""
+        best: WeightPeak | None = None
+        for obj in objects:
+            if obj.vertex_groups.get(group_name) is None:
+                continue
+            peak = self.peaks(obj, depsgraph).get(group_name)
+            if peak is not None and (best is None or peak.weight > best.weight):
+                best = peak
+
+        if best is None:
+            return (None, 0.0)
+        return (mathutils.Vector(best.world_co), best.weight)
+
+    def clear(self) -> None:
+        self._meshes.clear()
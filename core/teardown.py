@@ -0,0 +1,187 @@
+"""Batched removal of a generated rig, keeping only the Original bones.
+
+teardown() computes the keep-set from the Original bone collection once and
+strips everything else in one pass per kind of data: drivers, constraints and
+Rigify settings of the kept bones, the generated bones (one delete of the
+selection), every other bone collection, the meta rig and the Rigify UI script.
+"""
+
+import bpy
+import time
+
+from dataclasses import dataclass
+
+from . import direct_links
+from . import link_table
+from . import performance_mode
+from .. import utils
+
+ORIGINAL_COLLECTION = "Original"
+
+
+@dataclass
+class TeardownReport:
+    bones: int = 0
+    constraints: int = 0
+    drivers: int = 0
+    collections: int = 0
+    texts: int = 0
+    meta_rig: bool = False
+    seconds: float = 0.0
+
+    def summary(self) -> str:
+        return (
+            f"removed {self.bones} bones, {self.constraints} constraints, {self.drivers} drivers, "
+            f"{self.collections} collections and {self.texts} scripts in {self.seconds:.3f}s"
+        )
+
+
+def keep_set(armature: bpy.types.Object) -> set[str]:
+    original = armature.data.collections_all.get(ORIGINAL_COLLECTION)
+    return {bone.name for bone in original.bones} if original else set()
+
+
+def _remove_meta_rig(armature: bpy.types.Object, report: TeardownReport) -> None:
+    meta_rig = armature.aether_rig.meta_rig
+    if not meta_rig:
+        return
+
+    script = getattr(meta_rig.data, "rigify_rig_ui", None)
+    if script and script.name in bpy.data.texts:
+        bpy.data.texts.remove(script)
+        report.texts += 1
+    bpy.data.objects.remove(meta_rig, do_unlink=True)
+    report.meta_rig = True
+
+
+def _removed_driver(data_path: str, keep: set[str]) -> bool:
+    """Whether an object driver drives a removed bone or a constraint of a kept one."""
+    prefix = 'pose.bones["'
+    if not data_path.startswith(prefix):
+        return False
+    end = data_path.find('"]', len(prefix))
+    return data_path[len(prefix):end] not in keep or data_path.startswith('.constraints[', end + 2)
+
+
+def _remove_drivers(armature: bpy.types.Object, keep: set[str], report: TeardownReport) -> None:
+    """Removes every driver of the armature data and the object drivers of bones that are removed."""
+    data_animation = armature.data.animation_data
+    if data_animation:
+        fcurves = list(data_animation.drivers)
+        for fcurve in fcurves:
+            data_animation.drivers.remove(fcurve)
+        report.drivers += len(fcurves)
+
+    object_animation = armature.animation_data
+    if object_animation:
+        fcurves = [fcurve for fcurve in object_animation.drivers if _removed_driver(fcurve.data_path, keep)]
+        for fcurve in fcurves:
+            object_animation.drivers.remove(fcurve)
+        report.drivers += len(fcurves)
+
+
+def _strip_kept_bones(armature: bpy.types.Object, keep: set[str], report: TeardownReport) -> None:
+    """Clears constraints and Rigify types of the kept bones; removed bones take theirs with them."""
+    for pose_bone in armature.pose.bones:
+        if pose_bone.name not in keep:
+            continue
+        constraints = list(pose_bone.constraints)
+        for constraint in constraints:
+            pose_bone.constraints.remove(constraint)
+        report.constraints += len(constraints)
+        pose_bone.rigify_type = " "
+
+
+def _remove_bones(armature: bpy.types.Object, keep: set[str], report: TeardownReport) -> None:
+    """Deletes every bone outside the keep-set (edit mode).
+
+    The bones are removed with a single delete of the selection when the armature is the
+    only object in edit mode, since the operator acts on every armature being edited, and
+    one by one through this armature's edit bones otherwise.
+    """
+    edit_bones = armature.data.edit_bones
+    names = [edit_bone.name for edit_bone in edit_bones if edit_bone.name not in keep]
+    report.bones = len(names)
+    if not names:
+        return
+
+    if list(getattr(bpy.context, "objects_in_mode", [])) == [armature]:
+        for collection in armature.data.collections_all:
+            collection.is_visible = True
+        for edit_bone in edit_bones:
+            remove = edit_bone.name not in keep
+            edit_bone.hide = False
+            edit_bone.select = edit_bone.select_head = edit_bone.select_tail = remove
+        try:
+            bpy.ops.armature.delete()
+            # Bones the operator could not reach (e.g. locked) are removed directly below.
+            names = [name for name in names if name in edit_bones]
+        except RuntimeError as e:
+            print(f"[AetherBlend] Batched bone delete failed, removing bones one by one: {e}")
+
+    for name in names:
+        edit_bones.remove(edit_bones[name])
+
+
+def _remove_collections(armature: bpy.types.Object, report: TeardownReport) -> None:
+    collections = armature.data.collections
+    original = armature.data.collections_all.get(ORIGINAL_COLLECTION)
+
+    keep: set[str] = set()
+    current = original
+    while current is not None:
+        keep.add(current.name)
+        current = current.parent
+
+    # Removing a collection reallocates the others, so each one is looked up again by name.
+    for name in [c.name for c in armature.data.collections_all if c.name not in keep]:
+        collection = armature.data.collections_all.get(name)
+        if collection:
+            collections.remove(collection)
+            report.collections += 1
+
+    original = armature.data.collections_all.get(ORIGINAL_COLLECTION)
+    if original:
+        original.is_visible = True
+
+
+def teardown(armature: bpy.types.Object) -> TeardownReport:
+    """Removes the generated rig from the armature, keeping the Original bones and their animation."""
+    time_start = time.perf_counter()
+    report = TeardownReport()
+    keep = keep_set(armature)
+
+    if performance_mode.is_enabled(armature):
+        performance_mode.disable(armature)
+    links = direct_links.load(armature)
+
+    _remove_meta_rig(armature, report)
+    if "rig_id" in armature.data:
+        del armature.data["rig_id"]
+    _remove_drivers(armature, keep, report)
+
+    utils.armature._set_mode(armature, 'POSE')
+    try:
+        _strip_kept_bones(armature, keep, report)
+
+        bpy.ops.object.mode_set(mode='EDIT')
+        edit_bones = armature.data.edit_bones
+        # Directly linked bones are parented to Rigify bones; move them back before those are deleted.
+        for link in links:
+            edit_bone = edit_bones.get(link.bone)
+            if edit_bone:
+                edit_bone.parent = edit_bones.get(link.parent) if link.parent else None
+        _remove_bones(armature, keep, report)
+
+        bpy.ops.object.mode_set(mode='OBJECT')
+        _remove_collections(armature, report)
+    finally:
+        utils.armature._restore_mode(armature, 'OBJECT')
+
+    aether_rig = armature.aether_rig
+    aether_rig.rigified = False
+    aether_rig.feature_bones = ""
+    link_table.clear(armature)
+
+    report.seconds = time.perf_counter() - time_start
+    return report
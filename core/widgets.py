@@ -0,0 +1,221 @@
+"""Widget objects used as bone custom shapes.
+
+Widgets ship in assets/blend/wgts.blend as AB_WGT_ prefixed objects and live in a
+WGTS collection next to each rig. WidgetLibrary reads the names in the .blend once
+per session, and a WidgetRegistry maps widget names to objects for the WGTS
+collections of an armature, so WidgetOperation lookups are dictionary hits and
+generation only appends the widgets its operations actually use. Registries hold
+collection pointers, so they are dropped whenever a file is loaded or undo/redo
+replaces the data.
+"""
+
+import bpy
+from bpy.app.handlers import persistent
+from pathlib import Path
+
+from .. import utils
+
+WIDGET_PREFIX = "AB_WGT_"
+COLLECTION_PREFIX = "WGTS"
+LIBRARY_FILE = Path(__file__).resolve().parents[1] / "assets" / "blend" / "wgts.blend"
+
+
+def widget_name(name: str) -> str | None:
+    """Returns the AB_WGT_ prefixed object name of a widget."""
+    search_name = name.strip()
+    if not search_name:
+        return None
+    return search_name if search_name.startswith(WIDGET_PREFIX) else f"{WIDGET_PREFIX}{search_name}"
+
+
+def base_name(object_name: str) -> str:
+    # Blender duplicate suffixes use the pattern ".001", ".002", etc.
+    if len(object_name) > 4 and object_name[-4] == "." and object_name[-3:].isdigit():
+        return object_name[:-4]
+    return object_name
+
+
+class WidgetLibrary:
+    """Widget object names of a .blend library, read once and refreshed when the file changes."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._names: frozenset[str] | None = None
+        self._mtime: float | None = None
+
+    def names(self) -> frozenset[str]:
+        if not self.path.exists():
+            return frozenset()
+
+        mtime = self.path.stat().st_mtime
+        if self._names is None or mtime != self._mtime:
+            with bpy.data.libraries.load(str(self.path), link=False) as (data_from, _):
+                self._names = frozenset(name for name in data_from.objects if name and name.startswith(WIDGET_PREFIX))
+            self._mtime = mtime
+        return self._names
+
+    def append(self, names: list[str]) -> list[bpy.types.Object]:
+        """Appends the named widget objects and returns them."""
+        if not names:
+            return []
+        with bpy.data.libraries.load(str(self.path), link=False) as (_, data_to):
+            data_to.objects = list(names)
+        return [obj for obj in data_to.objects if obj is not None]
+
+
+LIBRARY = WidgetLibrary(LIBRARY_FILE)
+
+
+class WidgetRegistry:
+    """Widget name -> object map of a set of WGTS collections."""
+
+    def __init__(self, collections: list[bpy.types.Collection]):
+        self.collections = collections
+        self._objects: dict[str, bpy.types.Object] | None = None
+
+    def _build(self) -> dict[str, bpy.types.Object]:
+        objects: dict[str, bpy.types.Object] = {}
+        for collection in self.collections:
+            for obj in collection.objects:
+                objects.setdefault(obj.name, obj)
+        return objects
+
+    def refresh(self) -> None:
+        self._objects = self._build()
+
+    def get(self, name: str, rebuild: bool = True) -> bpy.types.Object | None:
+        """Returns the widget object, rebuilding the map once if the cached entry is missing or stale."""
+        if self._objects is None:
+            self._objects = self._build()
+
+        obj = self._objects.get(name)
+        try:
+            if obj is not None and any(obj.name in collection.objects for collection in self.collections):
+                return obj
+        except ReferenceError:
+            pass
+        if not rebuild:
+            return None
+
+        # Widgets were renamed, removed or added since the map was built.
+        self._objects = self._build()
+        return self._objects.get(name)
+
+    def add(self, name: str, obj: bpy.types.Object) -> None:
+        if self._objects is None:
+            self._objects = self._build()
+        self._objects[name] = obj
+
+
+_REGISTRIES: dict[tuple[int, ...], WidgetRegistry] = {}
+
+
+def _registry(collections: list[bpy.types.Collection]) -> WidgetRegistry:
+    key = tuple(collection.as_pointer() for collection in collections)
+    registry = _REGISTRIES.get(key)
+    if registry is None:
+        registry = WidgetRegistry(collections)
+        _REGISTRIES[key] = registry
+    return registry
+
+
+def clear_cache() -> None:
+    _REGISTRIES.clear()
+
+
+@persistent
+def _clear_cache_handler(*_args) -> None:
+    clear_cache()
+
+
+_HANDLERS = ("load_post", "undo_post", "redo_post")
+
+
+def register() -> None:
+    for handler_name in _HANDLERS:
+        handlers = getattr(bpy.app.handlers, handler_name)
+        if _clear_cache_handler not in handlers:
+            handlers.append(_clear_cache_handler)
+
+
+def unregister() -> None:
+    for handler_name in _HANDLERS:
+        handlers = getattr(bpy.app.handlers, handler_name)
+        if _clear_cache_handler in handlers:
+            handlers.remove(_clear_cache_handler)
+    clear_cache()
+
+
+def wgts_collections(armature: bpy.types.Object) -> list[bpy.types.Collection]:
+    """WGTS collections under the collections the armature is linked to."""
+    return [
+        collection
+        for armature_collection in armature.users_collection
+        for collection in utils.collection.collection_tree(armature_collection)
+        if collection.name.upper().startswith(COLLECTION_PREFIX)
+    ]
+
+
+def armature_registry(armature: bpy.types.Object) -> WidgetRegistry:
+    return _registry(wgts_collections(armature))
+
+
+def file_registry() -> WidgetRegistry:
+    return _registry([collection for collection in bpy.data.collections if collection.name.upper().startswith(COLLECTION_PREFIX)])
+
+
+def find(armature: bpy.types.Object, name: str) -> bpy.types.Object | None:
+    """Returns the widget object for name from the armature's WGTS collection, else from any WGTS collection."""
+    expected_name = widget_name(name)
+    if not expected_name:
+        return None
+    return armature_registry(armature).get(expected_name) or file_registry().get(expected_name)
+
+
+def _file_widgets() -> dict[str, bpy.types.Object]:
+    """One widget object per base name already in the file, preferring non-suffixed names."""
+    widgets: dict[str, bpy.types.Object] = {}
+    for obj in bpy.data.objects:
+        if not obj.name.startswith(WIDGET_PREFIX):
+            continue
+        name = base_name(obj.name)
+        current = widgets.get(name)
+        if current is None or current.name != name:
+            widgets[name] = obj
+    return widgets
+
+
+def ensure(armature: bpy.types.Object, names: set[str]) -> int:
+    """Makes the named widgets available in the armature's WGTS collection and returns how many were added.
+
+    Widgets already in the file are reused; only the rest are appended from the library.
+    """
+    collections = wgts_collections(armature)
+    if not collections:
+        print(f"[AetherBlend] No WGTS collection found for armature '{armature.name}'. Skipping widget append.")
+        return 0
+
+    registry = _registry(collections)
+    registry.refresh()
+    wanted = {widget_name(name) for name in names} - {None}
+    missing = sorted(name for name in wanted if registry.get(name, rebuild=False) is None)
+    if not missing:
+        return 0
+
+    file_widgets = _file_widgets()
+    available = LIBRARY.names()
+    to_append = [name for name in missing if name not in file_widgets and name in available]
+    for obj in LIBRARY.append(to_append):
+        file_widgets[base_name(obj.name)] = obj
+
+    to_link: list[bpy.types.Object] = []
+    for name in missing:
+        obj = file_widgets.get(name)
+        if obj is None:
+            print(f"[AetherBlend] Widget '{name}' not found in '{LIBRARY.path.name}'.")
+            continue
+        to_link.append(obj)
+        registry.add(name, obj)
+
+    utils.collection.link_to_collection(to_link, collections[0])
+    return len(to_link)
@@ -9,6 +9,7 @@ from bpy.types import Operator
 from bpy.props import BoolProperty
 from bpy_extras.io_utils import ExportHelper
 from mathutils import Matrix, Euler
+from ...core import link_table
 from ...preferences import get_preferences
 from ...utils.axis_conversion import AXIS_ITEMS
 
@@ -287,26 +288,43 @@ class AETHER_OT_PoseExport(Operator, ExportHelper):
         }
         
         original_col = armature.data.collections.get('Original')
-        if not original_col:
+        links = link_table.load(armature)
+        if not original_col and not len(links):
             self.report({'ERROR'}, "Original bone collection not found")
             return {'CANCELLED'}
             
-        selected_bones = [bone.name for bone in original_col.bones]
-        for bone_name in selected_bones:
+        # Pose space matrix of every exported bone.
+        pose_bones = armature.pose.bones
+        export_bones = {bone.name: pose_bones[bone.name].matrix for bone in original_col.bones if bone.name in pose_bones} if original_col else {}
+
+        # Original bones removed by game support removal follow the Rigify bone that replaced them,
+        # offset by the difference between the two rest orientations.
+        skipped = []
+        for link in links:
+            if link.bone in pose_bones:
+                continue
+            target = pose_bones.get(link.target)
+            original_rest = link_table.rest_matrix(link)
+            if target is None or original_rest is None:
+                skipped.append(link.bone)
+                continue
+            export_bones[link.bone] = target.matrix @ target.bone.matrix_local.inverted() @ original_rest
+        if skipped:
+            print(f"[AetherBlend] Pose export skipped {len(skipped)} removed bones without a stored rest pose: {', '.join(skipped)}")
+
+        for bone_name, bone_matrix in export_bones.items():
             clean_bone_name = re.sub(r"\.\d+$", "", bone_name)
-            bone = armature.pose.bones.get(bone_name)
-            if bone:
-                bone_matrix_world = armature.matrix_world @ bone.matrix
-                if self.use_pose_axis_conversion:
-                    bone_matrix_world = bone_matrix_world @ pose_correction_matrix
-                bone_matrix_world = x_rotation @ bone_matrix_world
-                
-                bone_data = {}
-                bone_data["Position"] = f"{bone_matrix_world.translation.x:.6f}, {bone_matrix_world.translation.y:.6f}, {bone_matrix_world.translation.z:.6f}"
-                bone_data["Rotation"] = f"{bone_matrix_world.to_quaternion().x:.6f}, {bone_matrix_world.to_quaternion().y:.6f}, {bone_matrix_world.to_quaternion().z:.6f}, {bone_matrix_world.to_quaternion().w:.6f}"
-                bone_data["Scale"] = f"{bone_matrix_world.to_scale().x:.8f}, {bone_matrix_world.to_scale().y:.8f}, {bone_matrix_world.to_scale().z:.8f}"
-                
-                skeleton_data["Bones"][clean_bone_name] = bone_data
+            bone_matrix_world = armature.matrix_world @ bone_matrix
+            if self.use_pose_axis_conversion:
+                bone_matrix_world = bone_matrix_world @ pose_correction_matrix
+            bone_matrix_world = x_rotation @ bone_matrix_world
+
+            bone_data = {}
+            bone_data["Position"] = f"{bone_matrix_world.translation.x:.6f}, {bone_matrix_world.translation.y:.6f}, {bone_matrix_world.translation.z:.6f}"
+            bone_data["Rotation"] = f"{bone_matrix_world.to_quaternion().x:.6f}, {bone_matrix_world.to_quaternion().y:.6f}, {bone_matrix_world.to_quaternion().z:.6f}, {bone_matrix_world.to_quaternion().w:.6f}"
+            bone_data["Scale"] = f"{bone_matrix_world.to_scale().x:.8f}, {bone_matrix_world.to_scale().y:.8f}, {bone_matrix_world.to_scale().z:.8f}"
+
+            skeleton_data["Bones"][clean_bone_name] = bone_data
 
         if self.include_preview_image:
             encoded_image = self._get_preview_base64(context)
@@ -125,8 +125,7 @@ class AETHER_OT_CreateBackupArmature(bpy.types.Operator):
             cplus.backup_armature = None
 
         # Create backup armature
-        backup = utils.armature.duplicate(armature)
-        backup.name = f"BACKUP_{armature.name}"
+        backup = utils.armature.construct.copy(armature, name=f"BACKUP_{armature.name}")
         
         # Parent backup to original armature
         backup.parent = armature
@@ -203,7 +203,7 @@ class AETHER_OT_Character_Import(bpy.types.Operator):
             split.prop(self, "secondary_bone_axis", text="")
  
     def execute(self, context):  
-        bpy.context.window.cursor_set('WAIT')   
+        utils.window.set_cursor('WAIT')   
         
         if not self.filepath or not (self.filepath.lower().endswith(".gltf") or self.filepath.lower().endswith(".glb") or self.filepath.lower().endswith(".fbx")): 
             self.report({'ERROR'}, "[AetherBlend] Invalid file format. Please select a .gltf, .glb, or .fbx file.")
@@ -279,8 +279,7 @@ class AETHER_OT_Character_Import(bpy.types.Operator):
                 cplus = getattr(armature, 'aether_cplus', None)
                 if cplus:
                     # Create backup
-                    backup = utils.armature.duplicate(armature)
-                    backup.name = f"BACKUP_{armature.name}"
+                    backup = utils.armature.construct.copy(armature, name=f"BACKUP_{armature.name}")
                     backup.parent = armature
                     backup.matrix_parent_inverse = armature.matrix_world.inverted()
                     backup.hide_set(True)
@@ -319,7 +318,7 @@ class AETHER_OT_Character_Import(bpy.types.Operator):
         if get_preferences().auto_navigate_tabs == 'ON':
             set_active_tab(context, 'GENERATE')
         
-        bpy.context.window.cursor_set('DEFAULT')
+        utils.window.set_cursor('DEFAULT')
         return {'FINISHED'}
 
 
@@ -1,8 +1,10 @@
 import bpy
 import collections
+import json
 from ...properties.tab_prop import get_active_tab
 from ...utils import addon_dependencies
 from ...utils.ui_visibility import visible_in_current_area
+from ...core import link_table
 from . import template_manager
 from .ui_links import UI_LINKS
 
@@ -125,6 +127,7 @@ class AETHER_PT_RigCreation(bpy.types.Panel):
         meta_rig_button = col.row(align=True)
         meta_rig_button.scale_y = 0.95
         meta_rig_button.operator("aether.generate_meta_rig", text="Generate Meta Rig", icon="ARMATURE_DATA")
+        meta_rig_button.operator("aether.plan_rig", text="", icon="VIEWZOOM")
 
         row = col.row(align=True)
 
@@ -200,6 +203,71 @@ class AETHER_PT_RigCreation(bpy.types.Panel):
             remove.module_index = aether_rig.module_index
 
 
+class AETHER_PT_GenerationProfile(bpy.types.Panel):
+    bl_label = "Generation Profile"
+    bl_idname = "AETHER_PT_generation_profile"
+    bl_parent_id = "AETHER_PT_rig_creation_panel"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = 'AetherBlend'
+    bl_options = {'DEFAULT_CLOSED'}
+
+    _CATEGORY_LABELS = (
+        ("stages", "Stages", 'SEQUENCE'),
+        ("modules", "Modules", 'GROUP_BONE'),
+        ("bone_groups", "Bone Groups", 'BONE_DATA'),
+        ("operations", "Operations", 'MODIFIER'),
+    )
+
+    @classmethod
+    def poll(cls, context):
+        if not visible_in_current_area(context):
+            return False
+        if get_active_tab(context) != 'GENERATE':
+            return False
+
+        armature = context.active_object
+        aether_rig = getattr(armature, 'aether_rig', None) if armature else None
+        return bool(aether_rig and aether_rig.generation_profile)
+
+    def draw(self, context):
+        layout = self.layout
+        aether_rig = context.active_object.aether_rig
+
+        try:
+            profile = json.loads(aether_rig.generation_profile)
+        except json.JSONDecodeError:
+            layout.label(text="Stored profile is invalid", icon='ERROR')
+            return
+
+        counters = profile.get("counters", {})
+        col = layout.column(align=True)
+        col.label(text=f"Total: {profile.get('total_seconds', 0.0):.3f}s ({profile.get('template', '')})", icon='TIME')
+        col.label(text=f"Bones created: {counters.get('bones_created', 0)}")
+        col.label(text=f"Mode switches: {counters.get('mode_switches', 0)}")
+        col.label(text=f"Slow-path drivers: {counters.get('drivers_slow_path', 0)}")
+
+        timings = profile.get("timings", {})
+        for category, title, icon in self._CATEGORY_LABELS:
+            entries = list(timings.get(category, {}).items())[:5]
+            if not entries:
+                continue
+
+            box = layout.box()
+            box.label(text=title, icon=icon)
+            col = box.column(align=True)
+            for key, entry in entries:
+                row = col.row(align=True)
+                row.label(text=key)
+                row.label(text=f"{entry.get('seconds', 0.0):.3f}s x{entry.get('calls', 0)}")
+
+        row = layout.row(align=True)
+        row.operator("aether.export_generation_profile", text="Export JSON", icon='EXPORT')
+        row.operator("aether.audit_drivers", text="", icon='DRIVER')
+        row.operator("aether.benchmark_playback", text="", icon='PLAY')
+        row.operator("aether.clear_generation_profile", text="", icon='TRASH')
+
+
 class AETHER_PT_RigManipulation(bpy.types.Panel):
     bl_label = "Rig Manipulation"
     bl_idname = "AETHER_PT_rig_manipulation"
@@ -242,6 +310,26 @@ class AETHER_PT_RigManipulation(bpy.types.Panel):
             icon="SHADERFX",
         )
 
+        if aether_rig.link_table and not aether_rig.converted and link_table.load(armature).direct():
+            row = layout.row(align=True)
+            row.label(text="Direct Links", icon='LINKED')
+            row.operator("aether.set_link_mode", text="Game").mode = 'GAME'
+            row.operator("aether.set_link_mode", text="Direct").mode = 'DIRECT'
+
+        if aether_rig.feature_bones:
+            layout.separator()
+            performance_on = bool(aether_rig.performance_state)
+            row = layout.row(align=True)
+            row.label(text="Performance Mode", icon='MOD_DECIM')
+            row.operator(
+                "aether.set_performance_mode",
+                text="Restore" if performance_on else "Enable",
+                icon='HIDE_OFF' if performance_on else 'HIDE_ON',
+            ).enable = not performance_on
+            row = layout.row(align=True)
+            row.enabled = not performance_on
+            row.prop(aether_rig, "performance_groups", expand=True)
+
         layout.separator()
         
         link_collection = armature.data.collections.get('LINK')
@@ -472,6 +560,7 @@ class AETHER_PT_RigBakeSettingsPanel(bpy.types.Panel):
 def register():
     bpy.utils.register_class(AETHER_UL_RigModules)
     bpy.utils.register_class(AETHER_PT_RigCreation)
+    bpy.utils.register_class(AETHER_PT_GenerationProfile)
     bpy.utils.register_class(AETHER_PT_RigManipulation)
     bpy.utils.register_class(AETHER_PT_RigLayersPanel)
     bpy.utils.register_class(AETHER_PT_RigUIPanel)
@@ -482,5 +571,6 @@ def unregister():
     bpy.utils.unregister_class(AETHER_PT_RigUIPanel)
     bpy.utils.unregister_class(AETHER_PT_RigLayersPanel)
     bpy.utils.unregister_class(AETHER_PT_RigManipulation)
+    bpy.utils.unregister_class(AETHER_PT_GenerationProfile)
     bpy.utils.unregister_class(AETHER_PT_RigCreation)
     bpy.utils.unregister_class(AETHER_UL_RigModules)
\ No newline at end of file
@@ -1,6 +1,7 @@
 import bpy
 
 from . import template_manager
+from ...core import performance_mode
 
 
 class AETHER_PROP_RigModuleItem(bpy.types.PropertyGroup):
@@ -111,6 +112,49 @@ class AETHER_PROP_Rig(bpy.types.PropertyGroup):
         options={'HIDDEN'}
     ) # type: ignore
 
+    generation_profile : bpy.props.StringProperty(
+        name="Generation Profile",
+        description="JSON timing report of the last rig generation",
+        default="",
+        options={'HIDDEN'}
+    ) # type: ignore
+
+    link_table : bpy.props.StringProperty(
+        name="Link Table",
+        description="Compact JSON table of the transform links of the generated rig: original bone, LINK bone, target, constraint and game parent",
+        default="",
+        options={'HIDDEN'}
+    ) # type: ignore
+
+    feature_bones : bpy.props.StringProperty(
+        name="Feature Bones",
+        description="JSON map of module family to the generated bones its modules created",
+        default="",
+        options={'HIDDEN'}
+    ) # type: ignore
+
+    performance_groups : bpy.props.EnumProperty(
+        name="Performance Groups",
+        description="Module families whose constraints and drivers are muted in performance mode",
+        items=performance_mode.FEATURE_GROUPS,
+        options={'ENUM_FLAG'},
+        default=performance_mode.DEFAULT_GROUPS,
+    ) # type: ignore
+
+    performance_state : bpy.props.StringProperty(
+        name="Performance State",
+        description="JSON record of the constraints, drivers and collections performance mode disabled",
+        default="",
+        options={'HIDDEN'}
+    ) # type: ignore
+
+    module_results : bpy.props.StringProperty(
+        name="Module Results",
+        description="JSON record of what each module produced in the last generation, used for incremental regeneration",
+        default="",
+        options={'HIDDEN'}
+    ) # type: ignore
+
     eye_lid_edit_mode : bpy.props.BoolProperty(
         name="Eye Lid Edit Mode",
         description="Whether the armature is in eye lid edit mode or not",
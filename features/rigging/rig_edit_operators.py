@@ -1,6 +1,8 @@
 import bpy
 from bpy.types import Operator
 from ...utils import armature as armature_utils 
+from ...core import direct_links
+from ...core import link_table
 
 class AETHER_OT_SetBoneInheritScale(Operator):
     bl_idname = "aether.set_bone_inherit_scale"
@@ -35,9 +37,11 @@ class AETHER_OT_SetBoneInheritScale(Operator):
         if aether_rig:
             aether_rig.link_inherit_scale = self.inherit_scale
         
+        # Directly linked original bones take the place of their LINK bone.
+        direct_bones = {link.bone for link in direct_links.load(armature)}
         bone_count = 0
         for bone in armature.pose.bones:
-            if bone.bone.collections.get('LINK'):
+            if bone.bone.collections.get('LINK') or bone.name in direct_bones:
                 bone.bone.inherit_scale = self.inherit_scale
                 bone_count += 1
         
@@ -71,6 +75,45 @@ class AETHER_OT_DeleteNoAnim(Operator):
         return {'FINISHED'}
 
 
+class AETHER_OT_SetLinkMode(Operator):
+    bl_idname = "aether.set_link_mode"
+    bl_label = "Set Link Mode"
+    bl_description = "Switch directly linked bones between the game hierarchy (needed for game export) and direct parenting (faster playback)"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    mode: bpy.props.EnumProperty(
+        name="Mode",
+        items=[
+            ('GAME', "Game", "Restore the game parents and follow the Rigify bones with constraints"),
+            ('DIRECT', "Direct", "Parent the bones to their Rigify bones without constraints"),
+        ],
+        default='GAME',
+    ) # type: ignore
+
+    def execute(self, context):
+        armature = context.active_object
+        if not armature or armature.type != 'ARMATURE':
+            self.report({'ERROR'}, "Select an armature")
+            return {'CANCELLED'}
+
+        links = direct_links.load(armature)
+        if not links:
+            self.report({'INFO'}, "This rig has no direct links")
+            return {'CANCELLED'}
+
+        original_mode = armature_utils._set_mode(armature, 'POSE')
+        try:
+            if self.mode == 'GAME':
+                changed = direct_links.to_game(armature, links)
+            else:
+                changed = direct_links.to_direct(armature, links)
+        finally:
+            armature_utils._restore_mode(armature, original_mode)
+
+        self.report({'INFO'}, f"Switched {changed} bones to {self.mode.lower()} links")
+        return {'FINISHED'}
+
+
 class AETHER_OT_RemoveGameSupport(Operator):
     bl_idname = "aether.remove_game_support"
     bl_label = "Remove Game Support"
@@ -95,16 +138,10 @@ class AETHER_OT_RemoveGameSupport(Operator):
         ## Since we are not changing any rigify bones, this can be done without harming animation data. 
         ## Downsides are, no backwards compatibility with the game/engine, other meshes with old vertex groups will no longer work.
         ## Since the original bones no longer exist.
-
-        ## How could we implement a reverse of this ? 
-        ## We do have a backup armature we coulkd use to restore the old bones. 
-        ## However what about the vertex groups ? I dont want to store the mapping in blender. 
-        ## We would have more options if the user would have something like "restore to backup"
-        ## then regenerates. Cause then we have basicly the mappings again and could re-rename the vertex groups.
-        ## All that wuld be easier if we would store transformLink pairs during rig generation on a custom property from teh armature.
-        ## I know i jsut said that i dont want to store the mapping in blender, but this would be a good use case for it.
-        ## There are many places where we could use it.
-        ## Maybe for another time (Shino) 
+        ## Only bones that copy the full transform of their Rigify bone are replaced; bones linked by custom
+        ## constraints (e.g. Copy Location only) keep their own bone and vertex group.
+        ## The original -> Rigify mapping comes from the link table stored during generation. It is kept after
+        ## the conversion, so a later restore from the backup armature can rename the vertex groups back.
 
         armature = context.active_object
         if not armature or armature.type != 'ARMATURE':
@@ -115,28 +152,16 @@ class AETHER_OT_RemoveGameSupport(Operator):
         try:
             bpy.context.window.cursor_set('WAIT')
 
-            transplant_map: dict[str, str] = {}
+            links = link_table.load(armature)
             reparent_map: dict[str, str] = {}
 
             data_bones = armature.data.bones
-            pose_bones = armature.pose.bones
-
-            for pose_bone in pose_bones:
-                if not pose_bone.bone.use_deform:
-                    continue
-
-                for constraint in pose_bone.constraints:
-                    if constraint.type != 'COPY_TRANSFORMS' or not constraint.name.startswith("AB-LINK"):
-                        continue
-
-                    if not (constraint.target and constraint.subtarget):
-                        break
-
-                    link_bone = data_bones.get(constraint.subtarget)
-                    rigify_bone = link_bone.parent if link_bone else None
-                    if rigify_bone:
-                        transplant_map[pose_bone.name] = rigify_bone.name
-                    break
+            transplant_map = {
+                link.bone: link.target
+                for link in links
+                if link.bone in data_bones and link.target in data_bones and data_bones[link.bone].use_deform
+                and link_table.is_full_transform(armature, link)
+            }
 
             for data_bone in data_bones:
                 if not data_bone.use_deform or data_bone.name not in transplant_map:
@@ -160,7 +185,8 @@ class AETHER_OT_RemoveGameSupport(Operator):
 
             for old_bone_name, new_bone_name in transplant_map.items():
                 old_bone = edit_bones.get(old_bone_name)
-                link_bone = edit_bones.get(f"LINK-{old_bone_name}")
+                link = links.get(old_bone_name)
+                link_bone = edit_bones.get(link.link_bone) if link.link_bone else None
                 new_bone = edit_bones.get(new_bone_name)
                 if not old_bone or not new_bone:
                     continue
@@ -179,6 +205,8 @@ class AETHER_OT_RemoveGameSupport(Operator):
             aether_rig = getattr(armature, 'aether_rig', None)
             if aether_rig is not None:
                 aether_rig.converted = True
+                if not aether_rig.link_table:
+                    link_table.store(armature, links)
 
         finally:
             armature_utils._restore_mode(armature, original_mode)
@@ -187,6 +215,7 @@ class AETHER_OT_RemoveGameSupport(Operator):
         return {'FINISHED'}
     
 def register():
+    bpy.utils.register_class(AETHER_OT_SetLinkMode)
     bpy.utils.register_class(AETHER_OT_RemoveGameSupport)
     bpy.utils.register_class(AETHER_OT_DeleteNoAnim)
     bpy.utils.register_class(AETHER_OT_SetBoneInheritScale)
@@ -195,3 +224,4 @@ def unregister():
     bpy.utils.unregister_class(AETHER_OT_DeleteNoAnim)
     bpy.utils.unregister_class(AETHER_OT_SetBoneInheritScale)
     bpy.utils.unregister_class(AETHER_OT_RemoveGameSupport)
+    bpy.utils.unregister_class(AETHER_OT_SetLinkMode)
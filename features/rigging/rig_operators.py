@@ -1,7 +1,15 @@
 import bpy
+import json
 import time
 
+from bpy_extras.io_utils import ExportHelper
+
 from ... import utils
+from ...core import benchmark
+from ...core import drivers
+from ...core import performance_mode
+from ...core import teardown
+from ...core import widgets
 from ...utils import addon_dependencies
 from . import template_manager
 from ...preferences import get_preferences
@@ -54,7 +62,7 @@ class AETHER_OT_Generate_Full_Rig(_ArmatureSelectionHelpers, bpy.types.Operator)
             return {'CANCELLED'}
 
         time_start = time.time()
-        bpy.context.window.cursor_set('WAIT')
+        utils.window.set_cursor('WAIT')
 
         try:
             armature = self._get_active_armature(context)
@@ -77,6 +85,8 @@ class AETHER_OT_Generate_Full_Rig(_ArmatureSelectionHelpers, bpy.types.Operator)
             if not rig_generator.generate_rigify_rig(state):
                 self.report({'ERROR'}, "Rigify generation failed")
                 return {'CANCELLED'}
+
+            rig_generator.store_profile(state)
             
             if get_preferences().auto_navigate_tabs == 'ON':
                 set_active_tab(context, 'RIG_LAYERS')
@@ -87,7 +97,7 @@ class AETHER_OT_Generate_Full_Rig(_ArmatureSelectionHelpers, bpy.types.Operator)
             print(f"[AetherBlend] Full rig generation: {time.time() - time_start:.3f}s")
             return {'FINISHED'}
         finally:
-            bpy.context.window.cursor_set('DEFAULT')
+            utils.window.set_cursor('DEFAULT')
 
 class AETHER_OT_Generate_Meta_Rig(_ArmatureSelectionHelpers, bpy.types.Operator):
     bl_idname = "aether.generate_meta_rig"
@@ -100,7 +110,7 @@ class AETHER_OT_Generate_Meta_Rig(_ArmatureSelectionHelpers, bpy.types.Operator)
             return {'CANCELLED'}
 
         time_start = time.time()
-        bpy.context.window.cursor_set('WAIT')
+        utils.window.set_cursor('WAIT')
 
         try:
             armature = self._get_active_armature(context)
@@ -121,12 +131,111 @@ class AETHER_OT_Generate_Meta_Rig(_ArmatureSelectionHelpers, bpy.types.Operator)
                 return {'CANCELLED'}
 
             rig_generator.reveal_meta_rig(state)
+            rig_generator.store_profile(state)
 
             print(f"[AetherBlend] Meta rig generation: {time.time() - time_start:.3f}s")
             return {'FINISHED'}
         finally:
-            bpy.context.window.cursor_set('DEFAULT')
+            utils.window.set_cursor('DEFAULT')
     
+class AETHER_OT_Plan_Rig(bpy.types.Operator):
+    bl_idname = "aether.plan_rig"
+    bl_label = "Check Template"
+    bl_description = "Check which modules of the selected template fit this armature without generating anything"
+    bl_options = {'REGISTER'}
+
+    @classmethod
+    def poll(cls, context):
+        armature = context.active_object
+        return bool(armature and armature.type == 'ARMATURE' and getattr(armature, 'aether_rig', None))
+
+    def execute(self, context):
+        armature = context.active_object
+        rig_generator = template_manager.get_rig_generator(armature.aether_rig)
+        if not rig_generator:
+            self.report({'ERROR'}, "No rig template/modules configured for this armature")
+            return {'CANCELLED'}
+
+        plan = rig_generator.plan(armature)
+        for group in plan.groups:
+            for candidate in group.candidates:
+                status = "runs" if candidate.key == group.winner else ("fallback" if candidate.will_run else "skipped")
+                print(f"[AetherBlend]   {candidate.key}: {status}")
+                if candidate.missing_bones and candidate.key != group.winner:
+                    print(f"[AetherBlend]     missing: {', '.join(candidate.missing_bones)}")
+
+        if not plan.generates_bones and plan.certain:
+            self.report({'WARNING'}, f"No generator module fits this armature. {plan.summary()}")
+        else:
+            self.report({'INFO'}, plan.summary())
+        return {'FINISHED'}
+
+class AETHER_OT_Audit_Drivers(bpy.types.Operator):
+    bl_idname = "aether.audit_drivers"
+    bl_label = "Audit Drivers"
+    bl_description = "List the drivers of this rig that Blender has to evaluate with Python instead of its fast expression evaluator"
+    bl_options = {'REGISTER'}
+
+    @classmethod
+    def poll(cls, context):
+        armature = context.active_object
+        return bool(armature and armature.type == 'ARMATURE')
+
+    def execute(self, context):
+        armature = context.active_object
+        slow_drivers = drivers.audit(armature)
+
+        for entry in slow_drivers:
+            print(f"[AetherBlend]   {entry.owner}: {entry.data_path}[{entry.array_index}] = '{entry.expression}' ({entry.reason})")
+            if entry.suggestion:
+                print(f"[AetherBlend]     can be rewritten as: {entry.suggestion}")
+
+        if slow_drivers:
+            self.report({'WARNING'}, f"{len(slow_drivers)} driver(s) of '{armature.name}' run on the Python path. See the console for details.")
+        else:
+            self.report({'INFO'}, f"All drivers of '{armature.name}' use the fast expression evaluator")
+        return {'FINISHED'}
+
+class AETHER_OT_Set_Performance_Mode(bpy.types.Operator):
+    bl_idname = "aether.set_performance_mode"
+    bl_label = "Performance Mode"
+    bl_description = "Mute the constraints and drivers of the selected feature groups and hide their bone collections, or restore them"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    enable: bpy.props.BoolProperty(
+        name="Enable",
+        description="Enable performance mode; disabling restores everything it muted or hid",
+        default=True,
+    ) # type: ignore
+
+    @classmethod
+    def poll(cls, context):
+        armature = context.active_object
+        return bool(armature and armature.type == 'ARMATURE' and armature.aether_rig.rigified)
+
+    def execute(self, context):
+        armature = context.active_object
+
+        if not self.enable:
+            restored = performance_mode.disable(armature)
+            self.report({'INFO'}, f"Restored {restored['constraints']} constraint(s), {restored['drivers']} driver(s) and {restored['collections']} collection(s)")
+            return {'FINISHED'}
+
+        if not armature.aether_rig.feature_bones:
+            self.report({'WARNING'}, "This rig has no feature ownership data. Regenerate it to use performance mode.")
+            return {'CANCELLED'}
+
+        groups = set(armature.aether_rig.performance_groups)
+        if not groups:
+            self.report({'WARNING'}, "Select at least one feature group")
+            return {'CANCELLED'}
+
+        muted = performance_mode.enable(armature, groups)
+        print(f"[AetherBlend] Performance mode on '{armature.name}' ({', '.join(sorted(groups))}): {muted['bones']} bones, "
+              f"{muted['constraints']} constraints, {muted['drivers']} drivers and {muted['collections']} collections disabled")
+        self.report({'INFO'}, f"Muted {muted['constraints']} constraint(s) and {muted['drivers']} driver(s), hid {muted['collections']} collection(s)")
+        return {'FINISHED'}
+
 class AETHER_OT_Clean_Up_Rig(bpy.types.Operator):
     bl_idname = "aether.clean_up_rig"
     bl_label = "Remove Rigify Rig"
@@ -134,71 +243,21 @@ class AETHER_OT_Clean_Up_Rig(bpy.types.Operator):
     bl_options = {'REGISTER', 'UNDO'}
 
     def execute(self, context):
-        time_start = time.time()
-        bpy.context.window.cursor_set('WAIT') 
-
         armature = context.active_object
         if not armature or armature.type != 'ARMATURE':
             return {'CANCELLED'}
         
-        rig_collections = armature.data.collections
-        if not rig_collections.get("Original"):
+        if not armature.data.collections_all.get("Original"):
             return {'FINISHED'} # If it doesnt have an Original collection, we can assume its already clean and just exit
 
-        ## Delete Meta Rig and Scripts
-        existing_meta_rig = armature.aether_rig.meta_rig
-        
-        if existing_meta_rig:
-            if hasattr(existing_meta_rig.data, 'rigify_rig_ui') and existing_meta_rig.data.rigify_rig_ui:
-                script = existing_meta_rig.data.rigify_rig_ui
-                if script and script.name in bpy.data.texts:
-                    bpy.data.texts.remove(script)
-            bpy.data.objects.remove(existing_meta_rig, do_unlink=True)
-        
-        ## Cleanup Rigify ID
-        if "rig_id" in armature.data:
-            del armature.data["rig_id"]
-
-        ## Delete Drivers 
+        utils.window.set_cursor('WAIT')
         try:
-            for fc in armature.data.animation_data.drivers:
-                armature.data.driver_remove(fc.data_path, fc.array_index)
-        except:
-            pass
-        
-        # Cleanup Bones
-        bpy.ops.object.mode_set(mode='EDIT')
-        edit_bones = armature.data.edit_bones
-        for bone in edit_bones:
-            delete = True
-            for coll in bone.collections:
-                if coll.name == "Original":
-                    delete = False
-                else:
-                    coll.unassign(bone)
-            if delete:
-                edit_bones.remove(bone)
-
-        try:
-            bpy.ops.armature.collection_remove_unused()
-        except RuntimeError:
-            pass
-
-        armature.aether_rig.rigified = False
-
-        for coll in armature.data.collections:
-            if coll.name == "Original":
-                coll.is_visible = True
-
-        ## Cleanup Rigify Settings and Constrains
-        for pose_bone in armature.pose.bones:
-            pose_bone.rigify_type = " "
-            for constraint in pose_bone.constraints:
-                pose_bone.constraints.remove(constraint)
-
-        bpy.ops.object.mode_set(mode='OBJECT')
+            report = teardown.teardown(armature)
+        finally:
+            utils.window.set_cursor('DEFAULT')
 
-        print(f"[AetherBlend] Clean Up rig: {time.time() - time_start:.3f}s")
+        print(f"[AetherBlend] Clean Up rig: {report.summary()}")
+        self.report({'INFO'}, f"Clean Up {report.summary()}")
         return {'FINISHED'}
     
 class AETHER_OT_Reset_Rig(bpy.types.Operator):
@@ -212,19 +271,119 @@ class AETHER_OT_Reset_Rig(bpy.types.Operator):
         if not armature or armature.type != 'ARMATURE':
             return {'CANCELLED'}
         
-        result = bpy.ops.aether.clean_up_rig()
-        if result != {'FINISHED'}:
-            self.report({'ERROR'}, "Clean Up process Failed")
+        utils.window.set_cursor('WAIT')
+        try:
+            report = teardown.teardown(armature) if armature.data.collections_all.get("Original") else None
+        except Exception as e:
+            self.report({'ERROR'}, f"Clean Up process Failed: {e}")
             return {'CANCELLED'}
+        finally:
+            utils.window.set_cursor('DEFAULT')
         
         # Remove all animation data
         if armature.animation_data:
             armature.animation_data_clear()
         
         bpy.ops.object.mode_set(mode='OBJECT')
+        if report:
+            print(f"[AetherBlend] Reset rig: {report.summary()}")
+            self.report({'INFO'}, f"Reset {report.summary()}")
+        return {'FINISHED'}
+
+class AETHER_OT_Export_Generation_Profile(bpy.types.Operator, ExportHelper):
+    bl_idname = "aether.export_generation_profile"
+    bl_label = "Export Generation Profile"
+    bl_description = "Write the timing report of the last rig generation to a JSON file"
+    bl_options = {'REGISTER'}
+
+    filepath: bpy.props.StringProperty(subtype="FILE_PATH") # type: ignore
+    filename_ext = '.json'
+    filter_glob: bpy.props.StringProperty(default='*.json', options={'HIDDEN'}) # type: ignore
+
+    @classmethod
+    def poll(cls, context):
+        armature = context.active_object
+        return bool(armature and armature.type == 'ARMATURE' and armature.aether_rig.generation_profile)
+
+    def execute(self, context):
+        profile = context.active_object.aether_rig.generation_profile
+        try:
+            payload = json.loads(profile)
+        except json.JSONDecodeError:
+            self.report({'ERROR'}, "Stored generation profile is not valid JSON")
+            return {'CANCELLED'}
+
+        with open(self.filepath, "w", encoding="utf-8") as f:
+            json.dump(payload, f, indent=2)
+
+        self.report({'INFO'}, f"Generation profile written to {self.filepath}")
+        return {'FINISHED'}
+
+class AETHER_OT_Benchmark_Playback(bpy.types.Operator, ExportHelper):
+    bl_idname = "aether.benchmark_playback"
+    bl_label = "Benchmark Playback"
+    bl_description = "Play synthetic FK/IK motion on the generated rig, time every frame and write the report to a JSON file"
+    bl_options = {'REGISTER'}
+
+    filepath: bpy.props.StringProperty(subtype="FILE_PATH") # type: ignore
+    filename_ext = '.json'
+    filter_glob: bpy.props.StringProperty(default='*.json', options={'HIDDEN'}) # type: ignore
+
+    frame_count: bpy.props.IntProperty(name="Frames", description="Number of frames to scrub, starting at the scene start frame", default=120, min=2) # type: ignore
+    warmup_frames: bpy.props.IntProperty(name="Warm-up Frames", description="Frames evaluated before timing starts", default=10, min=0) # type: ignore
+
+    @classmethod
+    def poll(cls, context):
+        armature = context.active_object
+        return bool(armature and armature.type == 'ARMATURE' and armature.aether_rig.rigified)
+
+    def execute(self, context):
+        armature = context.active_object
+        if armature.mode == 'EDIT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+
+        utils.window.set_cursor('WAIT')
+        try:
+            report = benchmark.run(armature, frame_count=self.frame_count, warmup_frames=self.warmup_frames)
+        finally:
+            utils.window.set_cursor('DEFAULT')
+
+        with open(self.filepath, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+        timing = report["timing"]
+        print(f"[AetherBlend] Playback benchmark '{armature.name}': {timing['fps']:.1f} fps, "
+              f"mean {timing['mean_ms']:.2f}ms, worst frame {timing['worst_frame']} ({timing['worst_ms']:.2f}ms), "
+              f"{report['rig']['constraints']} constraints, {report['rig']['drivers']} drivers")
+        objects = report["objects"]
+        if objects:
+            meshes = ", ".join(f"{entry['name']} {entry['mean_ms']:.2f}ms" for entry in objects["meshes"][:3])
+            print(f"[AetherBlend]   armature {objects['armature']['mean_ms']:.2f}ms per frame, meshes: {meshes or 'none'}")
+        self.report({'INFO'}, f"{timing['fps']:.1f} fps, report written to {self.filepath}")
+        return {'FINISHED'}
+
+class AETHER_OT_Clear_Generation_Profile(bpy.types.Operator):
+    bl_idname = "aether.clear_generation_profile"
+    bl_label = "Clear Generation Profile"
+    bl_description = "Remove the stored timing report of the last rig generation"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        armature = context.active_object
+        if not armature or armature.type != 'ARMATURE':
+            return {'CANCELLED'}
+
+        armature.aether_rig.generation_profile = ""
         return {'FINISHED'}
 
 def register():
+    widgets.register()
+    bpy.utils.register_class(AETHER_OT_Export_Generation_Profile)
+    bpy.utils.register_class(AETHER_OT_Clear_Generation_Profile)
+    bpy.utils.register_class(AETHER_OT_Benchmark_Playback)
+    bpy.utils.register_class(AETHER_OT_Plan_Rig)
+    bpy.utils.register_class(AETHER_OT_Audit_Drivers)
+    bpy.utils.register_class(AETHER_OT_Set_Performance_Mode)
     bpy.utils.register_class(AETHER_OT_Clean_Up_Rig)
     bpy.utils.register_class(AETHER_OT_Reset_Rig)
     bpy.utils.register_class(AETHER_OT_Generate_Full_Rig)
@@ -233,5 +392,12 @@ def register():
 def unregister():
     bpy.utils.unregister_class(AETHER_OT_Generate_Meta_Rig)
     bpy.utils.unregister_class(AETHER_OT_Clean_Up_Rig)
+    bpy.utils.unregister_class(AETHER_OT_Set_Performance_Mode)
+    bpy.utils.unregister_class(AETHER_OT_Audit_Drivers)
+    bpy.utils.unregister_class(AETHER_OT_Plan_Rig)
     bpy.utils.unregister_class(AETHER_OT_Reset_Rig)
-    bpy.utils.unregister_class(AETHER_OT_Generate_Full_Rig)
\ No newline at end of file
+    bpy.utils.unregister_class(AETHER_OT_Generate_Full_Rig)
+    bpy.utils.unregister_class(AETHER_OT_Benchmark_Playback)
+    bpy.utils.unregister_class(AETHER_OT_Clear_Generation_Profile)
+    bpy.utils.unregister_class(AETHER_OT_Export_Generation_Profile)
+    widgets.unregister()
\ No newline at end of file
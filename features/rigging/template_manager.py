@@ -1,6 +1,7 @@
 from ...core.aether_rig_generator import AetherRigGenerator
+from ...core.operations import LinkMode
 from ...core.shared import RigModule, Template
-from ...preferences import get_default_custom_template_path, get_preferences
+from ...preferences import get_default_custom_template_path, get_meta_rig_cache, get_preferences
 from .templates import AVAILABLE_MODULES, CS_COLORSETS, get_module_key
 from pathlib import Path
 import bpy
@@ -14,6 +15,7 @@ _TEMPLATE_JSON_DIR = Path(__file__).resolve().parent / "templates" / "json"
 ## Defaults
 DEFAULT_TEMPLATE_NAME = 'FFXIV-Default'
 DEFAULT_COLORSET_NAME = 'AetherBlend'
+LINK_MODES: tuple[LinkMode, ...] = ("LINK", "DIRECT")
 
 
 def get_custom_template_json_dir() -> Path:
@@ -174,7 +176,12 @@ def _template_from_definition(template_name: str, definition: dict) -> Template
     if not module_groups:
         return None
     
-    return Template(name=template_name, modules=module_groups)
+    link_mode = definition.get("link_mode", "LINK")
+    if link_mode not in LINK_MODES:
+        print(f"[AetherBlend] Template '{template_name}' has unknown link_mode '{link_mode}', using 'LINK'.")
+        link_mode = "LINK"
+
+    return Template(name=template_name, modules=module_groups, link_mode=link_mode)
 
 
 def _get_template_from_json(template_name: str) -> Template | None:
@@ -185,7 +192,7 @@ def _get_template_from_json(template_name: str) -> Template | None:
     return _template_from_definition(template_name, definition)
 
 
-def save_custom_template_json(template_name: str, module_keys: list[list[str]]) -> Path:
+def save_custom_template_json(template_name: str, module_keys: list[list[str]], link_mode: str = "LINK") -> Path:
     """Save a custom template definition to the custom JSON folder."""
     custom_dir = get_custom_template_json_dir()
     custom_dir.mkdir(parents=True, exist_ok=True)
@@ -199,6 +206,8 @@ def save_custom_template_json(template_name: str, module_keys: list[list[str]])
         "name": template_name,
         "module_keys": module_keys,
     }
+    if link_mode != "LINK":
+        payload["link_mode"] = link_mode
 
     with file_path.open("w", encoding="utf-8") as f:
         json.dump(payload, f, indent=2)
@@ -338,6 +347,9 @@ def get_rig_generator(aether_rig):
         name=generator_name,
         color_sets=color_sets,
         modules=modules,
+        module_key=get_module_key,
+        cache=get_meta_rig_cache(),
+        link_mode=template.link_mode,
     )
 
 def register():
@@ -342,7 +342,9 @@ class AETHER_OT_Save_Custom_Template_JSON(bpy.types.Operator):
             self.report({'WARNING'}, "Could not resolve modules for saving")
             return {'CANCELLED'}
 
-        file_path = template_manager.save_custom_template_json(template_name, module_keys)
+        source_template = template_manager.get_selected_template(aether_rig)
+        link_mode = source_template.link_mode if source_template else "LINK"
+        file_path = template_manager.save_custom_template_json(template_name, module_keys, link_mode)
         aether_rig.selected_template = template_manager.CUSTOM_TEMPLATE_NAME
         self.report({'INFO'}, f"Saved template JSON: {file_path.name}")
         return {'FINISHED'}
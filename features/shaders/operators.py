@@ -3,7 +3,7 @@ from typing import ClassVar, Mapping
 
 from . import shader_util
 from ...utils import addon_dependencies
-from ...utils.armature import find_meshes
+from ...utils import armature as armature_utils
 from ...preferences import get_preferences
 
 
@@ -74,12 +74,12 @@ class AETHER_OT_S_Iris(bpy.types.Operator):
             #####
             # Get Material
             #####
-            meshes = find_meshes(armature)
+            meshes = armature_utils.find_meshes(armature)
             if not meshes:
                 self.report({'ERROR'}, "No meshes found using the selected armature.")
                 return {'CANCELLED'}
             
-            eyes = shader_util.find_material_by_property(meshes, "ShaderPackage", "iris.shpk")
+            eyes = armature_utils.find_materials(armature, "ShaderPackage", "iris.shpk")
             if not eyes:
                 self.report({'ERROR'}, "No materials with ShaderPackage='iris.shpk' found on meshes driven by the armature.")
                 return {'CANCELLED'}
@@ -155,12 +155,12 @@ class AETHER_OT_S_Limbal(bpy.types.Operator):
             #####
             # Get Material
             #####
-            meshes = find_meshes(armature)
+            meshes = armature_utils.find_meshes(armature)
             if not meshes:
                 self.report({'ERROR'}, "No meshes found using the selected armature.")
                 return {'CANCELLED'}
             
-            eyes = shader_util.find_material_by_property(meshes, "ShaderPackage", "iris.shpk")
+            eyes = armature_utils.find_materials(armature, "ShaderPackage", "iris.shpk")
             if not eyes:
                 self.report({'ERROR'}, "No materials with ShaderPackage='iris.shpk' found on meshes driven by the armature.")
                 return {'CANCELLED'}
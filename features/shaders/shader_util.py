@@ -161,27 +161,6 @@ def refresh_shader_dependency_state(context, objects, material):
     scene.frame_set(scene.frame_current)
     context.view_layer.update()
 
-def find_material_by_property(
-    meshes: list[bpy.types.Object],
-    property_name: str,
-    property_value=None,
-) -> list[tuple[bpy.types.Object, bpy.types.Material]]:
-    """Finds materials used by meshes driven by the armature that have a custom property matching the filter criteria."""
-    materials = set()
-    for mesh in meshes:
-        if not mesh.data or not hasattr(mesh.data, 'materials'):
-            continue
-
-        for material_slot in mesh.material_slots:
-            material = material_slot.material
-            if not material or property_name not in material:
-                continue
-
-            if property_value is None or material[property_name] == property_value:
-                materials.add((mesh, material))
-
-    return list(materials)
-
 def pop_default_mappings(material, group_node):
     inputs = group_node.inputs
     for input in inputs:
@@ -0,0 +1,99 @@
+"""Batched spring bone vs. collider bone (capsule) collisions.
+
+Collider bones are capsules around their head-tail segment with the collider
+distance as radius. All spring/collider pairs are evaluated at once, either
+densely or, with the broad phase, only for pairs that share a cell of a uniform
+grid sized to the largest capsule.
+"""
+
+import numpy # type: ignore
+
+# Lock axis -> (axis index, sign); NONE is not listed.
+LOCK_AXES = {"+X": (0, 1.0), "-X": (0, -1.0), "+Y": (1, 1.0), "-Y": (1, -1.0), "+Z": (2, 1.0), "-Z": (2, -1.0)}
+# Plane the push is flattened onto per locked axis, as (point axis, normal axis).
+_LOCK_PLANES = ((1, 0), (2, 1), (2, 0))
+_LOCK_BLEND = 0.3
+
+
+def dense_pairs(spring_count: int, collider_count: int) -> tuple[numpy.ndarray, numpy.ndarray]:
+    springs, colliders = numpy.meshgrid(numpy.arange(spring_count), numpy.arange(collider_count), indexing="ij")
+    return springs.ravel(), colliders.ravel()
+
+
+def grid_pairs(centers: numpy.ndarray, heads: numpy.ndarray, tails: numpy.ndarray, radius: numpy.ndarray) -> tuple[numpy.ndarray, numpy.ndarray]:
+    """Spring/collider pairs whose grid cells overlap; every colliding pair is among them."""
+    low = numpy.minimum(heads, tails) - radius[:, None]
+    high = numpy.maximum(heads, tails) + radius[:, None]
+    cell_size = max(float(numpy.max(high - low)), 1e-6)
+
+    cells: dict[tuple[int, int, int], list[int]] = {}
+    low_cells = numpy.floor(low / cell_size).astype(numpy.int64)
+    high_cells = numpy.floor(high / cell_size).astype(numpy.int64)
+    for collider, (cell_low, cell_high) in enumerate(zip(low_cells, high_cells)):
+        # A capsule is at most one cell wide, so it touches at most 2x2x2 cells.
+        for x in range(cell_low[0], cell_high[0] + 1):
+            for y in range(cell_low[1], cell_high[1] + 1):
+                for z in range(cell_low[2], cell_high[2] + 1):
+                    cells.setdefault((x, y, z), []).append(collider)
+
+    spring_cells = numpy.floor(centers / cell_size).astype(numpy.int64)
+    unique_cells, inverse = numpy.unique(spring_cells, axis=0, return_inverse=True)
+    inverse = inverse.ravel()
+    spring_pairs: list[numpy.ndarray] = []
+    collider_pairs: list[numpy.ndarray] = []
+    for cell_index, cell in enumerate(unique_cells):
+        candidates = cells.get(tuple(int(value) for value in cell))
+        if not candidates:
+            continue
+        springs = numpy.flatnonzero(inverse == cell_index)
+        spring_pairs.append(numpy.repeat(springs, len(candidates)))
+        collider_pairs.append(numpy.tile(numpy.array(candidates, dtype=numpy.int64), len(springs)))
+
+    if not spring_pairs:
+        empty = numpy.empty(0, dtype=numpy.int64)
+        return empty, empty
+    return numpy.concatenate(spring_pairs), numpy.concatenate(collider_pairs)
+
+
+def push_forces(
+    centers: numpy.ndarray,
+    heads: numpy.ndarray,
+    tails: numpy.ndarray,
+    radius: numpy.ndarray,
+    force: numpy.ndarray,
+    springs: numpy.ndarray,
+    colliders: numpy.ndarray,
+) -> tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+    """Push of every given pair closer than the collider radius, as (spring indices, collider indices, pushes)."""
+    a = heads[colliders]
+    ab = tails[colliders] - a
+    point = centers[springs]
+    length_squared = numpy.einsum("ij,ij->i", ab, ab)
+    t = numpy.clip(numpy.einsum("ij,ij->i", point - a, ab) / numpy.maximum(length_squared, 1e-12), 0.0, 1.0)
+    offset = point - (a + t[:, None] * ab)
+    dist = numpy.linalg.norm(offset, axis=1)
+
+    hit = (dist < radius[colliders]) & (dist > 0.0)
+    springs, colliders, offset, dist = springs[hit], colliders[hit], offset[hit], dist[hit]
+    pushes = offset / dist[:, None] * ((radius[colliders] - dist) * force[colliders])[:, None]
+    return springs, colliders, pushes
+
+
+def lock_axes(pushes: numpy.ndarray, axes: numpy.ndarray, lock_index: numpy.ndarray, lock_sign: numpy.ndarray) -> numpy.ndarray:
+    """Flattens pushes that go along the locked axis of their spring.
+
+    axes holds the normalized x, y and z axes of each pair's spring, (pairs, 3, 3);
+    lock_index is -1 for springs without a locked axis.
+    """
+    pushes = pushes.copy()
+    for index, (point_axis, normal_axis) in enumerate(_LOCK_PLANES):
+        selected = numpy.flatnonzero(lock_index == index)
+        if not len(selected):
+            continue
+        push = pushes[selected]
+        direction = numpy.einsum("ij,ij->i", axes[selected, index], push) * lock_sign[selected]
+        selected, push = selected[direction > 0], push[direction > 0]
+        normal = axes[selected, normal_axis]
+        locked = push - numpy.einsum("ij,ij->i", push - axes[selected, point_axis], normal)[:, None] * normal
+        pushes[selected] = push * _LOCK_BLEND + locked * (1 - _LOCK_BLEND)
+    return pushes
@@ -0,0 +1,120 @@
+import bpy
+from bpy.app.handlers import persistent
+import numpy # type: ignore
+from mathutils import Vector
+from mathutils.bvhtree import BVHTree
+
+
+class MeshCollider:
+    """World space BVH of an evaluated collider mesh, queried once per spring bone."""
+
+    def __init__(self, obj: bpy.types.Object, vertices: numpy.ndarray, triangles: numpy.ndarray):
+        self.name = obj.name
+        self.distance = obj.ab_sb_collider_dist
+        self.force = obj.ab_sb_collider_force
+        self.vertices = vertices
+        self.triangles = triangles
+        self.bvh = BVHTree.FromPolygons(vertices.tolist(), triangles.tolist(), all_triangles=True)
+
+    def push(self, point: Vector) -> Vector | None:
+        """Returns the repulsion of a point closer to the surface than the collider distance, or None."""
+        location, normal, _index, dist = self.bvh.find_nearest(point, self.distance)
+        if location is None:
+            return None
+
+        direction = point - location
+        # A point on the surface has no direction of its own; push it out along the face normal.
+        if direction.length_squared == 0.0:
+            direction = normal
+        return direction.normalized() * (self.distance - dist) * self.force
+
+
+def world_vertices(mesh: bpy.types.Mesh, matrix_world) -> numpy.ndarray:
+    coords = numpy.empty(len(mesh.vertices) * 3, dtype=numpy.float64)
+    mesh.vertices.foreach_get("co", coords)
+    coords = coords.reshape(-1, 3)
+    matrix = numpy.array(matrix_world, dtype=numpy.float64)
+    return coords @ matrix[:3, :3].T + matrix[:3, 3]
+
+
+def loop_triangles(mesh: bpy.types.Mesh) -> numpy.ndarray:
+    mesh.calc_loop_triangles()
+    indices = numpy.empty(len(mesh.loop_triangles) * 3, dtype=numpy.int32)
+    mesh.loop_triangles.foreach_get("vertices", indices)
+    return indices.reshape(-1, 3)
+
+
+def build_mesh_collider(obj: bpy.types.Object, deps: bpy.types.Depsgraph) -> MeshCollider | None:
+    """Builds the collider of the evaluated mesh of obj and frees the temporary mesh."""
+    object_eval = obj.evaluated_get(deps)
+    mesh = object_eval.to_mesh(preserve_all_data_layers=False, depsgraph=deps)
+    try:
+        triangles = loop_triangles(mesh)
+        if not len(triangles):
+            return None
+        return MeshCollider(obj, world_vertices(mesh, object_eval.matrix_world), triangles)
+    finally:
+        object_eval.to_mesh_clear()
+
+
+class ColliderCache:
+    """Mesh colliders of the running simulation, built at most once per frame and collider update.
+
+    An entry stays valid until the frame changes or a depsgraph update touches the
+    collider object or its mesh, so every spring bone of a tick (and every tick of an
+    idle interactive session) shares one evaluation.
+    """
+
+    def __init__(self):
+        self._entries: dict[str, tuple[tuple, MeshCollider | None]] = {}
+        self._versions: dict[str, int] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, obj: bpy.types.Object, frame: int) -> tuple:
+        return (frame, self._versions.get(obj.name, 0), self._versions.get(obj.data.name, 0))
+
+    def get(self, obj: bpy.types.Object, deps: bpy.types.Depsgraph, frame: int) -> MeshCollider | None:
+        key = self._key(obj, frame)
+        entry = self._entries.get(obj.name)
+        if entry is not None and entry[0] == key:
+            self.hits += 1
+            collider = entry[1]
+            if collider is not None:
+                collider.distance = obj.ab_sb_collider_dist
+                collider.force = obj.ab_sb_collider_force
+            return collider
+
+        self.misses += 1
+        collider = build_mesh_collider(obj, deps)
+        self._entries[obj.name] = (key, collider)
+        return collider
+
+    def invalidate(self, name: str) -> None:
+        """Marks the colliders built from the object or mesh with this name as outdated."""
+        self._versions[name] = self._versions.get(name, 0) + 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict[str, int]:
+        return {"colliders": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+    def clear(self) -> None:
+        """Frees every collider and resets the counters."""
+        self._entries.clear()
+        self._versions.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+CACHE = ColliderCache()
+
+
+@persistent
+def collider_cache_update(scene, depsgraph):
+    if not len(CACHE):
+        return
+    for update in depsgraph.updates:
+        if update.is_updated_geometry or update.is_updated_transform:
+            CACHE.invalidate(update.id.original.name)
@@ -0,0 +1,285 @@
+"""Array-backed spring bone solver.
+
+The state of every spring bone of an armature lives in contiguous NumPy arrays:
+the simulated point (the tail for rotation springs, the head for location springs),
+its velocity, its rest offset in the parent bone's space and the per-bone
+parameters. A tick gathers the evaluated pose matrices in one foreach_get, steps all
+springs at once and writes the result straight to the bones' matrix_basis, in
+hierarchy order so chains follow their solved parents.
+
+Time advances in fixed substeps of 1/substeps scene frames, so the result only
+depends on the frame rate and substep count, never on how often the UI ticks. A
+tick runs any number of substeps on the arrays alone: the pose is read, the
+collisions are computed and the bones are written once per tick, while the
+targets are interpolated across the substeps.
+"""
+
+import bpy
+import numpy # type: ignore
+from mathutils import Matrix, Quaternion, Vector
+
+from . import capsules
+from .colliders import MeshCollider
+
+_PARAMETERS = ("ab_sb_stiffness", "ab_sb_damp", "ab_sb_gravity", "ab_sb_global_influence")
+# Longest stretch of time one tick catches up on; anything beyond is dropped instead of stalling the UI.
+MAX_FRAMES_PER_TICK = 4
+
+
+def _lerp_vec(vec_a, vec_b, t):
+    return vec_a*t + vec_b*(1-t)
+
+
+def _same(value_a, value_b) -> bool:
+    if isinstance(value_a, Quaternion):
+        return abs(value_a.dot(value_b)) > 1.0 - 1e-6
+    return (value_a - value_b).length < 1e-5
+
+
+def _gather(collection, attribute: str, size: int = 1, dtype=numpy.float64) -> numpy.ndarray:
+    values = numpy.empty(len(collection) * size, dtype=dtype)
+    collection.foreach_get(attribute, values)
+    return values if size == 1 else values.reshape(len(collection), size)
+
+
+class SpringSolver:
+    """Spring bones and colliders of one armature."""
+
+    def __init__(self, armature: bpy.types.Object, mesh_colliders: list[str]):
+        self.armature = armature
+        self.mesh_colliders = mesh_colliders
+
+        pose_bones = armature.pose.bones
+        index = {pose_bone.name: i for i, pose_bone in enumerate(pose_bones)}
+        springs = sorted(
+            (pose_bone for pose_bone in pose_bones if pose_bone.ab_sb_bone_spring),
+            key=lambda pose_bone: len(pose_bone.parent_recursive),
+        )
+        self.springs = springs
+        self.colliders = [pose_bone for pose_bone in pose_bones if pose_bone.ab_sb_bone_collider and not pose_bone.ab_sb_bone_spring]
+
+        count = len(springs)
+        self.bone_index = numpy.array([index[pose_bone.name] for pose_bone in springs], dtype=numpy.int64)
+        self.parent_index = numpy.array([index[pose_bone.parent.name] if pose_bone.parent else -1 for pose_bone in springs], dtype=numpy.int64)
+        # Position of the parent within the springs, so children are written relative to their solved parent.
+        spring_slot = {pose_bone.name: i for i, pose_bone in enumerate(springs)}
+        self.parent_slot = [spring_slot.get(pose_bone.parent.name, -1) if pose_bone.parent else -1 for pose_bone in springs]
+        self.rotation = numpy.array([pose_bone.ab_sb_bone_rot for pose_bone in springs], dtype=bool)
+        self.colliding = numpy.array([pose_bone.ab_sb_collide for pose_bone in springs], dtype=bool)
+        self.collider_index = numpy.array([index[pose_bone.name] for pose_bone in self.colliders], dtype=numpy.int64)
+        locks = [capsules.LOCK_AXES.get(pose_bone.ab_sb_lock_axis, (-1, 0.0)) for pose_bone in springs]
+        self.lock_index = numpy.array([lock[0] for lock in locks], dtype=numpy.int64)
+        self.lock_sign = numpy.array([lock[1] for lock in locks], dtype=numpy.float64)
+
+        # Rest matrix of each bone relative to its parent, the animated or user pose the springs layer on
+        # and the matrix_basis the solver last wrote, to tell its own writes from animation and user edits.
+        self.rest_local = [
+            (pose_bone.parent.bone.matrix_local.inverted() @ pose_bone.bone.matrix_local) if pose_bone.parent else pose_bone.bone.matrix_local.copy()
+            for pose_bone in springs
+        ]
+        self.basis = [pose_bone.matrix_basis.copy() for pose_bone in springs]
+        self.written: list[Matrix | None] = [None] * count
+
+        world = numpy.array(armature.matrix_world, dtype=numpy.float64)
+        points = numpy.array([tuple(pose_bone.tail if rotation else pose_bone.head) for pose_bone, rotation in zip(springs, self.rotation)], dtype=numpy.float64).reshape(count, 3)
+        self.positions = points @ world[:3, :3].T + world[:3, 3]
+        self.velocities = numpy.zeros((count, 3), dtype=numpy.float64)
+        # Targets of the last tick, the start of the interpolation of the next one.
+        self.targets = self.positions.copy()
+        # Substeps owed to the interactive timer and the frame of the last frame mode tick.
+        self.accumulator = 0.0
+        self.last_frame: int | None = None
+
+        # Rest offsets of the simulated points in their parent's space, so targets follow the parents.
+        parents = self._parent_world(self._pose_matrices())
+        self.offsets = numpy.einsum("nij,nj->ni", numpy.linalg.inv(parents), numpy.c_[self.positions, numpy.ones(count)])[:, :3]
+
+        self.parameters: dict[str, numpy.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self.springs)
+
+    def _pose_matrices(self) -> numpy.ndarray:
+        """Armature space pose matrices of every bone, (bones, 4, 4)."""
+        # foreach_get returns matrices column by column.
+        return _gather(self.armature.pose.bones, "matrix", 16).reshape(-1, 4, 4).transpose(0, 2, 1)
+
+    def _parent_world(self, pose_matrices: numpy.ndarray) -> numpy.ndarray:
+        world = numpy.array(self.armature.matrix_world, dtype=numpy.float64)
+        parents = numpy.broadcast_to(numpy.eye(4), (len(self.springs), 4, 4)).copy()
+        has_parent = self.parent_index >= 0
+        parents[has_parent] = pose_matrices[self.parent_index[has_parent]]
+        return world @ parents
+
+    def timer_steps(self, seconds: float, frame_rate: float, substeps: int) -> int:
+        """Substeps due after seconds of wall clock time; the remainder is kept for the next call."""
+        self.accumulator += seconds * frame_rate * substeps
+        steps = int(self.accumulator)
+        self.accumulator -= steps
+        return min(steps, MAX_FRAMES_PER_TICK * substeps)
+
+    def frame_steps(self, frame: int, substeps: int) -> int:
+        """Substeps from the last simulated frame to frame; jumps and going backwards count as one frame."""
+        frames = 1 if self.last_frame is None else frame - self.last_frame
+        self.last_frame = frame
+        if not 1 <= frames <= MAX_FRAMES_PER_TICK:
+            frames = 1
+        return frames * substeps
+
+    def refresh_parameters(self) -> None:
+        """Reads the spring parameters of all bones in one pass per parameter."""
+        pose_bones = self.armature.pose.bones
+        for name in _PARAMETERS:
+            self.parameters[name] = _gather(pose_bones, name)[self.bone_index]
+
+    def _bone_collision_forces(self, pose_matrices: numpy.ndarray, broad_phase: bool) -> numpy.ndarray:
+        """Pushes of all collider bones on the colliding springs, summed per spring (world space).
+
+        Contacts and axis locks are computed in armature space, then the summed pushes are
+        transformed by the armature's world matrix like the simulated points.
+        """
+        forces = numpy.zeros((len(self.springs), 3), dtype=numpy.float64)
+        if not len(self.collider_index) or not self.colliding.any():
+            return forces
+
+        pose_bones = self.armature.pose.bones
+        heads = _gather(pose_bones, "head", 3)
+        tails = _gather(pose_bones, "tail", 3)
+        radius = _gather(pose_bones, "ab_sb_collider_dist")[self.collider_index]
+        force = _gather(pose_bones, "ab_sb_collider_force")[self.collider_index]
+        collider_heads = heads[self.collider_index]
+        collider_tails = tails[self.collider_index]
+
+        colliding = numpy.flatnonzero(self.colliding)
+        centers = (heads[self.bone_index[colliding]] + tails[self.bone_index[colliding]]) * 0.5
+        if broad_phase:
+            springs, colliders = capsules.grid_pairs(centers, collider_heads, collider_tails, radius)
+        else:
+            springs, colliders = capsules.dense_pairs(len(colliding), len(self.collider_index))
+        springs, colliders, pushes = capsules.push_forces(centers, collider_heads, collider_tails, radius, force, springs, colliders)
+        springs = colliding[springs]
+
+        locked = self.lock_index[springs] >= 0
+        if locked.any():
+            # Rows of axes are the normalized x, y and z axes of each spring.
+            axes = pose_matrices[self.bone_index[springs[locked]], :3, :3].transpose(0, 2, 1)
+            axes = axes / numpy.maximum(numpy.linalg.norm(axes, axis=2, keepdims=True), 1e-12)
+            pushes[locked] = capsules.lock_axes(pushes[locked], axes, self.lock_index[springs[locked]], self.lock_sign[springs[locked]])
+
+        numpy.add.at(forces, springs, pushes)
+        world = numpy.array(self.armature.matrix_world.to_3x3(), dtype=numpy.float64)
+        return forces @ world.T
+
+    def _mesh_collision_forces(self, mesh_colliders: list[MeshCollider]) -> numpy.ndarray:
+        forces = numpy.zeros((len(self.springs), 3), dtype=numpy.float64)
+        if not mesh_colliders:
+            return forces
+        world = self.armature.matrix_world
+        influence = self.parameters["ab_sb_global_influence"]
+        for i in numpy.flatnonzero(self.colliding):
+            pose_bone = self.springs[i]
+            world_center = world @ ((pose_bone.tail + pose_bone.head)*0.5)
+            for collider in mesh_colliders:
+                push_vec = collider.push(world_center)
+                if push_vec is not None:
+                    forces[i] += push_vec * influence[i]
+        return forces
+
+    def step(self, mesh_colliders: list[MeshCollider], broad_phase: bool = True, steps: int = 1, substeps: int = 1) -> None:
+        """Advances every spring by steps substeps of 1/substeps frames and poses the bones.
+
+        With one substep per frame this is the original per-frame update:
+        velocity += force * stiffness, velocity *= damp, position += velocity.
+        """
+        if not self.springs or steps <= 0:
+            return
+        self.refresh_parameters()
+        pose_matrices = self._pose_matrices()
+        parents = self._parent_world(pose_matrices)
+        targets = numpy.einsum("nij,nj->ni", parents, numpy.c_[self.offsets, numpy.ones(len(self.springs))])[:, :3]
+
+        # Gravity and collisions follow the pose, which only changes between ticks.
+        external = numpy.zeros_like(targets)
+        external[:, 2] -= self.parameters["ab_sb_gravity"]
+        external += self._bone_collision_forces(pose_matrices, broad_phase)
+        external += self._mesh_collision_forces(mesh_colliders)
+
+        dt = 1.0 / substeps
+        active = self.parameters["ab_sb_global_influence"] > 0.0
+        stiffness = self.parameters["ab_sb_stiffness"][active, None] * dt
+        damp = self.parameters["ab_sb_damp"][active, None] ** dt
+        external = external[active]
+        start = self.targets[active]
+        travel = targets[active] - start
+        positions = self.positions[active]
+        velocities = self.velocities[active]
+        for i in range(1, steps + 1):
+            forces = start + travel * (i / steps) - positions + external
+            velocities = (velocities + forces * stiffness) * damp
+            positions = positions + velocities * dt
+
+        self.positions = targets.copy()
+        self.positions[active] = positions
+        self.velocities[active] = velocities
+        self.targets = targets
+
+        influence = self.parameters["ab_sb_global_influence"][:, None]
+        self._write(pose_matrices, _lerp_vec(self.positions, targets, influence))
+
+    def _animated_basis(self, i: int, pose_bone: bpy.types.PoseBone) -> Matrix:
+        """The bone's current pose without the solver's own last write.
+
+        Location, rotation and scale still holding the value the solver wrote keep the
+        pose saved before that write; any other value was set by animation or the user.
+        """
+        live = pose_bone.matrix_basis
+        written = self.written[i]
+        if written is None:
+            return live.copy()
+        parts = zip(live.decompose(), written.decompose(), self.basis[i].decompose())
+        return Matrix.LocRotScale(*(previous if _same(current, last) else current for current, last, previous in parts))
+
+    def _write(self, pose_matrices: numpy.ndarray, points: numpy.ndarray) -> None:
+        """Poses each spring so it tracks (rotation) or sits on (location) its simulated point."""
+        world_inverse = self.armature.matrix_world.inverted()
+        solved: list[Matrix] = []
+        for i, pose_bone in enumerate(self.springs):
+            parent_slot = self.parent_slot[i]
+            if parent_slot >= 0:
+                parent = solved[parent_slot]
+            elif self.parent_index[i] >= 0:
+                parent = Matrix(pose_matrices[self.parent_index[i]].tolist())
+            else:
+                parent = Matrix.Identity(4)
+
+            rest = parent @ self.rest_local[i]
+            self.basis[i] = self._animated_basis(i, pose_bone)
+            matrix = rest @ self.basis[i]
+            point = world_inverse @ Vector(points[i])
+            if self.rotation[i]:
+                head = matrix.to_translation()
+                rotation = matrix.col[1].to_3d().rotation_difference(point - head)
+                matrix = Matrix.Translation(head) @ rotation.to_matrix().to_4x4() @ Matrix.Translation(-head) @ matrix
+            else:
+                matrix = matrix.copy()
+                matrix.translation = point
+
+            pose_bone.matrix_basis = rest.inverted() @ matrix
+            self.written[i] = pose_bone.matrix_basis.copy()
+            solved.append(matrix)
+
+    def restore(self) -> None:
+        """Puts the bones back in their pose without the springs."""
+        for pose_bone, basis in zip(self.springs, self.basis):
+            pose_bone.matrix_basis = basis
+
+
+def build(armature: bpy.types.Object) -> SpringSolver:
+    """Builds the solver of the armature's spring bones and removes legacy helper constraints."""
+    for pose_bone in armature.pose.bones:
+        spring_cns = pose_bone.constraints.get("spring")
+        if spring_cns:
+            pose_bone.constraints.remove(spring_cns)
+
+    mesh_colliders = [obj.name for obj in bpy.data.objects if obj.type == "MESH" and obj.ab_sb_object_collider]
+    return SpringSolver(armature, mesh_colliders)
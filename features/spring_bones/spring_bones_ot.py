@@ -2,10 +2,11 @@ import bpy, time
 from bpy.app.handlers import persistent
 from mathutils import *
 import math
-import numpy # type: ignore
-from numpy import dot # type: ignore
-from math import sqrt
 from mathutils import Vector
+from . import colliders
+from . import solver
+
+SOLVER: solver.SpringSolver | None = None
 
 def set_active_object(object_name):
      bpy.context.view_layer.objects.active = bpy.data.objects[object_name]
@@ -22,494 +23,61 @@ def get_pose_bone(name):
 def spring_bone_frame_mode(foo):   
     if bpy.context.scene.ab_sb_global_spring_frame == True:
         try:
-            spring_bone(foo)
+            if SOLVER is not None:
+                spring_bone(foo, SOLVER.frame_steps(bpy.context.scene.frame_current, bpy.context.scene.ab_sb_substeps))
         except Exception as e:
             print(f"[AetherBlend][SB] Error in spring_bone_frame_mode: {e}")
             bpy.context.scene.ab_sb_global_spring_frame = False
+            stop_solver()
  
-def lerp_vec(vec_a, vec_b, t):                        
-    return vec_a*t + vec_b*(1-t)
-                             
-    
-def spring_bone(foo):
-    #print("running...")
+def spring_bone(foo, steps=1):
+    if SOLVER is None or steps <= 0:
+        return None
     scene = bpy.context.scene  
     deps = bpy.context.evaluated_depsgraph_get()    
-  
-    for bone in scene.ab_sb_spring_bones: 
-        # collider, skip
-        if bone.ab_sb_bone_collider:
-            continue
-        armature = bpy.data.objects[bone.armature]
-        pose_bone = armature.pose.bones[bone.name]  
-        # no influence, skip
-        if pose_bone.ab_sb_global_influence == 0.0:
-            continue
-          
-        emp_tail = bpy.data.objects.get(bone.name + '_spring_tail')        
-        emp_head = bpy.data.objects.get(bone.name + '_spring')
-        
-        if emp_tail == None or emp_head == None:
-            #print("no empties found, return")
-            return
-                       
-        emp_tail_loc, rot, scale = emp_tail.matrix_world.decompose()
-                
-        axis_locked = None        
-        if 'ab_sb_lock_axis' in pose_bone.keys():
-            axis_locked = pose_bone.ab_sb_lock_axis
-        
-        # add gravity
-        base_pos_dir = Vector((0,0,-pose_bone.ab_sb_gravity))
-       
-        # add spring
-        base_pos_dir += (emp_tail_loc - emp_head.location)
-        
-        # evaluate bones collision
-        if bone.ab_sb_bone_colliding:
-           
-            for bone_col in scene.ab_sb_spring_bones:            
-                if bone_col.ab_sb_bone_collider == False:
-                    continue
-                #print("collider bone", bone_col.name)
-                pose_bone_col = armature.pose.bones[bone_col.name]   
-                ab_sb_collider_dist = pose_bone_col.ab_sb_collider_dist
-                #col_dir = (pose_bone.head - pose_bone_col.head)
-                pose_bone_center = (pose_bone.tail + pose_bone.head)*0.5
-                p = project_point_onto_line(pose_bone_col.head, pose_bone_col.tail, pose_bone_center)
-                col_dir = (pose_bone_center - p)
-                dist = col_dir.magnitude
-                
-                if dist < ab_sb_collider_dist:   
-                    push_vec = col_dir.normalized() * (ab_sb_collider_dist-dist)*pose_bone_col.ab_sb_collider_force
-                    if axis_locked != "NONE" and axis_locked != None:                    
-                        if axis_locked == "+Y":                        
-                            direction_check = pose_bone.y_axis.normalized().dot(push_vec)                      
-                            if direction_check > 0:                        
-                                locked_vec = project_point_onto_plane(push_vec, pose_bone.z_axis, pose_bone.y_axis)
-                                push_vec = lerp_vec(push_vec, locked_vec, 0.3)
-                                
-                        elif axis_locked == "-Y":                        
-                            direction_check = pose_bone.y_axis.normalized().dot(push_vec)                      
-                            if direction_check < 0:                        
-                                locked_vec = project_point_onto_plane(push_vec, pose_bone.z_axis, pose_bone.y_axis)
-                                push_vec = lerp_vec(push_vec, locked_vec, 0.3)
-                                
-                        elif axis_locked == "+X":                        
-                            direction_check = pose_bone.x_axis.normalized().dot(push_vec)                      
-                            if direction_check > 0:                        
-                                locked_vec = project_point_onto_plane(push_vec, pose_bone.y_axis, pose_bone.x_axis)
-                                push_vec = lerp_vec(push_vec, locked_vec, 0.3)
-                                
-                        elif axis_locked == "-X":                        
-                            direction_check = pose_bone.x_axis.normalized().dot(push_vec)                      
-                            if direction_check < 0:                        
-                                locked_vec = project_point_onto_plane(push_vec, pose_bone.y_axis, pose_bone.x_axis)
-                                push_vec = lerp_vec(push_vec, locked_vec, 0.3)
-                                
-                        elif axis_locked == "+Z":                        
-                            direction_check = pose_bone.z_axis.normalized().dot(push_vec)                      
-                            if direction_check > 0:                        
-                                locked_vec = project_point_onto_plane(push_vec, pose_bone.z_axis, pose_bone.x_axis)
-                                push_vec = lerp_vec(push_vec, locked_vec, 0.3)
-                                
-                        elif axis_locked == "-Z":                        
-                            direction_check = pose_bone.z_axis.normalized().dot(push_vec)                      
-                            if direction_check < 0:                        
-                                locked_vec = project_point_onto_plane(push_vec, pose_bone.z_axis, pose_bone.x_axis)
-                                push_vec = lerp_vec(push_vec, locked_vec, 0.3)
-                                
-                    #push_vec = push_vec - pose_bone.y_axis.normalized()*0.02
-                    base_pos_dir += push_vec
-           
-        
-            
-            # evaluate mesh collision
-            if  bone.ab_sb_bone_colliding:
-                for mesh in scene.ab_sb_mesh_colliders:            
-                    obj = bpy.data.objects.get(mesh.name)
-                    pose_bone_center = (pose_bone.tail + pose_bone.head)*0.5
-                    col_dir = Vector((0.0,0.0,0.0))
-                    push_vec = Vector((0.0,0.0,0.0))
-                   
-                    object_eval = obj.evaluated_get(deps)
-                    evaluated_mesh = object_eval.to_mesh(preserve_all_data_layers=False, depsgraph=deps)     
-                    for tri in obj.data.loop_triangles:
-                        tri_coords = []
-                        for vi in tri.vertices:
-                            v_coord = evaluated_mesh.vertices[vi].co
-                            v_coord_global = obj.matrix_world @ v_coord
-                            tri_coords.append([v_coord_global[0], v_coord_global[1], v_coord_global[2]])
-                            
-                        tri_array = numpy.array(tri_coords)
-                        P = numpy.array([pose_bone_center[0], pose_bone_center[1], pose_bone_center[2]])
-                        dist, p = project_point_onto_tri(tri_array, P)
-                        p = Vector((p[0], p[1], p[2]))
-                        collision_dist = obj.ab_sb_collider_dist
-                        repel_force = obj.ab_sb_collider_force
-                        
-                        if dist < collision_dist:   
-                            col_dir += (pose_bone_center - p)
-                            push_vec = col_dir.normalized() * (collision_dist-dist) * repel_force
-                            base_pos_dir += push_vec * pose_bone.ab_sb_global_influence
-            
-                                                              
-        # add velocity
-        bone.speed += base_pos_dir * pose_bone.ab_sb_stiffness
-        bone.speed *= pose_bone.ab_sb_damp
-        
-        emp_head.location += bone.speed
-        # global influence                  
-        emp_head.location = lerp_vec(emp_head.location, emp_tail_loc, pose_bone.ab_sb_global_influence)     
-            
-    return None
 
-    
-    
-def project_point_onto_plane(q, p, n):
-    # q = (vector) point source
-    # p = (vector) point belonging to the plane
-    # n = (vector) normal of the plane
-    
-    n = n.normalized()
-    return q - ((q-p).dot(n)) * n 
-    
-def project_point_onto_line(a, b, p):
-    # project the point p onto the line a,b
-    ap = p-a
-    ab = b-a
-    
-    fac_a = (p-a).dot(b-a)
-    fac_b = (p-b).dot(b-a)
-    
-    result = a + ap.dot(ab)/ab.dot(ab) * ab
-    
-    if fac_a < 0:
-        result = a
-    if fac_b > 0:
-        result = b
-    
-    return result
-    
-    
-def project_point_onto_tri(TRI, P):
-    # return the distance and the projected surface point 
-    # between a point and a triangle in 3D
-    # original code: https://gist.github.com/joshuashaffer/
-    # Author: Gwolyn Fischer
-    
-    B = TRI[0, :]
-    E0 = TRI[1, :] - B
-    # E0 = E0/sqrt(sum(E0.^2)); %normalize vector
-    E1 = TRI[2, :] - B
-    # E1 = E1/sqrt(sum(E1.^2)); %normalize vector
-    D = B - P
-    a = dot(E0, E0)
-    b = dot(E0, E1)
-    c = dot(E1, E1)
-    d = dot(E0, D)
-    e = dot(E1, D)
-    f = dot(D, D)
-
-    #print "{0} {1} {2} ".format(B,E1,E0)
-    det = a * c - b * b
-    s = b * e - c * d
-    t = b * d - a * e
+    # one BVH per collider, rebuilt only when the frame or the collider changes
+    mesh_colliders = []
+    for name in SOLVER.mesh_colliders:
+        obj = bpy.data.objects.get(name)
+        if obj:
+            collider = colliders.CACHE.get(obj, deps, scene.frame_current)
+            if collider:
+                mesh_colliders.append(collider)
 
-    # Terible tree of conditionals to determine in which region of the diagram
-    # shown above the projection of the point into the triangle-plane lies.
-    if (s + t) <= det:
-        if s < 0.0:
-            if t < 0.0:
-                # region4
-                if d < 0:
-                    t = 0.0
-                    if -d >= a:
-                        s = 1.0
-                        sqrdistance = a + 2.0 * d + f
-                    else:
-                        s = -d / a
-                        sqrdistance = d * s + f
-                else:
-                    s = 0.0
-                    if e >= 0.0:
-                        t = 0.0
-                        sqrdistance = f
-                    else:
-                        if -e >= c:
-                            t = 1.0
-                            sqrdistance = c + 2.0 * e + f
-                        else:
-                            t = -e / c
-                            sqrdistance = e * t + f
-
-                            # of region 4
-            else:
-                # region 3
-                s = 0
-                if e >= 0:
-                    t = 0
-                    sqrdistance = f
-                else:
-                    if -e >= c:
-                        t = 1
-                        sqrdistance = c + 2.0 * e + f
-                    else:
-                        t = -e / c
-                        sqrdistance = e * t + f
-                        # of region 3
-        else:
-            if t < 0:
-                # region 5
-                t = 0
-                if d >= 0:
-                    s = 0
-                    sqrdistance = f
-                else:
-                    if -d >= a:
-                        s = 1
-                        sqrdistance = a + 2.0 * d + f;  # GF 20101013 fixed typo d*s ->2*d
-                    else:
-                        s = -d / a
-                        sqrdistance = d * s + f
-            else:
-                # region 0
-                invDet = 1.0 / det
-                s = s * invDet
-                t = t * invDet
-                sqrdistance = s * (a * s + b * t + 2.0 * d) + t * (b * s + c * t + 2.0 * e) + f
-    else:
-        if s < 0.0:
-            # region 2
-            tmp0 = b + d
-            tmp1 = c + e
-            if tmp1 > tmp0:  # minimum on edge s+t=1
-                numer = tmp1 - tmp0
-                denom = a - 2.0 * b + c
-                if numer >= denom:
-                    s = 1.0
-                    t = 0.0
-                    sqrdistance = a + 2.0 * d + f;  # GF 20101014 fixed typo 2*b -> 2*d
-                else:
-                    s = numer / denom
-                    t = 1 - s
-                    sqrdistance = s * (a * s + b * t + 2 * d) + t * (b * s + c * t + 2 * e) + f
-
-            else:  # minimum on edge s=0
-                s = 0.0
-                if tmp1 <= 0.0:
-                    t = 1
-                    sqrdistance = c + 2.0 * e + f
-                else:
-                    if e >= 0.0:
-                        t = 0.0
-                        sqrdistance = f
-                    else:
-                        t = -e / c
-                        sqrdistance = e * t + f
-                        # of region 2
-        else:
-            if t < 0.0:
-                # region6
-                tmp0 = b + e
-                tmp1 = a + d
-                if tmp1 > tmp0:
-                    numer = tmp1 - tmp0
-                    denom = a - 2.0 * b + c
-                    if numer >= denom:
-                        t = 1.0
-                        s = 0
-                        sqrdistance = c + 2.0 * e + f
-                    else:
-                        t = numer / denom
-                        s = 1 - t
-                        sqrdistance = s * (a * s + b * t + 2.0 * d) + t * (b * s + c * t + 2.0 * e) + f
-
-                else:
-                    t = 0.0
-                    if tmp1 <= 0.0:
-                        s = 1
-                        sqrdistance = a + 2.0 * d + f
-                    else:
-                        if d >= 0.0:
-                            s = 0.0
-                            sqrdistance = f
-                        else:
-                            s = -d / a
-                            sqrdistance = d * s + f
-            else:
-                # region 1
-                numer = c + e - b - d
-                if numer <= 0:
-                    s = 0.0
-                    t = 1.0
-                    sqrdistance = c + 2.0 * e + f
-                else:
-                    denom = a - 2.0 * b + c
-                    if numer >= denom:
-                        s = 1.0
-                        t = 0.0
-                        sqrdistance = a + 2.0 * d + f
-                    else:
-                        s = numer / denom
-                        t = 1 - s
-                        sqrdistance = s * (a * s + b * t + 2.0 * d) + t * (b * s + c * t + 2.0 * e) + f
-
-    # account for numerical round-off error
-    if sqrdistance < 0:
-        sqrdistance = 0
-
-    dist = sqrt(sqrdistance)
-
-    PP0 = B + s * E0 + t * E1
-    return dist, PP0
+    SOLVER.step(mesh_colliders, scene.ab_sb_broad_phase, steps, scene.ab_sb_substeps)
+    return None
     
                     
 def update_bone(self, context):
+    global SOLVER
     print("[AetherBlend][SB] Updating sb_bone data...")
     time_start = time.time()
-    scene = bpy.context.scene    
     armature = bpy.context.active_object  
-    deps = bpy.context.evaluated_depsgraph_get()
-    #update collection
-        #delete all
-    while len(scene.ab_sb_spring_bones) > 0:
-        scene.ab_sb_spring_bones.remove(len(scene.ab_sb_spring_bones) - 1)
-
-        # mesh colliders
-    while len(scene.ab_sb_mesh_colliders) > 0:
-        scene.ab_sb_mesh_colliders.remove(len(scene.ab_sb_mesh_colliders) - 1)
-            
-        
-    for pbone in armature.pose.bones:
-        # RNA-registered properties: access directly (they don't appear in pbone.keys())
-        is_spring_bone = pbone.ab_sb_bone_spring
-        is_collider_bone = pbone.ab_sb_bone_collider
-
-        if not is_spring_bone and not is_collider_bone:
-            continue
 
-        # remove stale spring constraint when spring is disabled
-        if not is_spring_bone:
-            spring_cns = pbone.constraints.get("spring")
-            if spring_cns:
-                pbone.constraints.remove(spring_cns)
+    SOLVER = solver.build(armature)
+    print("[AetherBlend][SB] registered", len(SOLVER), "spring bones,", len(SOLVER.colliders), "collider bones and", len(SOLVER.mesh_colliders), "mesh colliders")
+    print("[AetherBlend][SB] Updated in", round(time.time()-time_start, 1), "seconds.")    
+  
+def free_colliders():
+    stats = colliders.CACHE.stats()
+    if stats["hits"] or stats["misses"]:
+        print(f"[AetherBlend][SB] Collider cache: {stats['hits']} hits, {stats['misses']} misses")
+    colliders.CACHE.clear()
 
-        rotation_enabled = pbone.ab_sb_bone_rot
-        is_colliding = pbone.ab_sb_collide
-            
-        #print("iterating on", pbone.name)
-        if is_spring_bone or is_collider_bone:
-            item = bpy.context.scene.ab_sb_spring_bones.add()
-            item.name = pbone.name    
-            print("[AetherBlend][SB] registering", pbone.name)
-            bone_tail = armature.matrix_world @ pbone.tail 
-            bone_head = armature.matrix_world @ pbone.head 
-            item.last_loc = bone_head
-            item.armature = armature.name
-            parent_name = ""
-            if pbone.parent:
-                parent_name = pbone.parent.name          
-            
-            item.ab_sb_bone_rot = rotation_enabled
-            item.ab_sb_bone_collider = is_collider_bone
-            item.ab_sb_bone_colliding = is_colliding
-       
-        #create empty helpers
-        empty_radius = 1
-        if is_spring_bone :
-            if not bpy.data.objects.get(item.name + '_spring'):
-                """
-                # adding empties using operators cost too much performance
-                bpy.ops.object.mode_set(mode='OBJECT')       
-                bpy.ops.object.select_all(action='DESELECT')
-                if rotation_enabled:
-                    bpy.ops.object.empty_add(type='PLAIN_AXES', radius = empty_radius, location=bone_tail, rotation=(0,0,0)) 
-                else:
-                    bpy.ops.object.empty_add(type='PLAIN_AXES', radius = empty_radius, location=bone_head, rotation=(0,0,0)) 
-                empty = bpy.context.active_object   
-                empty.hide_set(True)
-                empty.hide_select = True
-                empty.name = item.name + '_spring'
-                """
-                o = bpy.data.objects.new(item.name+'_spring', None )
 
-                # due to the new mechanism of "collection"
-                bpy.context.scene.collection.objects.link(o)
+def stop_solver():
+    """Restores the pose of the spring bones and frees the solver and its colliders."""
+    global SOLVER
+    if SOLVER is not None:
+        try:
+            SOLVER.restore()
+        except ReferenceError:
+            pass
+        SOLVER = None
+    free_colliders()
 
-                # empty_draw was replaced by empty_display
-                o.empty_display_size = empty_radius
-                o.empty_display_type = 'PLAIN_AXES'   
-                o.location = bone_tail if rotation_enabled else bone_head                
-                o.hide_set(True)
-                o.hide_select = True
-                
-            if not bpy.data.objects.get(item.name + '_spring_tail'):
-                empty = bpy.data.objects.new(item.name+'_spring_tail', None )
-                
-                # due to the new mechanism of "collection"
-                bpy.context.scene.collection.objects.link(empty)
 
-                # empty_draw was replaced by empty_display
-                empty.empty_display_size = empty_radius
-                empty.empty_display_type = 'PLAIN_AXES'   
-                #empty.location = bone_tail if rotation_enabled else bone_head
-                empty.matrix_world = Matrix.Translation(bone_tail if rotation_enabled else bone_head)
-                # >>setting the matrix instead of location attribute to avoid the despgraph update
-                # for performance reasons
-                #deps.update()
-                empty.hide_set(True)
-                empty.hide_select = True
-                """
-                bpy.ops.object.mode_set(mode='OBJECT')        
-                bpy.ops.object.select_all(action='DESELECT')         
-                if rotation_enabled:
-                    bpy.ops.object.empty_add(type='PLAIN_AXES', radius = empty_radius, location=bone_tail, rotation=(0,0,0)) 
-                else:
-                    bpy.ops.object.empty_add(type='PLAIN_AXES', radius = empty_radius, location=bone_head, rotation=(0,0,0)) 
-                empty = bpy.context.active_object    
-                empty.hide_set(True)
-                empty.hide_select = True
-                                               
-                empty.name = item.name + '_spring_tail'   
-                """
-                mat = empty.matrix_world.copy()                                  
-                empty.parent = armature
-                empty.parent_type = 'BONE'
-                empty.parent_bone = parent_name
-                empty.matrix_world = mat
-                
-            #create constraints
-            if pbone.ab_sb_bone_spring == True:
-                #set_active_object(armature.name)
-                #bpy.ops.object.mode_set(mode='POSE')
-                spring_cns = pbone.constraints.get("spring")
-                if spring_cns:
-                    pbone.constraints.remove(spring_cns)                
-                if pbone.ab_sb_bone_rot:
-                    cns = pbone.constraints.new('DAMPED_TRACK')
-                    cns.target = bpy.data.objects[item.name + '_spring']
-                else:
-                    cns = pbone.constraints.new('COPY_LOCATION')
-                    cns.target = bpy.data.objects[item.name + '_spring']                
-                cns.name = 'spring' 
-                      
-        
-    # mesh colliders
-    for obj in bpy.data.objects:
-        if obj.type == "MESH":
-            if obj.ab_sb_object_collider:              
-                obj.data.calc_loop_triangles()
-                item = scene.ab_sb_mesh_colliders.add()
-                item.name = obj.name                   
-                break
-             
-             
-    #set_active_object(armature.name)
-    #bpy.ops.object.mode_set(mode='POSE')
-    
-    print("[AetherBlend][SB] Updated in", round(time.time()-time_start, 1), "seconds.")    
-  
 def end_spring_bone(context, self):
     if context.scene.ab_sb_global_spring:
         #print("GOING TO CLOSE TIMER...")        
@@ -520,29 +88,8 @@ def end_spring_bone(context, self):
         #print("CLOSE TIMER")
       
         context.scene.ab_sb_global_spring = False
-    
-    active_object = context.active_object
-    if not active_object or active_object.type != 'ARMATURE':
-        print("[AetherBlend][SB] --End--")
-        return
 
-    for item in list(context.scene.ab_sb_spring_bones):        
-
-        active_bone = active_object.pose.bones.get(item.name)
-        if active_bone == None:
-            continue
-            
-        cns = active_bone.constraints.get('spring')
-        if cns:            
-            active_bone.constraints.remove(cns)  
-               
-        emp1 = bpy.data.objects.get(active_bone.name + '_spring')
-        emp2 = bpy.data.objects.get(active_bone.name + '_spring_tail')
-        if emp1:     
-            bpy.data.objects.remove(emp1)        
-        if emp2:        
-            bpy.data.objects.remove(emp2)
-    
+    stop_solver()
     print("[AetherBlend][SB] --End--")
     
 class AETHER_OT_Spring_Modal(bpy.types.Operator):
@@ -552,6 +99,7 @@ class AETHER_OT_Spring_Modal(bpy.types.Operator):
     bl_label = "spring_bone" 
     
     timer_handler: object = None
+    last_tick: float = 0.0
      
     def modal(self, context, event):  
         #print("self.timer_handler =", self.timer_handler)
@@ -560,8 +108,13 @@ class AETHER_OT_Spring_Modal(bpy.types.Operator):
             #print("ESCAPE")
             return {'FINISHED'}  
             
-        if event.type == 'TIMER':       
-            spring_bone(context)
+        if event.type == 'TIMER' and SOLVER is not None:
+            # The timer only paces the UI; the simulated time comes from the wall clock.
+            now = time.perf_counter()
+            frame_rate = context.scene.render.fps / context.scene.render.fps_base
+            steps = SOLVER.timer_steps(now - self.last_tick, frame_rate, context.scene.ab_sb_substeps)
+            self.last_tick = now
+            spring_bone(context, steps)
         
         
         return {'PASS_THROUGH'}
@@ -579,6 +132,7 @@ class AETHER_OT_Spring_Modal(bpy.types.Operator):
             
             context.scene.ab_sb_global_spring = True
             update_bone(self, context)
+            self.last_tick = time.perf_counter()
             
             return {'RUNNING_MODAL'}    
         
@@ -601,28 +155,7 @@ class AETHER_OT_Spring_Modal(bpy.types.Operator):
         #print("CLOSED TIMER")
           
         context.scene.ab_sb_global_spring = False
-        
-        active_object = context.active_object
-        if not active_object or active_object.type != 'ARMATURE':
-            print("[AetherBlend][SB] --End--")
-            return
-
-        for item in list(context.scene.ab_sb_spring_bones):        
-            active_bone = active_object.pose.bones.get(item.name)
-            if active_bone == None:
-                continue
-                
-            cns = active_bone.constraints.get('spring')
-            if cns:            
-                active_bone.constraints.remove(cns)  
-                   
-            emp1 = bpy.data.objects.get(active_bone.name + '_spring')
-            emp2 = bpy.data.objects.get(active_bone.name + '_spring_tail')
-            if emp1:     
-                bpy.data.objects.remove(emp1)        
-            if emp2:        
-                bpy.data.objects.remove(emp2)
-        
+        stop_solver()
         print("[AetherBlend][SB] --End--")
                      
 class AETHER_OT_Spring(bpy.types.Operator):
@@ -727,6 +260,8 @@ class AETHER_PT_ui(bpy.types.Panel):
             col.enabled = not active_bone.ab_sb_bone_spring
             
             layout.separator()
+            layout.prop(scene, "ab_sb_substeps")
+            layout.prop(scene, "ab_sb_broad_phase")
             layout.prop(scene, "ab_sb_show_colliders")
             col = layout.column(align=True)
             
@@ -768,25 +303,7 @@ class AETHER_PT_Object_Ui(bpy.types.Panel):
             
 #### REGISTER ############# 
 
-class bones_collec(bpy.types.PropertyGroup):
-    armature : bpy.props.StringProperty(default="")     # type: ignore
-    last_loc : bpy.props.FloatVectorProperty(name="Loc", subtype='DIRECTION', default=(0,0,0), size = 3)     # type: ignore    
-    speed : bpy.props.FloatVectorProperty(name="Speed", subtype='DIRECTION', default=(0,0,0), size = 3)     # type: ignore
-    dist: bpy.props.FloatProperty(name="distance", default=1.0)     # type: ignore
-    target_offset : bpy.props.FloatVectorProperty(name="TargetLoc", subtype='DIRECTION', default=(0,0,0), size = 3)     # type: ignore    
-    ab_sb_bone_rot : bpy.props.BoolProperty(name="Bone Rot", default=False)     # type: ignore
-    ab_sb_bone_collider: bpy.props.BoolProperty(name="Bone collider", default=False)     # type: ignore
-    ab_sb_bone_colliding: bpy.props.BoolProperty(name="Bone colliding", default=True)     # type: ignore
-    ab_sb_collider_dist : bpy.props.FloatProperty(name="Bone collider distance", default=0.5)     # type: ignore
-    ab_sb_collider_force : bpy.props.FloatProperty(name="Bone collider force", default=1.0)     # type: ignore
-    matrix_offset = Matrix()
-    initial_matrix = Matrix()
-    
-class mesh_collec(bpy.types.PropertyGroup):
-    test : bpy.props.StringProperty(default="")     # type: ignore
-    
-    
-classes = (bones_collec, mesh_collec, AETHER_OT_Spring_Modal, AETHER_OT_Spring, AETHER_OT_Select_Bone)
+classes = (AETHER_OT_Spring_Modal, AETHER_OT_Spring, AETHER_OT_Select_Bone)
         
 def register():
     from bpy.utils import register_class
@@ -796,12 +313,14 @@ def register():
         
     if spring_bone_frame_mode not in bpy.app.handlers.frame_change_post:
         bpy.app.handlers.frame_change_post.append(spring_bone_frame_mode)
+    if colliders.collider_cache_update not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(colliders.collider_cache_update)
     
-    bpy.types.Scene.ab_sb_spring_bones = bpy.props.CollectionProperty(type=bones_collec)  
-    bpy.types.Scene.ab_sb_mesh_colliders = bpy.props.CollectionProperty(type=mesh_collec)       
     bpy.types.Scene.ab_sb_global_spring = bpy.props.BoolProperty(name="Enable spring", default = False)#, update=update_global_spring)
     bpy.types.Scene.ab_sb_global_spring_frame = bpy.props.BoolProperty(name="Enable Spring", description="Enable Spring on frame change only", default = False)
     bpy.types.Scene.ab_sb_show_colliders = bpy.props.BoolProperty(name="Show Colliders", description="Show active colliders names", default = False)
+    bpy.types.Scene.ab_sb_substeps = bpy.props.IntProperty(name="Substeps", description="Simulation steps per frame. Higher values keep stiff springs stable", default = 1, min = 1, max = 16)
+    bpy.types.Scene.ab_sb_broad_phase = bpy.props.BoolProperty(name="Broad Phase", description="Only test spring bones against collider bones in nearby grid cells. Faster with many collider bones", default = True)
     bpy.types.PoseBone.ab_sb_bone_spring = bpy.props.BoolProperty(name="Enabled", default=False, description="Enable spring effect on this bone")
     bpy.types.PoseBone.ab_sb_bone_collider = bpy.props.BoolProperty(name="Collider", default=False, description="Enable this bone as collider")
     bpy.types.PoseBone.ab_sb_collider_dist = bpy.props.FloatProperty(name="Collider Distance", default=0.5, description="Minimum distance to handle collision between the spring and collider bones")
@@ -826,12 +345,15 @@ def unregister():
     
     if spring_bone_frame_mode in bpy.app.handlers.frame_change_post:
         bpy.app.handlers.frame_change_post.remove(spring_bone_frame_mode) 
+    if colliders.collider_cache_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(colliders.collider_cache_update)
+    stop_solver()
     
-    del bpy.types.Scene.ab_sb_spring_bones  
-    del bpy.types.Scene.ab_sb_mesh_colliders
     del bpy.types.Scene.ab_sb_global_spring
     del bpy.types.Scene.ab_sb_global_spring_frame
     del bpy.types.Scene.ab_sb_show_colliders
+    del bpy.types.Scene.ab_sb_substeps
+    del bpy.types.Scene.ab_sb_broad_phase
     del bpy.types.PoseBone.ab_sb_bone_spring
     del bpy.types.PoseBone.ab_sb_bone_collider
     del bpy.types.PoseBone.ab_sb_collider_dist
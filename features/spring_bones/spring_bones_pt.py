@@ -89,6 +89,8 @@ class AETHER_PT_SpringBones(bpy.types.Panel):
             collider_col.prop(active_bone, 'ab_sb_collider_force', text="Collider Force")
 
             col.separator()
+            col.prop(context.scene, "ab_sb_substeps", text="Substeps")
+            col.prop(context.scene, "ab_sb_broad_phase", text="Broad Phase")
             col.prop(context.scene, "ab_sb_show_colliders", text="Show Colliders")
             if context.scene.ab_sb_show_colliders:
                 for pbone in armature.pose.bones:
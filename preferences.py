@@ -1,5 +1,5 @@
 import bpy
-from bpy.props import StringProperty, EnumProperty
+from bpy.props import StringProperty, EnumProperty, IntProperty
 from pathlib import Path
 import os
 import json
@@ -20,6 +20,31 @@ def get_default_custom_template_path() -> str:
 
     return str(Path.home() / "AppData" / "Roaming" / "AetherBlend" / "templates" / "custom")
 
+
+def get_meta_rig_cache_dir() -> Path:
+    """Return the directory of the meta rig cache inside the extension's user directory."""
+    try:
+        return Path(bpy.utils.extension_path_user(__package__, path="meta_rig_cache", create=True))
+    except Exception:
+        appdata = os.getenv("APPDATA")
+        base = Path(appdata) if appdata else Path.home() / "AppData" / "Roaming"
+        return base / "AetherBlend" / "meta_rig_cache"
+
+
+def get_meta_rig_cache():
+    """Return the meta rig cache configured in the preferences, or None when it is disabled."""
+    from .core.meta_rig_cache import MetaRigCache
+
+    prefs = get_preferences()
+    if prefs.use_meta_rig_cache != 'ON':
+        return None
+
+    return MetaRigCache(
+        get_meta_rig_cache_dir(),
+        max_megabytes=prefs.meta_rig_cache_max_size,
+        max_age_days=prefs.meta_rig_cache_max_age,
+    )
+
 def is_set_enabled(feature_set_token: str) -> bool:
     """Return whether a feature set is enabled in addon preferences."""
     prefs = get_preferences()
@@ -152,6 +177,20 @@ class AETHER_OT_Toggle_Template_Visibility(bpy.types.Operator):
         return {'FINISHED'}
 
 
+class AETHER_OT_Clear_Meta_Rig_Cache(bpy.types.Operator):
+    """Remove all cached meta rigs."""
+    bl_idname = "aether.clear_meta_rig_cache"
+    bl_label = "Clear Meta Rig Cache"
+    bl_description = "Delete all cached meta rigs from disk"
+
+    def execute(self, context):
+        from .core.meta_rig_cache import MetaRigCache
+
+        removed = MetaRigCache(get_meta_rig_cache_dir()).clear()
+        self.report({'INFO'}, f"Removed {removed} cached meta rig(s)")
+        return {'FINISHED'}
+
+
 class AETHER_OT_Toggle_Feature_Set(bpy.types.Operator):
     """Toggle one feature set used for dependency checks and UI state."""
     bl_idname = "aether.toggle_feature_set"
@@ -252,6 +291,28 @@ class AetherBlendPreferences(bpy.types.AddonPreferences):
         default='ON'
     ) #type: ignore
 
+    # Meta Rig Cache
+    use_meta_rig_cache: EnumProperty(
+        name="Meta Rig Cache",
+        description="Reuse previously generated meta rigs for identical skeletons and templates",
+        items=TOGGLE_ITEMS,
+        default='OFF'
+    ) #type: ignore
+
+    meta_rig_cache_max_size: IntProperty(
+        name="Max Cache Size (MB)",
+        description="Least recently used meta rigs are removed once the cache grows beyond this size. 0 disables the limit",
+        default=512,
+        min=0,
+    ) #type: ignore
+
+    meta_rig_cache_max_age: IntProperty(
+        name="Max Cache Age (Days)",
+        description="Meta rigs not used for this many days are removed. 0 disables the limit",
+        default=30,
+        min=0,
+    ) #type: ignore
+
     # Default File Paths
     default_meddle_import_path: StringProperty(
         name="Meddle Import",
@@ -446,6 +507,13 @@ class AetherBlendPreferences(bpy.types.AddonPreferences):
             box.separator()
             draw_switch(box, "show_n_panel", "Show N-Panel UI")
             draw_switch(box, "show_properties_tool_tab", "Show Properties Tool UI")
+            box.separator()
+            draw_switch(box, "use_meta_rig_cache", "Meta Rig Cache")
+            cache_col = box.column(align=True)
+            cache_col.enabled = self.use_meta_rig_cache == 'ON'
+            cache_col.prop(self, "meta_rig_cache_max_size")
+            cache_col.prop(self, "meta_rig_cache_max_age")
+            cache_col.operator("aether.clear_meta_rig_cache", icon='TRASH')
 
         elif self.tabs == 'PATHS':
             box = layout.box()
@@ -539,10 +607,12 @@ def register():
     bpy.utils.register_class(AETHER_OT_Delete_Custom_Template)
     bpy.utils.register_class(AETHER_OT_Toggle_Template_Visibility)
     bpy.utils.register_class(AETHER_OT_Toggle_Feature_Set)
+    bpy.utils.register_class(AETHER_OT_Clear_Meta_Rig_Cache)
     bpy.utils.register_class(AetherBlendPreferences)
 
 def unregister():
     bpy.utils.unregister_class(AetherBlendPreferences)
+    bpy.utils.unregister_class(AETHER_OT_Clear_Meta_Rig_Cache)
     bpy.utils.unregister_class(AETHER_OT_Toggle_Feature_Set)
     bpy.utils.unregister_class(AETHER_OT_Toggle_Template_Visibility)
     bpy.utils.unregister_class(AETHER_OT_Delete_Custom_Template)
@@ -0,0 +1,212 @@
+"""Headless batch import and rig generation.
+
+Runs aether.character_import and aether.generate_full_rig for every .gltf/.glb
+file in a directory and saves one .blend per character. Requires the AetherBlend
+and Rigify add-ons to be enabled in the Blender user preferences.
+
+Usage:
+    blender -b --python scripts/batch_generate.py -- --input DIR --template NAME [--output DIR] [--jobs N] [--shaders]
+
+With --jobs greater than 1 the files are split across that many background
+Blender processes. A summary.json with per-file timings, generation profiles
+and failures is written to the output directory. The process exits with a
+non-zero code when any file failed.
+"""
+
+import argparse
+import json
+import math
+import os
+import subprocess
+import sys
+import time
+import traceback
+from pathlib import Path
+
+import bpy
+
+MODEL_EXTENSIONS = (".gltf", ".glb")
+SUMMARY_FILE = "summary.json"
+
+
+def _parse_args(argv: list[str]) -> argparse.Namespace:
+    argv = argv[argv.index("--") + 1:] if "--" in argv else []
+
+    parser = argparse.ArgumentParser(prog="batch_generate.py", description="Batch import and rig characters with AetherBlend.")
+    parser.add_argument("--input", required=True, help="Directory containing .gltf/.glb files")
+    parser.add_argument("--template", required=True, help="Rig template name to generate with")
+    parser.add_argument("--output", default=None, help="Directory for the .blend files and summary (defaults to the input directory)")
+    parser.add_argument("--jobs", type=int, default=1, help="Number of background Blender processes")
+    parser.add_argument("--shaders", action="store_true", help="Apply Meddle/FFGear shaders on import")
+    parser.add_argument("--files", nargs="*", default=None, help=argparse.SUPPRESS)
+    parser.add_argument("--summary", default=None, help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def _collect_files(input_dir: Path) -> list[Path]:
+    return sorted(path for path in input_dir.iterdir() if path.is_file() and path.suffix.lower() in MODEL_EXTENSIONS)
+
+
+def _ensure_addon() -> bool:
+    """Enables the AetherBlend extension if its operators are not registered yet."""
+    if hasattr(bpy.ops.aether, "generate_full_rig"):
+        return True
+
+    import addon_utils
+    for module in addon_utils.modules():
+        if module.__name__.split(".")[-1] == "AetherBlend":
+            addon_utils.enable(module.__name__, default_set=False)
+            break
+
+    return hasattr(bpy.ops.aether, "generate_full_rig")
+
+
+def _reset_scene() -> None:
+    bpy.ops.wm.read_homefile(use_empty=True)
+
+
+def _process_file(path: Path, output_dir: Path, template: str, shaders: bool) -> dict:
+    result = {"file": str(path), "blend": None, "ok": False, "error": None, "seconds": {}}
+    time_start = time.perf_counter()
+
+    try:
+        _reset_scene()
+
+        stage_start = time.perf_counter()
+        status = bpy.ops.aether.character_import(
+            'EXEC_DEFAULT',
+            filepath=str(path),
+            s_import_with_meddle_shaders=shaders,
+            s_import_ab_iris_shader=shaders,
+            s_import_ab_limbal_shader=shaders,
+            s_import_with_ffgear_shaders=shaders,
+        )
+        result["seconds"]["import"] = round(time.perf_counter() - stage_start, 6)
+        if 'FINISHED' not in status:
+            raise RuntimeError(f"Character import returned {status}")
+
+        armature = bpy.context.view_layer.objects.active
+        if not armature or armature.type != 'ARMATURE':
+            raise RuntimeError("No armature found after import")
+
+        armature.aether_rig.selected_template = template
+
+        stage_start = time.perf_counter()
+        status = bpy.ops.aether.generate_full_rig('EXEC_DEFAULT')
+        result["seconds"]["generate"] = round(time.perf_counter() - stage_start, 6)
+        if 'FINISHED' not in status:
+            raise RuntimeError(f"Rig generation returned {status}")
+
+        if armature.aether_rig.generation_profile:
+            result["profile"] = json.loads(armature.aether_rig.generation_profile)
+
+        stage_start = time.perf_counter()
+        blend_path = output_dir / f"{path.stem}.blend"
+        bpy.ops.wm.save_as_mainfile(filepath=str(blend_path), check_existing=False)
+        result["seconds"]["save"] = round(time.perf_counter() - stage_start, 6)
+
+        result["blend"] = str(blend_path)
+        result["ok"] = True
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+        result["traceback"] = traceback.format_exc()
+        print(f"[AetherBlend] Batch: failed '{path.name}': {result['error']}")
+
+    result["seconds"]["total"] = round(time.perf_counter() - time_start, 6)
+    return result
+
+
+def _run_files(files: list[Path], output_dir: Path, template: str, shaders: bool) -> list[dict]:
+    results = []
+    for index, path in enumerate(files, start=1):
+        print(f"[AetherBlend] Batch: ({index}/{len(files)}) {path.name}")
+        results.append(_process_file(path, output_dir, template, shaders))
+    return results
+
+
+def _run_workers(args: argparse.Namespace, files: list[Path], output_dir: Path) -> list[dict]:
+    """Splits the files across background Blender processes and merges their summaries."""
+    jobs = min(args.jobs, len(files))
+    chunk_size = math.ceil(len(files) / jobs)
+    chunks = [files[i:i + chunk_size] for i in range(0, len(files), chunk_size)]
+
+    processes = []
+    for index, chunk in enumerate(chunks):
+        summary_path = output_dir / f".batch_worker_{index}.json"
+        command = [
+            bpy.app.binary_path, "-b", "--python", os.path.abspath(__file__), "--",
+            "--input", args.input,
+            "--template", args.template,
+            "--output", str(output_dir),
+            "--summary", str(summary_path),
+            "--files", *(str(path) for path in chunk),
+        ]
+        if args.shaders:
+            command.append("--shaders")
+        processes.append((subprocess.Popen(command), summary_path, chunk))
+
+    results = []
+    for process, summary_path, chunk in processes:
+        process.wait()
+        if summary_path.exists():
+            with summary_path.open("r", encoding="utf-8") as f:
+                results.extend(json.load(f)["results"])
+            summary_path.unlink()
+        else:
+            results.extend(
+                {"file": str(path), "blend": None, "ok": False,
+                 "error": f"Worker exited with code {process.returncode} without a summary", "seconds": {}}
+                for path in chunk
+            )
+    return results
+
+
+def _write_summary(path: Path, template: str, results: list[dict], seconds: float, jobs: int) -> None:
+    failures = [result for result in results if not result["ok"]]
+    summary = {
+        "template": template,
+        "blender_version": bpy.app.version_string,
+        "jobs": jobs,
+        "total_seconds": round(seconds, 6),
+        "succeeded": len(results) - len(failures),
+        "failed": len(failures),
+        "failures": [{"file": result["file"], "error": result["error"]} for result in failures],
+        "results": results,
+    }
+    with path.open("w", encoding="utf-8") as f:
+        json.dump(summary, f, indent=2)
+
+
+def main() -> int:
+    args = _parse_args(sys.argv)
+    input_dir = Path(args.input)
+    output_dir = Path(args.output) if args.output else input_dir
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    is_worker = args.files is not None
+    files = [Path(path) for path in args.files] if is_worker else _collect_files(input_dir)
+    if not files:
+        print(f"[AetherBlend] Batch: no {'/'.join(MODEL_EXTENSIONS)} files found in {input_dir}")
+        return 1
+
+    time_start = time.perf_counter()
+    if not is_worker and args.jobs > 1 and len(files) > 1:
+        results = _run_workers(args, files, output_dir)
+    else:
+        if not _ensure_addon():
+            print("[AetherBlend] Batch: the AetherBlend add-on is not installed or could not be enabled")
+            return 1
+        results = _run_files(files, output_dir, args.template, args.shaders)
+
+    summary_path = Path(args.summary) if args.summary else output_dir / SUMMARY_FILE
+    _write_summary(summary_path, args.template, results, time.perf_counter() - time_start, max(1, args.jobs))
+
+    failed = sum(1 for result in results if not result["ok"])
+    if not is_worker:
+        print(f"[AetherBlend] Batch: {len(results) - failed}/{len(results)} succeeded in "
+              f"{time.perf_counter() - time_start:.1f}s, summary written to {summary_path}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+"""Headless playback benchmark of generated rigs.
+
+Opens a .blend, runs aether.benchmark_playback on every generated AetherBlend rig
+(or the one given with --armature) and writes the reports to one JSON file.
+Requires the AetherBlend add-on to be enabled in the Blender user preferences.
+
+Usage:
+    blender -b FILE.blend --python scripts/benchmark_playback.py -- [--armature NAME] [--frames N] [--warmup N] [--output FILE]
+
+Run it on the .blend files before and after a template change and compare the
+"timing" and "rig" sections of the two outputs. The process exits with a
+non-zero code when no rig could be benchmarked.
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+import bpy
+
+
+def _parse_args(argv: list[str]) -> argparse.Namespace:
+    argv = argv[argv.index("--") + 1:] if "--" in argv else []
+
+    parser = argparse.ArgumentParser(prog="benchmark_playback.py", description="Benchmark the playback of AetherBlend rigs.")
+    parser.add_argument("--armature", default=None, help="Name of the rig to benchmark (defaults to every generated rig)")
+    parser.add_argument("--frames", type=int, default=120, help="Number of frames to scrub")
+    parser.add_argument("--warmup", type=int, default=10, help="Frames evaluated before timing starts")
+    parser.add_argument("--output", default=None, help="JSON file to write (defaults to <blend name>_benchmark.json next to the .blend)")
+    return parser.parse_args(argv)
+
+
+def _ensure_addon() -> bool:
+    """Enables the AetherBlend extension if its operators are not registered yet."""
+    if hasattr(bpy.ops.aether, "benchmark_playback"):
+        return True
+
+    import addon_utils
+    for module in addon_utils.modules():
+        if module.__name__.split(".")[-1] == "AetherBlend":
+            addon_utils.enable(module.__name__, default_set=False)
+            break
+
+    return hasattr(bpy.ops.aether, "benchmark_playback")
+
+
+def _rigs(name: str | None) -> list[bpy.types.Object]:
+    if name:
+        obj = bpy.data.objects.get(name)
+        return [obj] if obj and obj.type == 'ARMATURE' else []
+    return [obj for obj in bpy.data.objects if obj.type == 'ARMATURE' and obj.aether_rig.rigified]
+
+
+def _benchmark(armature: bpy.types.Object, frames: int, warmup: int) -> dict:
+    view_layer = bpy.context.view_layer
+    for obj in view_layer.objects:
+        obj.select_set(False)
+    armature.hide_set(False)
+    armature.select_set(True)
+    view_layer.objects.active = armature
+
+    with tempfile.TemporaryDirectory() as directory:
+        report_path = Path(directory) / "report.json"
+        status = bpy.ops.aether.benchmark_playback(
+            'EXEC_DEFAULT',
+            filepath=str(report_path),
+            frame_count=frames,
+            warmup_frames=warmup,
+        )
+        if 'FINISHED' not in status:
+            raise RuntimeError(f"Benchmark returned {status}")
+        with report_path.open("r", encoding="utf-8") as f:
+            return json.load(f)
+
+
+def main() -> int:
+    args = _parse_args(sys.argv)
+    if not bpy.data.filepath:
+        print("[AetherBlend] Benchmark: open a .blend file, e.g. blender -b FILE.blend --python ...")
+        return 1
+    if not _ensure_addon():
+        print("[AetherBlend] Benchmark: the AetherBlend add-on is not installed or could not be enabled")
+        return 1
+
+    rigs = _rigs(args.armature)
+    if not rigs:
+        print(f"[AetherBlend] Benchmark: no generated rig found in {bpy.data.filepath}")
+        return 1
+
+    results = []
+    failures = []
+    for armature in rigs:
+        try:
+            report = _benchmark(armature, args.frames, args.warmup)
+            results.append(report)
+            print(f"[AetherBlend] Benchmark: {armature.name} {report['timing']['fps']:.1f} fps, worst frame "
+                  f"{report['timing']['worst_frame']} ({report['timing']['worst_ms']:.2f}ms)")
+        except Exception as e:
+            failures.append({"armature": armature.name, "error": f"{type(e).__name__}: {e}"})
+            print(f"[AetherBlend] Benchmark: failed '{armature.name}': {e}")
+
+    blend_path = Path(bpy.data.filepath)
+    output = Path(args.output) if args.output else blend_path.with_name(f"{blend_path.stem}_benchmark.json")
+    with output.open("w", encoding="utf-8") as f:
+        json.dump({"blend": str(blend_path), "results": results, "failures": failures}, f, indent=2)
+
+    print(f"[AetherBlend] Benchmark: report written to {output}")
+    return 0 if results and not failures else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+"""Reference checks of core/bone_geometry.py.
+
+bone_geometry only needs NumPy, so it is loaded straight from its file instead of
+through the add-on package, which imports bpy. Run with: python -m pytest tests
+"""
+
+import importlib.util
+import math
+from pathlib import Path
+
+import numpy
+import pytest
+
+_PATH = Path(__file__).resolve().parents[1] / "core" / "bone_geometry.py"
+_SPEC = importlib.util.spec_from_file_location("bone_geometry", _PATH)
+bone_geometry = importlib.util.module_from_spec(_SPEC)
+_SPEC.loader.exec_module(bone_geometry)
+
+
+def _matrix(head, tail, roll=0.0) -> numpy.ndarray:
+    return bone_geometry.roll_matrices(
+        numpy.array([head], dtype=numpy.float64),
+        numpy.array([tail], dtype=numpy.float64),
+        numpy.array([roll], dtype=numpy.float64),
+    )[0]
+
+
+# Rest rotations Blender gives bones with these directions and a roll of 0 (axes as columns).
+@pytest.mark.parametrize("tail, expected", [
+    ((0.0, 1.0, 0.0), numpy.eye(3)),
+    ((0.0, 0.0, 1.0), [[1.0, 0.0, 0.0], [0.0, 0.0, -1.0], [0.0, 1.0, 0.0]]),
+    ((1.0, 0.0, 0.0), [[0.0, 1.0, 0.0], [-1.0, 0.0, 0.0], [0.0, 0.0, 1.0]]),
+    ((0.0, -1.0, 0.0), [[-1.0, 0.0, 0.0], [0.0, -1.0, 0.0], [0.0, 0.0, 1.0]]),
+])
+def test_roll_matrices_reference_directions(tail, expected):
+    numpy.testing.assert_allclose(_matrix((0.0, 0.0, 0.0), tail), expected, atol=1e-12)
+
+
+def test_roll_rotates_around_the_bone_axis():
+    # A quarter roll of a +Y bone turns its X axis onto -Z and its Z axis onto +X.
+    numpy.testing.assert_allclose(
+        _matrix((0.0, 0.0, 0.0), (0.0, 2.0, 0.0), math.pi / 2),
+        [[0.0, 0.0, 1.0], [0.0, 1.0, 0.0], [-1.0, 0.0, 0.0]],
+        atol=1e-12,
+    )
+
+
+def test_roll_matrices_are_rotations_along_the_bone():
+    rng = numpy.random.default_rng(0)
+    heads = rng.normal(size=(64, 3))
+    tails = heads + rng.normal(size=(64, 3))
+    rolls = rng.uniform(-math.pi, math.pi, 64)
+    matrices = bone_geometry.roll_matrices(heads, tails, rolls)
+
+    directions = (tails - heads) / numpy.linalg.norm(tails - heads, axis=1)[:, None]
+    numpy.testing.assert_allclose(matrices[:, :, 1], directions, atol=1e-12)
+    numpy.testing.assert_allclose(matrices @ matrices.transpose(0, 2, 1), numpy.broadcast_to(numpy.eye(3), matrices.shape), atol=1e-12)
+    numpy.testing.assert_allclose(numpy.linalg.det(matrices), 1.0, atol=1e-12)
+
+
+@pytest.fixture
+def skeleton():
+    return bone_geometry.Skeleton(
+        ["root", "spine", "arm"],
+        [(0.0, 0.0, 0.0), (0.0, 0.0, 1.0), (1.0, 0.0, 2.0)],
+        [(0.0, 1.0, 0.0), (0.0, 0.0, 3.0), (2.0, 0.0, 2.0)],
+        [0.0, 0.0, 0.5],
+    )
+
+
+def test_solve_reference_values(skeleton):
+    requests = [
+        bone_geometry.Connect("connect", "root", "arm", start_tail=True, end_tail=True),
+        bone_geometry.Copy("copy", "arm"),
+        bone_geometry.Extension("extension", "spine", size_factor=0.5),
+        bone_geometry.Extension("extension_x", "spine", axis_type="armature", axis=0),
+        bone_geometry.Offset("offset", "spine", offset=(0.0, 0.0, 1.0), size_factor=2.0),
+        bone_geometry.Parallel("parallel", "root", "spine", axis_type="armature", axis=2, coordinate=2, start_tail=False, end_tail=True),
+        bone_geometry.Center("center", ("root", "arm"), axis=2),
+        bone_geometry.Bridge("bridge", "spine", "arm", offset=(0.0, 1.0, 0.0)),
+    ]
+    expected = [
+        ((0, 1, 0), (2, 0, 2), 0.0),
+        ((1, 0, 2), (2, 0, 2), 0.5),
+        ((0, 0, 3), (0, 0, 4), 0.0),
+        ((0, 0, 3), (2, 0, 3), 0.0),
+        # The local Z axis of the upright spine points along -Y.
+        ((0, -1, 1), (0, -1, 5), 0.0),
+        ((0, 0, 0), (0, 0, 3), 0.0),
+        ((0.5, 0, 1), (0.5, 0, 2), 0.0),
+        ((0.5, 1, 1.5), (1, 0, 2), 0.0),
+    ]
+
+    for request, result, (head, tail, roll) in zip(requests, bone_geometry.solve(skeleton, requests), expected):
+        assert result is not None, request.name
+        numpy.testing.assert_allclose(result.head, head, atol=1e-12, err_msg=request.name)
+        numpy.testing.assert_allclose(result.tail, tail, atol=1e-12, err_msg=request.name)
+        assert result.roll == pytest.approx(roll), request.name
+
+
+def test_solve_parallel_without_component_along_coordinate(skeleton):
+    # An X direction never reaches the spine's tail along Z.
+    request = bone_geometry.Parallel("parallel", "root", "spine", axis_type="armature", axis=0, coordinate=2, end_tail=True)
+    assert bone_geometry.solve(skeleton, [request]) == [None]
+
+
+def test_solve_global_axes_use_the_world_rotation(skeleton):
+    # With the armature turned a quarter around Z, world X is armature -Y.
+    world = [[0.0, -1.0, 0.0], [1.0, 0.0, 0.0], [0.0, 0.0, 1.0]]
+    request = bone_geometry.Extension("extension", "root", axis_type="global", axis=0)
+    result, = bone_geometry.solve(skeleton, [request], world)
+    numpy.testing.assert_allclose(result.head, (0, 1, 0), atol=1e-12)
+    numpy.testing.assert_allclose(result.tail, (0, 0, 0), atol=1e-12)
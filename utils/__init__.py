@@ -9,6 +9,8 @@ from . import axis_conversion
 from . import collection
 from . import import_export
 from . import object
+from . import scene_index
+from . import window
 
 __all__ = [
 	'armature',
@@ -17,5 +19,7 @@ __all__ = [
 	'collection',
 	'import_export',
 	'object',
+	'scene_index',
+	'window',
 ]
 
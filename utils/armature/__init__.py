@@ -1,4 +1,6 @@
 from . import b_collection
+from . import construct
+from .. import scene_index
 
 import bpy
 from mathutils import Vector
@@ -55,6 +57,10 @@ def unparent_all_bones(armature: bpy.types.Object) -> None:
 
 def find_meshes(armature: bpy.types.Object) -> list[bpy.types.Object]:
     """Returns all mesh objects that use the given armature modifier."""
+    index = scene_index.current()
+    if index is not None:
+        return index.find_meshes(armature)
+
     meshes = []
     for obj in bpy.data.objects:
         if obj.type == "MESH":
@@ -64,6 +70,21 @@ def find_meshes(armature: bpy.types.Object) -> list[bpy.types.Object]:
                     break
     return meshes
 
+def find_materials(armature: bpy.types.Object, property_name: str, property_value=None) -> list[tuple[bpy.types.Object, bpy.types.Material]]:
+    """Returns (mesh, material) pairs of meshes deformed by the armature whose material has the given custom property value."""
+    index = scene_index.current()
+    if index is not None:
+        return index.find_materials(armature, property_name, property_value)
+
+    pairs = (
+        (mesh, slot.material)
+        for mesh in find_meshes(armature)
+        for slot in mesh.material_slots
+        if slot.material and property_name in slot.material
+        and (property_value is None or slot.material[property_name] == property_value)
+    )
+    return list(dict.fromkeys(pairs))
+
 def _apply_as_shapekey(mesh_obj: bpy.types.Object, armature_obj: bpy.types.Object, shapekey_name: str = "Armature_Shapekey", disable_all: bool = True) -> None:
     """Applies all armature modifiers using armature_obj as a new shapekey."""
     original_mode = mesh_obj.mode
@@ -136,29 +157,6 @@ def restore_bone_parenting(armature: bpy.types.Object, parent_map: dict) -> None
             bone.parent = edit_bones.get(parent_name) if parent_name else None
     bpy.ops.object.mode_set(mode=original_mode)
 
-def duplicate(armature: bpy.types.Object) -> bpy.types.Object:
-    """Duplicates the given armature object."""
-    _select_single(armature)
-    bpy.ops.object.duplicate_move()
-    duplicated_armature = bpy.context.active_object
-    return duplicated_armature
-
-def add_bone_prefix(armature: bpy.types.Object, prefix: str) -> None:
-    """Adds a prefix to all bone names in the armature."""
-    original_mode = armature.mode
-    bpy.ops.object.mode_set(mode='EDIT')
-    for bone in armature.data.edit_bones:
-        bone.name = f"{prefix}{bone.name}"
-    bpy.ops.object.mode_set(mode=original_mode)
-
-def join(src: bpy.types.Object, target: bpy.types.Object) -> None:
-    """Joins the source armature into the target armature."""
-    bpy.ops.object.select_all(action='DESELECT')
-    src.select_set(True)
-    target.select_set(True)
-    bpy.context.view_layer.objects.active = target
-    bpy.ops.object.join()
-
 
 def _set_mode(obj: bpy.types.Object, mode: str) -> str:
     original_mode = obj.mode
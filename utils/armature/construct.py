@@ -0,0 +1,128 @@
+"""Operator-free armature construction through the data API.
+
+These helpers do not change the selection, do not trigger operator undo pushes
+and create prefixed bone copies in a single edit session.
+"""
+
+import bpy
+
+# Edit bone settings carried over by add_prefixed_bones, shared between Bone and EditBone.
+_BONE_ATTRIBUTES = (
+    "use_deform",
+    "inherit_scale",
+    "use_inherit_rotation",
+    "use_local_location",
+    "use_relative_parent",
+    "envelope_distance",
+    "envelope_weight",
+    "head_radius",
+    "tail_radius",
+    "bbone_segments",
+    "bbone_x",
+    "bbone_z",
+)
+
+_POSE_BONE_ATTRIBUTES = (
+    "rotation_mode",
+    "lock_location",
+    "lock_rotation",
+    "lock_rotation_w",
+    "lock_scale",
+)
+
+
+def copy(armature: bpy.types.Object, name: str | None = None, collection: bpy.types.Collection | None = None, copy_action: bool = True) -> bpy.types.Object:
+    """Duplicates an armature object and its data and links the copy next to the original."""
+    new_armature = armature.copy()
+    new_armature.data = armature.data.copy()
+    if name:
+        new_armature.name = name
+
+    if copy_action and new_armature.animation_data and new_armature.animation_data.action:
+        new_armature.animation_data.action = new_armature.animation_data.action.copy()
+
+    collections = [collection] if collection else list(armature.users_collection)
+    if not collections:
+        collections = [bpy.context.scene.collection]
+    for target_collection in collections:
+        target_collection.objects.link(new_armature)
+
+    return new_armature
+
+
+def _copy_id_properties(source, target) -> None:
+    for key in source.keys():
+        try:
+            target[key] = source[key]
+        except (TypeError, AttributeError):
+            pass
+
+
+def add_prefixed_bones(
+    source: bpy.types.Object,
+    target: bpy.types.Object,
+    prefix: str,
+    collection_name: str | None = None,
+) -> list[str]:
+    """Copies every bone of source into target with a name prefix, keeping the hierarchy between the copies.
+
+    The copies are only assigned to collection_name (created if needed). Both armatures
+    must share the same object transform, as bones are copied in armature space.
+    """
+    source_bones = list(source.data.bones)
+    if not source_bones:
+        return []
+
+    target_collection = None
+    if collection_name:
+        target_collection = target.data.collections.get(collection_name) or target.data.collections.new(collection_name)
+
+    view_layer = bpy.context.view_layer
+    previous_active = view_layer.objects.active
+    view_layer.objects.active = target
+    original_mode = target.mode
+    if original_mode != 'EDIT':
+        bpy.ops.object.mode_set(mode='EDIT')
+
+    edit_bones = target.data.edit_bones
+    created: dict[str, bpy.types.EditBone] = {}
+    for bone in source_bones:
+        edit_bone = edit_bones.new(f"{prefix}{bone.name}")
+        edit_bone.head = bone.head_local
+        edit_bone.tail = bone.tail_local
+        edit_bone.roll = bpy.types.Bone.AxisRollFromMatrix(bone.matrix_local.to_3x3())[1]
+        for attribute in _BONE_ATTRIBUTES:
+            setattr(edit_bone, attribute, getattr(bone, attribute))
+        if target_collection:
+            target_collection.assign(edit_bone)
+        created[bone.name] = edit_bone
+
+    for bone in source_bones:
+        if bone.parent:
+            edit_bone = created[bone.name]
+            edit_bone.parent = created.get(bone.parent.name)
+            edit_bone.use_connect = bone.use_connect
+
+    # Blender may shorten or de-duplicate the requested names, so the copies are looked up by the name they got.
+    created_names = {source_name: edit_bone.name for source_name, edit_bone in created.items()}
+
+    bpy.ops.object.mode_set(mode='OBJECT')
+
+    target_bones = target.data.bones
+    target_pose_bones = target.pose.bones
+    for bone in source_bones:
+        new_name = created_names[bone.name]
+        _copy_id_properties(bone, target_bones[new_name])
+
+        source_pose_bone = source.pose.bones.get(bone.name)
+        target_pose_bone = target_pose_bones.get(new_name)
+        if source_pose_bone and target_pose_bone:
+            for attribute in _POSE_BONE_ATTRIBUTES:
+                setattr(target_pose_bone, attribute, getattr(source_pose_bone, attribute))
+            _copy_id_properties(source_pose_bone, target_pose_bone)
+
+    if original_mode != 'OBJECT':
+        bpy.ops.object.mode_set(mode=original_mode)
+    view_layer.objects.active = previous_active
+
+    return list(created_names.values())
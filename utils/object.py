@@ -3,6 +3,7 @@ from collections import defaultdict
 import os
 
 from . import addon_dependencies
+from . import scene_index
 
 
 def ensure_mode(mode: str = 'OBJECT'):
@@ -27,6 +28,10 @@ def set_visibility(obj: bpy.types.Object, visible: bool):
 
 def uses_armature(obj: bpy.types.Object, armature: bpy.types.Object) -> bool:
     """Returns True if object has constraints/modifiers that reference the armature."""
+    index = scene_index.current()
+    if index is not None:
+        return index.uses_armature(obj, armature)
+
     for constraint in obj.constraints:
         if hasattr(constraint, 'target') and constraint.target == armature:
             return True
@@ -68,6 +73,10 @@ def find_by_armature_and_material_property(
     property_value=None,
 ) -> list[bpy.types.Object] | None:
     """Finds objects driven by an armature and matching a material property filter."""
+    index = scene_index.current()
+    if index is not None:
+        return index.find_by_material_property(armature, property_name, property_value) or None
+
     objects = []
     for obj in bpy.data.objects:
         try:
@@ -0,0 +1,122 @@
+"""Armature -> object -> material index of the current file.
+
+Looking up the meshes or materials driven by an armature otherwise walks every
+object's constraints, modifiers, pose bone constraints and material slots. A
+SceneIndex does that walk once. Inside scope() the lookups in utils.object and
+utils.armature answer from the shared index instead of rescanning bpy.data;
+outside a scope they fall back to a direct scan.
+"""
+
+import bpy
+from contextlib import contextmanager
+
+_ACTIVE: list['SceneIndex'] = []
+
+
+def _targets(obj: bpy.types.Object) -> list[bpy.types.ID]:
+    """Returns every object referenced by the object's constraints and armature modifiers."""
+    targets = [constraint.target for constraint in obj.constraints if getattr(constraint, 'target', None)]
+    targets.extend(modifier.object for modifier in obj.modifiers if modifier.type == 'ARMATURE' and modifier.object)
+    if obj.type == 'ARMATURE' and obj.pose:
+        for pose_bone in obj.pose.bones:
+            targets.extend(constraint.target for constraint in pose_bone.constraints if getattr(constraint, 'target', None))
+    return targets
+
+
+class SceneIndex:
+    """Objects using each armature, meshes deformed by it and their materials, from one scan of bpy.data.objects."""
+
+    def __init__(self):
+        self._users: dict[int, list[bpy.types.Object]] = {}
+        self._deformed: dict[int, list[bpy.types.Object]] = {}
+        self._materials: dict[int, list[bpy.types.Material]] = {}
+        self._queries: dict[tuple, list[bpy.types.Object]] = {}
+
+    @classmethod
+    def build(cls) -> 'SceneIndex':
+        index = cls()
+        for obj in bpy.data.objects:
+            try:
+                index._add(obj)
+            except ReferenceError:
+                print(f"[AetherBlend] Skipping deleted object: {obj}")
+        return index
+
+    def _add(self, obj: bpy.types.Object) -> None:
+        seen: set[int] = set()
+        for target in _targets(obj):
+            pointer = target.as_pointer()
+            if pointer not in seen:
+                seen.add(pointer)
+                self._users.setdefault(pointer, []).append(obj)
+
+        if obj.type == 'MESH':
+            deformers: set[int] = set()
+            for modifier in obj.modifiers:
+                if modifier.type == 'ARMATURE' and modifier.object:
+                    pointer = modifier.object.as_pointer()
+                    if pointer not in deformers:
+                        deformers.add(pointer)
+                        self._deformed.setdefault(pointer, []).append(obj)
+
+        if obj.data is not None and hasattr(obj.data, 'materials'):
+            self._materials[obj.as_pointer()] = [slot.material for slot in obj.material_slots if slot.material]
+
+    def uses_armature(self, obj: bpy.types.Object, armature: bpy.types.Object) -> bool:
+        return any(user == obj for user in self._users.get(armature.as_pointer(), []))
+
+    def find_meshes(self, armature: bpy.types.Object) -> list[bpy.types.Object]:
+        """Mesh objects with an armature modifier using the armature."""
+        return list(self._deformed.get(armature.as_pointer(), []))
+
+    def materials(self, obj: bpy.types.Object) -> list[bpy.types.Material]:
+        return self._materials.get(obj.as_pointer(), [])
+
+    def find_by_material_property(self, armature: bpy.types.Object, property_name: str, property_value=None) -> list[bpy.types.Object]:
+        """Objects using the armature that have a material with the given custom property value."""
+        key = (armature.as_pointer(), property_name, repr(property_value))
+        objects = self._queries.get(key)
+        if objects is None:
+            objects = [
+                obj for obj in self._users.get(armature.as_pointer(), [])
+                if any(
+                    property_name in material and (property_value is None or material[property_name] == property_value)
+                    for material in self.materials(obj)
+                )
+            ]
+            self._queries[key] = objects
+        return list(objects)
+
+    def find_materials(self, armature: bpy.types.Object, property_name: str, property_value=None) -> list[tuple[bpy.types.Object, bpy.types.Material]]:
+        """(mesh, material) pairs of meshes deformed by the armature whose material has the given custom property value."""
+        pairs = (
+            (mesh, material)
+            for mesh in self._deformed.get(armature.as_pointer(), [])
+            for material in self.materials(mesh)
+            if property_name in material and (property_value is None or material[property_name] == property_value)
+        )
+        return list(dict.fromkeys(pairs))
+
+
+def current() -> SceneIndex | None:
+    """Returns the index of the innermost active scope, if any."""
+    return _ACTIVE[-1] if _ACTIVE else None
+
+
+@contextmanager
+def scope():
+    """Shares one SceneIndex with every armature/mesh/material lookup made inside the block.
+
+    Nested scopes reuse the outer index. The index is not updated while the scope is
+    active, so it should not span operations that add, delete or re-target objects.
+    """
+    if _ACTIVE:
+        yield _ACTIVE[-1]
+        return
+
+    index = SceneIndex.build()
+    _ACTIVE.append(index)
+    try:
+        yield index
+    finally:
+        _ACTIVE.pop()
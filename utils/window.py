@@ -0,0 +1,8 @@
+import bpy
+
+
+def set_cursor(cursor: str) -> None:
+    """Sets the window cursor. Does nothing when running without a window (e.g. blender -b)."""
+    window = getattr(bpy.context, "window", None)
+    if window is not None:
+        window.cursor_set(cursor)